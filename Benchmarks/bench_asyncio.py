@@ -0,0 +1,39 @@
+# Measure how many concurrent awaitable animations one event loop sustains.
+# Run from the repository root:  python Benchmarks/bench_asyncio.py
+
+import asyncio
+import time
+
+import fakemachine
+from Libraries.asyncdrivers import AsyncServo, AsyncRGBLED
+
+STEP_MS = 20
+SWEEP = 90  # degrees, one per step
+
+
+async def servo_job(servo):
+    await servo.sweepTo(SWEEP, step=1, delay=STEP_MS / 1000)
+
+
+async def rgb_job(rgb):
+    await rgb.fadeTo(255, 0, 0, speed=3)
+
+
+async def run(count):
+    jobs = []
+    for i in range(count):
+        if i % 2:
+            jobs.append(rgb_job(AsyncRGBLED(i, i, i)))
+        else:
+            jobs.append(servo_job(AsyncServo(i)))
+    start = time.ticks_ms()
+    await asyncio.gather(*jobs)
+    return time.ticks_diff(time.ticks_ms(), start)
+
+
+if __name__ == "__main__":
+    ideal = (SWEEP - 1) * STEP_MS  # first step fires immediately
+    print("Ideal duration: %d ms" % ideal)
+    for count in (1, 10, 50, 100, 250, 500, 1000):
+        took = asyncio.run(run(count))
+        print("%5d animations: %5d ms (%.0f%% of ideal)" % (count, took, 100 * ideal / took))
@@ -0,0 +1,62 @@
+# Compare the old per-write float duty maths with the lookup tables in
+# Libraries/duty.py. Run from the repository root:
+#   python Benchmarks/bench_duty.py
+
+import time
+
+import fakemachine
+from Libraries.duty import angleTable, percentTable, byteTable
+
+N = 200_000
+
+
+def servo_float(angle, min_us=500, max_us=2500):
+    us = min_us + (max_us - min_us) * angle / 180
+    return int((us / 20000) * 65535)
+
+
+def led_float(percent):
+    return int(65535 * (percent / 100))
+
+
+def rgb_float(r, g, b, commonAnode=True):
+    out = []
+    for value in (r, g, b):
+        duty = int((value / 255) * 65535)
+        out.append(65535 - duty if commonAnode else duty)
+    return out
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1e9 / N
+
+
+def main():
+    angles, percents, bytes_ = angleTable(), percentTable(), byteTable(True)
+
+    # Tables must reproduce the old results exactly
+    assert all(angles[a] == servo_float(a) for a in range(181))
+    assert all(percents[p] == led_float(p) for p in range(101))
+    assert all(bytes_[v] == rgb_float(v, 0, 0)[0] for v in range(256))
+
+    rows = (
+        ("Servo angle->duty", 6,
+         lambda: [servo_float(i % 181) for i in range(N)],
+         lambda: [angles[i % 181] for i in range(N)]),
+        ("LED percent->duty", 2,
+         lambda: [led_float(i % 101) for i in range(N)],
+         lambda: [percents[i % 101] for i in range(N)]),
+        ("RGBLED colour->3 duties", 9,
+         lambda: [rgb_float(i & 255, 255 - (i & 255), 128) for i in range(N)],
+         lambda: [(bytes_[i & 255], bytes_[255 - (i & 255)], bytes_[128]) for i in range(N)]),
+    )
+
+    print("%-26s %12s %10s %10s" % ("update", "float ops", "old ns", "LUT ns"))
+    for name, ops, old, new in rows:
+        print("%-26s %5d -> 0 %10.0f %10.0f" % (name, ops, timed(old), timed(new)))
+
+
+if __name__ == "__main__":
+    main()
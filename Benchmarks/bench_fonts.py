@@ -0,0 +1,78 @@
+# Render cost of a 4-line dashboard in 16 px text: scaling the built-in
+# font pixel by pixel every frame vs cached glyph tiles in TextFields.
+# Counts framebuf primitive calls (what costs time on the Pico) and
+# host time per frame.
+# Run from the repository root:  python Benchmarks/bench_fonts.py
+
+import time
+
+import fakemachine
+from machine import I2C
+from Libraries.OLED.ssd1306 import SSD1306_I2C
+from Libraries.OLED.fonts import ScaledFont, TextField
+
+FRAMES = 20
+SCALE = 2
+calls = [0]
+depth = [0]
+
+# Count top-level calls only (the stand-in's blit/fill_rect call pixel())
+for _name in ("pixel", "fill_rect", "blit", "text", "fill"):
+    def _counted(fn):
+        def wrapper(*args, **kwargs):
+            if not depth[0]:
+                calls[0] += 1
+            depth[0] += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                depth[0] -= 1
+        return wrapper
+    setattr(fakemachine.FrameBuffer, _name, _counted(getattr(fakemachine.FrameBuffer, _name)))
+
+
+def lines(f):
+    return ("Temp %4.1fC" % (21 + (f % 5) / 10), "Dist %3dcm" % (100 + f % 3),
+            "Servo %3d" % 90, "Up %5ds" % (f // 10))
+
+
+def naive(display, f, scratch):
+    display.fill(0)
+    for row, text in enumerate(lines(f)):
+        for n, ch in enumerate(text):
+            scratch.fill(0)
+            scratch.text(ch, 0, 0, 1)
+            for y in range(8):
+                for x in range(8):
+                    if scratch.pixel(x, y):
+                        display.fill_rect((8 * n + x) * SCALE, row * 16 + y * SCALE,
+                                          SCALE, SCALE, 1)
+
+
+def run(name, draw):
+    display = SSD1306_I2C(128, 64, I2C())
+    draw(display, -1)  # warm-up frame (fills the glyph cache)
+    calls[0] = 0
+    start = time.perf_counter()
+    for f in range(FRAMES):
+        draw(display, f)
+    took = (time.perf_counter() - start) / FRAMES
+    print("%-14s %6.0f framebuf calls/frame  %7.2f ms/frame on host" % (
+        name, calls[0] / FRAMES, took * 1000))
+
+
+if __name__ == "__main__":
+    scratch = fakemachine.FrameBuffer(bytearray(8), 8, 8, 0)
+    run("pixel scaling", lambda d, f: naive(d, f, scratch))
+
+    font = ScaledFont(SCALE)
+    fields = []
+
+    def cached(display, f):
+        if not fields:
+            fields.extend(TextField(display, 0, 16 * i, font) for i in range(4))
+        for field, text in zip(fields, lines(f)):
+            field.set(text)
+
+    run("glyph cache", cached)
+    print("glyph cache hits %d, misses %d" % (font.hits, font.misses))
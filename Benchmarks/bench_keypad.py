@@ -0,0 +1,44 @@
+# Key throughput and latency of Libraries/keypad.py against a simulated
+# 4x4 matrix. (The old Baremetal_Code/Keypad.py loop caps out at about
+# 3 keys/s because of its 20 ms + 300 ms sleeps.)
+# Run from the repository root:  python Benchmarks/bench_keypad.py
+
+import fakemachine
+from fakemachine import clock, KeyMatrix
+from Libraries.keypad import Keypad, KEY_DOWN
+
+HOLD_MS = 40
+
+
+def run(keys_per_s, total=200):
+    clock.freeze(clock.us)
+    pad = Keypad(repeat_delay=None)
+    matrix = KeyMatrix(pad.rows, pad.cols)
+    gap_us = 1_000_000 // keys_per_s
+    pressed_at = []
+
+    for i in range(total):
+        key = (i % 4, (i // 4) % 4)
+        t = clock.us + i * gap_us
+        clock.at(t, lambda key=key, t=t: (matrix.pressed.add(key), pressed_at.append(t)))
+        clock.at(t + HOLD_MS * 1000, lambda key=key: matrix.pressed.discard(key))
+
+    end = clock.us + total * gap_us + 100_000
+    latencies = []
+    while clock.us < end:
+        pad.update()
+        event = pad.queue.getEvent()
+        while event:
+            if event[0] == KEY_DOWN:
+                latencies.append(event[2] * 1000 - pressed_at[len(latencies)])
+            event = pad.queue.getEvent()
+        clock.advance(us=500)
+    return len(latencies), latencies
+
+
+if __name__ == "__main__":
+    print("%10s %10s %14s %14s" % ("keys/s", "detected", "avg latency", "max latency"))
+    for rate in (3, 10, 20, 24):
+        got, lat = run(rate)
+        print("%10d %7d/200 %11.1f ms %11.1f ms" % (
+            rate, got, sum(lat) / len(lat) / 1000, max(lat) / 1000))
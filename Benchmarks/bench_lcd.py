@@ -0,0 +1,122 @@
+# Characters per second for LCD.putstr() on a simulated PCF8574 I2C bus:
+# the original write path (four transactions per byte, gc.collect() per
+# byte) vs the batched one (one transaction per string). Then the bus
+# writes for refreshing a 20x4 status screen where one digit changes:
+# rewriting it with putstr() vs render(), which sends changed cells only.
+# Last, the cost of one Marquee step: display shift vs window rewrite.
+# Run from the repository root:  python Benchmarks/bench_lcd.py
+
+import gc
+import time
+
+import fakemachine
+from machine import I2C
+from Libraries.LiquidCrystal import LCD, MASK_RS, MASK_E, SHIFT_BACKLIGHT, SHIFT_DATA
+from Libraries.LCD.lcdmarquee import Marquee
+
+I2C_HZ = 100000   # PCF8574 backpacks are usually run at 100 kHz
+TEXT = "Temp 21.5C Dist 123cm"
+REPEATS = 200
+collects = [0]
+_collect = gc.collect
+
+
+def counted_collect():
+    collects[0] += 1
+    _collect()
+
+
+gc.collect = counted_collect
+
+
+class LegacyLCD(LCD):
+    """The write path as it was: bytes([...]) per write, gc per byte."""
+
+    def hal_write_command(self, cmd):
+        byte = ((self.backlight << SHIFT_BACKLIGHT) |
+                (((cmd >> 4) & 0x0f) << SHIFT_DATA))
+        self.i2c.writeto(self.i2c_addr, bytes([byte | MASK_E]))
+        self.i2c.writeto(self.i2c_addr, bytes([byte]))
+        byte = ((self.backlight << SHIFT_BACKLIGHT) |
+                ((cmd & 0x0f) << SHIFT_DATA))
+        self.i2c.writeto(self.i2c_addr, bytes([byte | MASK_E]))
+        self.i2c.writeto(self.i2c_addr, bytes([byte]))
+        if cmd <= 3:
+            time.sleep_ms(5)
+        gc.collect()
+
+    def hal_write_data(self, data):
+        byte = (MASK_RS |
+                (self.backlight << SHIFT_BACKLIGHT) |
+                (((data >> 4) & 0x0f) << SHIFT_DATA))
+        self.i2c.writeto(self.i2c_addr, bytes([byte | MASK_E]))
+        self.i2c.writeto(self.i2c_addr, bytes([byte]))
+        byte = (MASK_RS |
+                (self.backlight << SHIFT_BACKLIGHT) |
+                ((data & 0x0f) << SHIFT_DATA))
+        self.i2c.writeto(self.i2c_addr, bytes([byte | MASK_E]))
+        self.i2c.writeto(self.i2c_addr, bytes([byte]))
+        gc.collect()
+
+
+def run(name, cls):
+    i2c = I2C()
+    lcd = cls(i2c, 0x27, 2, 16)
+    i2c.transactions = i2c.bytes = 0
+    collects[0] = 0
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        lcd.move_to(0, 0)
+        lcd.putstr(TEXT)
+    took = time.perf_counter() - start
+    chars = REPEATS * len(TEXT)
+    # Start + address byte + stop per transaction, 9 clocks per byte
+    bus_s = (i2c.transactions * 10 + i2c.bytes * 9) / I2C_HZ
+    print("%-8s %5.1f transactions/char  %4.2f gc/char  ~%5.0f chars/s bus-limited at 100 kHz"
+          "  (host %6.0f chars/s)" % (
+              name, i2c.transactions / chars, collects[0] / chars, chars / bus_s, chars / took))
+
+
+def screen(f):
+    return ("Temp %4.1fC" % (21 + (f % 10) / 10), "Dist 123cm", "Servo  90", "Mode AUTO")
+
+
+def refresh(name, update):
+    i2c = I2C()
+    lcd = LCD(i2c, 0x27, 4, 20)
+    lcd.render(screen(-1))
+    i2c.transactions = i2c.bytes = 0
+    for f in range(REPEATS):
+        update(lcd, screen(f))
+    print("%-8s %5.1f LCD bytes/refresh  %4.1f transactions/refresh" % (
+        name, i2c.bytes / 4 / REPEATS, i2c.transactions / REPEATS))
+
+
+def rewrite(lcd, lines):
+    for y, line in enumerate(lines):
+        lcd.move_to(0, y)
+        lcd.putstr(line + " " * (20 - len(line)))
+
+
+def marquee(name, windowed):
+    i2c = I2C()
+    lcd = LCD(i2c, 0x27, 2, 16)
+    scroller = Marquee(lcd, line=1, windowed=windowed)
+    scroller.start("Distance 123 cm  Servo 90 deg")
+    i2c.transactions = i2c.bytes = 0
+    for _ in range(REPEATS):
+        scroller.tick()
+    print("%-8s %5.1f LCD bytes/step  %4.1f transactions/step" % (
+        name, i2c.bytes / 4 / REPEATS, i2c.transactions / REPEATS))
+
+
+if __name__ == "__main__":
+    fakemachine.clock.freeze()
+    run("before", LegacyLCD)
+    run("after", LCD)
+    print()
+    refresh("putstr", rewrite)
+    refresh("render", lambda lcd, lines: lcd.render(lines))
+    print()
+    marquee("shift", False)
+    marquee("window", True)
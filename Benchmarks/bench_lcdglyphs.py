@@ -0,0 +1,61 @@
+# CGRAM traffic for a bar graph drawn with 12 custom glyphs on a 16x2
+# LCD: uploading every glyph with custom_char() on each use vs the
+# GlyphManager, which keeps glyphs resident and reuses slots LRU.
+# Run from the repository root:  python Benchmarks/bench_lcdglyphs.py
+
+import fakemachine
+from machine import I2C
+from Libraries.LiquidCrystal import LCD
+from Libraries.LCD.lcdglyphs import GlyphManager
+
+FRAMES = 200
+LEVELS = 12
+
+
+def bars(f):
+    # Four bars whose levels drift slowly, as a level meter does
+    return [(f // 7 + 3 * b) % LEVELS for b in range(4)]
+
+
+def setup():
+    i2c = I2C()
+    hd = fakemachine.HD44780(2, 16)
+    i2c.attach(0x27, hd)
+    return i2c, hd, LCD(i2c, 0x27, 2, 16)
+
+
+def glyph(level):
+    rows = [0] * 8
+    for r in range(8):
+        rows[r] = 0x1f if 8 - r <= level * 8 // LEVELS else 0
+    return rows
+
+
+def naive():
+    i2c, hd, lcd = setup()
+    i2c.transactions = i2c.bytes = 0
+    for f in range(FRAMES):
+        for b, level in enumerate(bars(f)):
+            lcd.custom_char(b, glyph(level))
+        lcd.write_at(0, 1, "".join(chr(b) for b in range(4)))
+    print("%-14s %6.1f LCD bytes/frame  %4.1f transactions/frame" % (
+        "custom_char", i2c.bytes / 4 / FRAMES, i2c.transactions / FRAMES))
+
+
+def managed():
+    i2c, hd, lcd = setup()
+    glyphs = GlyphManager(lcd)
+    for level in range(LEVELS):
+        glyphs.define("l%d" % level, glyph(level))
+    i2c.transactions = i2c.bytes = 0
+    for f in range(FRAMES):
+        glyphs.write_at(0, 1, "".join("{l%d}" % level for level in bars(f)))
+    print("%-14s %6.1f LCD bytes/frame  %4.1f transactions/frame  hit rate %.0f%%" % (
+        "GlyphManager", i2c.bytes / 4 / FRAMES, i2c.transactions / FRAMES,
+        100 * glyphs.hitRate()))
+
+
+if __name__ == "__main__":
+    fakemachine.clock.freeze()
+    naive()
+    managed()
@@ -0,0 +1,49 @@
+# Main-loop stalls caused by the LCD: direct writes (inline sleeps in the
+# constructor and after clear/home) vs queued mode drained by tick().
+# A 1 kHz loop refreshes a status line every 50 ms and clears the
+# screen once a second. Uses the simulated clock, so sleeps count as
+# stall time.
+# Run from the repository root:  python Benchmarks/bench_lcdqueue.py
+
+import time
+
+import fakemachine
+from machine import I2C
+from Libraries.LiquidCrystal import LCD
+
+LOOP_MS = 1000 * 5   # simulated run time
+
+
+def run(name, queued):
+    fakemachine.clock.freeze()
+    i2c = I2C()
+    hd = fakemachine.HD44780(2, 16)
+    i2c.attach(0x27, hd)
+
+    t0 = time.ticks_us()
+    lcd = LCD(i2c, 0x27, 2, 16, queued=queued)
+    ctor = time.ticks_diff(time.ticks_us(), t0)
+    worst = 0
+
+    for ms in range(LOOP_MS):
+        t0 = time.ticks_us()
+        if ms % 1000 == 0:
+            lcd.clear()
+        if ms % 50 == 0:
+            lcd.write_at(0, 0, "t=%5d ms" % ms)
+        if queued:
+            lcd.tick()
+        stall = time.ticks_diff(time.ticks_us(), t0)
+        worst = max(worst, stall)
+        fakemachine.clock.advance(ms=1)
+
+    line = "%-7s constructor %6d us  longest loop stall %6d us  timing violations %d" % (
+        name, ctor, worst, hd.violations)
+    print(line)
+    if queued:
+        print("        %s" % lcd.queue_stats())
+
+
+if __name__ == "__main__":
+    run("direct", False)
+    run("queued", True)
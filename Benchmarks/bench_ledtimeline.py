@@ -0,0 +1,41 @@
+# Cost per frame of animating many LEDs: LED.fade() stepping versus
+# compiled timelines played by one LEDAnimator.
+# Run from the repository root:  python Benchmarks/bench_ledtimeline.py
+
+import time
+
+import fakemachine
+from Libraries.led import LED
+from Libraries.ledtimeline import LEDAnimator, breathe, heartbeat, strobe
+
+FRAMES = 2000
+
+
+def fades(n):
+    leds = [LED(i) for i in range(n)]
+    for led in leds:
+        led.fade(0, 100, 2, 0.02)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        for led in leds:
+            led.tick()
+    return (time.perf_counter() - start) * 1e6 / FRAMES
+
+
+def animator(n):
+    patterns = (breathe(), heartbeat(), strobe())
+    anim = LEDAnimator()
+    for i in range(n):
+        anim.add(LED(i), patterns[i % 3], offset_ms=i * 100)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        fakemachine.clock.advance(ms=20)
+        anim.tick()
+    return (time.perf_counter() - start) * 1e6 / FRAMES
+
+
+if __name__ == "__main__":
+    fakemachine.clock.freeze()
+    print("%6s %14s %14s" % ("LEDs", "fade() us", "animator us"))
+    for n in (1, 4, 16, 32):
+        print("%6d %14.1f %14.1f" % (n, fades(n), animator(n)))
@@ -0,0 +1,74 @@
+# Bytes, bus transactions and estimated bus time per SSD1306 show() for
+# the tempOLED.py loop (clear, header, temperature line), and the
+# longest bus stall per call for blocking show() vs chunked show_async().
+# Run from the repository root:  python Benchmarks/bench_oled.py
+
+import fakemachine
+from machine import I2C, SPI, Pin
+from Libraries.OLED.ssd1306 import SSD1306_I2C, SSD1306_SPI
+
+FRAMES = 50
+I2C_HZ = 400000
+
+
+def bus_ms(nbytes, transactions):
+    # 9 clocks per byte (8 data + ACK) plus the address byte per transaction
+    return (nbytes + transactions) * 9 * 1000 / I2C_HZ
+
+
+def frame(display, f):
+    display.fill(0)
+    display.text('Example 1:', 0, 0)
+    display.text("Temperature:%.1f" % (21.0 + (f % 7) / 10), 0, 14)
+
+
+def run(name, display, full):
+    start_bytes, start_tr = display.tx_bytes, display.transactions
+    for f in range(FRAMES):
+        frame(display, f)
+        display.show(full=full)
+    nbytes = (display.tx_bytes - start_bytes) / FRAMES
+    tr = (display.transactions - start_tr) / FRAMES
+    line = "%-20s %7.1f B/show  %5.1f transactions/show" % (name, nbytes, tr)
+    if isinstance(display, SSD1306_I2C):
+        line += "  ~%5.2f ms/show at 400 kHz" % bus_ms(nbytes, tr)
+    print(line)
+
+
+def stall(name, display, send):
+    # Worst case: every pixel changes every frame
+    worst = 0
+    for f in range(FRAMES):
+        display.fill(f & 1)
+        for before in send(display):
+            worst = max(worst, bus_ms(display.tx_bytes - before[0], display.transactions - before[1]))
+    print("%-20s longest stall ~%5.2f ms per call" % (name, worst))
+
+
+def blocking(display):
+    before = (display.tx_bytes, display.transactions)
+    display.show()
+    yield before
+
+
+def chunked(display):
+    display.show_async()
+    while display.sending:
+        before = (display.tx_bytes, display.transactions)
+        display.tick()
+        yield before
+
+
+if __name__ == "__main__":
+    run("I2C full refresh", SSD1306_I2C(128, 64, I2C()), True)
+    run("I2C partial refresh", SSD1306_I2C(128, 64, I2C()), False)
+    spi = SPI()
+    display = SSD1306_SPI(128, 64, spi, Pin(1), Pin(2), Pin(3))
+    run("SPI partial refresh", display, False)
+    print("SPI reconfigurations: %d" % spi.inits)
+
+    stall("I2C show()", SSD1306_I2C(128, 64, I2C()), blocking)
+    for chunk in (128, 32):
+        display = SSD1306_I2C(128, 64, I2C())
+        display.set_async(chunk=chunk)
+        stall("I2C chunk=%d" % chunk, display, chunked)
@@ -0,0 +1,67 @@
+# Compare polling every driver's update() against the deadline Scheduler.
+# Run from the repository root:  python Benchmarks/bench_scheduler.py
+
+import time
+
+import fakemachine
+from Libraries.led import LED
+from Libraries.servo import Servo
+from Libraries.scheduler import Scheduler
+
+RUN_MS = 2000
+DEVICES = 12
+
+
+def make_devices():
+    devices = []
+    for i in range(DEVICES):
+        if i % 2:
+            servo = Servo(i)
+            servo.oscillate(30, 150, step=3, delay=0.03)
+            devices.append(servo)
+        else:
+            led = LED(i)
+            led.blink(delay=0.3)
+            devices.append(led)
+    return devices
+
+
+def polled():
+    devices = make_devices()
+    calls = 0
+    start = time.ticks_ms()
+    while time.ticks_diff(time.ticks_ms(), start) < RUN_MS:
+        for d in devices:
+            d.update()
+            calls += 1
+    return calls
+
+
+def scheduled():
+    devices = make_devices()
+    sched = Scheduler()
+    for d in devices:
+        sched.register(d)
+    passes = 0
+    start = time.ticks_ms()
+    while time.ticks_diff(time.ticks_ms(), start) < RUN_MS:
+        wait = sched.runOnce()
+        passes += 1
+        if wait:
+            time.sleep_ms(wait)
+    return passes, sched
+
+
+if __name__ == "__main__":
+    print("Polling %d devices for %d ms..." % (DEVICES, RUN_MS))
+    calls = polled()
+    print("  update() calls: %d (CPU busy the whole time)" % calls)
+
+    passes, sched = scheduled()
+    fired = sum(t.fired for t in sched.tasks)
+    print("Scheduler:")
+    print("  runOnce() passes: %d, device ticks: %d" % (passes, fired))
+    for task in sched.tasks:
+        print("  %-28s fired=%4d avg_late=%.2fms max_late=%dms" % (
+            type(task.callback.__self__).__name__, task.fired,
+            task.avgLate(), task.max_late_ms))
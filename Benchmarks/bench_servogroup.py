@@ -0,0 +1,34 @@
+# Per-tick cost of a ServoGroup versus updating Servo objects one by one.
+# Run from the repository root:  python Benchmarks/bench_servogroup.py
+
+import time
+
+import fakemachine
+from Libraries.servo import Servo, ServoGroup
+
+TICKS = 2000
+
+
+def individual(n):
+    servos = [Servo(i) for i in range(n)]
+    for s in servos:
+        s.moveTo(180, 100)
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        for s in servos:
+            s.tick()
+    return (time.perf_counter() - start) * 1e6 / TICKS
+
+
+def grouped(n):
+    group = ServoGroup([Servo(i) for i in range(n)])
+    group.moveTo([180] * n, duration=100)
+    for _ in range(TICKS):
+        group.tick()
+    return group.stats()['avg_us']
+
+
+if __name__ == "__main__":
+    print("%8s %16s %16s" % ("servos", "individual us", "group us"))
+    for n in (1, 2, 4, 8, 12, 16):
+        print("%8d %16.1f %16.1f" % (n, individual(n), grouped(n)))
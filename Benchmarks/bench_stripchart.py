@@ -0,0 +1,55 @@
+# Bus traffic per sample for a scrolling chart on a 128x64 SSD1306:
+# redraw (scroll the framebuffer, draw, show()) vs StripChart, which
+# redraws one row and moves the display start line.
+# Run from the repository root:  python Benchmarks/bench_stripchart.py
+
+import math
+
+import fakemachine
+from machine import I2C
+from Libraries.OLED.ssd1306 import SSD1306_I2C
+from Libraries.OLED.stripchart import StripChart
+
+SAMPLES = 200
+I2C_HZ = 400000
+
+
+def sample(k):
+    return math.sin(k / 9) * 40 + 50
+
+
+def report(name, nbytes, transactions):
+    per_b = nbytes / SAMPLES
+    per_t = transactions / SAMPLES
+    # 9 clocks per byte plus the address byte of each transaction
+    ms = (per_b + per_t) * 9 * 1000 / I2C_HZ
+    print("%-10s %7.1f B/sample  %4.1f transactions/sample  ~%6.0f samples/s at 400 kHz" % (
+        name, per_b, per_t, 1000 / ms))
+
+
+def redraw():
+    display = SSD1306_I2C(128, 64, I2C())
+    b0, t0 = display.tx_bytes, display.transactions
+    last = 0
+    for k in range(SAMPLES):
+        x = int(sample(k) * 1.27)
+        display.scroll(0, -1)
+        display.hline(0, 63, 128, 0)
+        display.hline(min(last, x), 63, abs(x - last) + 1, 1)
+        last = x
+        display.show()
+    report("redraw", display.tx_bytes - b0, display.transactions - t0)
+
+
+def strip():
+    display = SSD1306_I2C(128, 64, I2C())
+    chart = StripChart(display, 0, 100)
+    t0 = display.transactions
+    for k in range(SAMPLES):
+        chart.push(sample(k))
+    report("StripChart", chart.tx_bytes, display.transactions - t0)
+
+
+if __name__ == "__main__":
+    redraw()
+    strip()
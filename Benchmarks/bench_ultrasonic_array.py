@@ -0,0 +1,39 @@
+# Total readings per second from several HC-SR04s: naive one-at-a-time
+# ranging versus UltrasonicArray's planned, adaptive trigger slots.
+# Run from the repository root:  python Benchmarks/bench_ultrasonic_array.py
+
+import fakemachine
+from fakemachine import clock, EchoTarget
+from Libraries.ultrasonic import UltrasonicSensor, UltrasonicArray
+
+HEADINGS = (0, 45, 90, 135, 180, 225, 270, 315)
+DISTANCES = (30, 80, 250, 40, 120, 60, None, 200)
+RUN_MS = 2000
+LOOP_US = 200
+
+
+def run(planned):
+    clock.freeze(clock.us)
+    sensors = []
+    for i in range(len(HEADINGS)):
+        s = UltrasonicSensor(trig=2 * i, echo=2 * i + 1, irq=True)
+        EchoTarget(s.trig, s.echo, DISTANCES[i])
+        sensors.append(s)
+    if planned:
+        array = UltrasonicArray(sensors, HEADINGS, spread=60)
+    else:
+        array = UltrasonicArray(sensors, None, margin=None)
+    end = clock.us + RUN_MS * 1000
+    while clock.us < end:
+        array.update()
+        clock.advance(us=LOOP_US)
+    return array
+
+
+if __name__ == "__main__":
+    for planned in (False, True):
+        array = run(planned)
+        per, total = array.rates()
+        print("%s: %d slots" % ("planned" if planned else "naive", len(array.slots)))
+        print("  per sensor /s:", " ".join("%5.1f" % r for r in per))
+        print("  total /s: %.1f" % total)
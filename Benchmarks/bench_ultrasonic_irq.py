@@ -0,0 +1,34 @@
+# Worst-case update() time of UltrasonicSensor: blocking time_pulse_us()
+# versus interrupt-driven echo capture, against a simulated HC-SR04.
+# Run from the repository root:  python Benchmarks/bench_ultrasonic_irq.py
+
+import fakemachine
+from fakemachine import clock, EchoTarget
+from Libraries.ultrasonic import UltrasonicSensor
+
+LOOP_US = 500      # one main-loop pass every 0.5 ms
+RUN_MS = 1000
+DISTANCES = (20, 150, 380, None)  # None = nothing in range
+
+
+def run(irq, distance):
+    clock.freeze(clock.us)
+    sensor = UltrasonicSensor(trig=17, echo=16, irq=irq)
+    target = EchoTarget(sensor.trig, sensor.echo, distance)
+    worst = 0
+    end = clock.us + RUN_MS * 1000
+    while clock.us < end:
+        t0 = clock.us
+        sensor.update()
+        worst = max(worst, clock.us - t0)
+        clock.advance(us=LOOP_US)
+    return worst, sensor.distCm(), target.pings
+
+
+if __name__ == "__main__":
+    print("%10s %8s %14s %12s" % ("target cm", "mode", "worst update", "last cm"))
+    for distance in DISTANCES:
+        for irq in (False, True):
+            worst, last, pings = run(irq, distance)
+            print("%10s %8s %11d us %12.1f" % (
+                distance, "irq" if irq else "blocking", worst, last))
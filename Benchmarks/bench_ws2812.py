@@ -0,0 +1,45 @@
+# Frame rate of WS2812Strip for a 300-pixel strip: per-pixel updates,
+# bulk fills, fades and unchanged frames (skipped by dirty tracking).
+# Run from the repository root:  python Benchmarks/bench_ws2812.py
+
+import time
+import tracemalloc
+
+import fakemachine
+from Libraries.ws2812 import WS2812Strip, RecordingBackend
+
+PIXELS = 300
+FRAMES = 300
+
+
+def timed(name, strip, frame):
+    backend = strip.backend
+    sent = backend.frames
+    tracemalloc.start()
+    start = time.perf_counter()
+    for f in range(FRAMES):
+        frame(f)
+        strip.show()
+    took = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print("%-22s %8.0f fps  frames sent %4d  peak alloc %6d B" % (
+        name, FRAMES / took, backend.frames - sent, peak))
+
+
+if __name__ == "__main__":
+    strip = WS2812Strip(PIXELS, RecordingBackend())
+
+    def chase(f):
+        for i in range(PIXELS):
+            v = (i + f) & 255
+            strip.setColour(i, v, 255 - v, 64)
+
+    timed("per-pixel chase", strip, chase)
+    timed("bulk fill", strip, lambda f: strip.fill(f & 255, 0, 128))
+    timed("range fill", strip, lambda f: strip.setRange(f % PIXELS, PIXELS, 0, 255, 0))
+    timed("unchanged frame", strip, lambda f: None)
+
+    strip.fill(0, 0, 0)
+    strip.fadeRange(0, PIXELS, 255, 128, 0, speed=1)
+    timed("fade step", strip, lambda f: strip.tick())
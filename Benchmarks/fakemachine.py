@@ -0,0 +1,509 @@
+# Host-side stand-in for MicroPython's `machine` and `time` extras.
+# Importing this module lets the unmodified Libraries run under CPython
+# so their timing and call counts can be benchmarked on Linux/Windows.
+
+import heapq
+import os
+import sys
+import time
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+TICKS_PERIOD = 1 << 30  # MicroPython ticks wrap at 2^30
+
+
+class Clock:
+    """
+    Millisecond/microsecond tick source.
+    Runs on real time by default; call freeze() to drive it manually
+    with advance() for deterministic benchmarks.
+    """
+
+    def __init__(self):
+        self.frozen = False
+        self.us = 0
+        self._start = time.perf_counter()
+        self._events = []
+        self._seq = 0
+
+    def freeze(self, start_us=0):
+        self.frozen = True
+        self.us = start_us
+
+    def at(self, us, fn):
+        """Run fn() when a frozen clock reaches `us`."""
+        self._seq += 1
+        heapq.heappush(self._events, (us, self._seq, fn))
+
+    def step_until(self, limit_us):
+        """
+        Jump to the next scripted event if it is due by limit_us and fire
+        it (returns True), otherwise jump to limit_us (returns False).
+        """
+        if self._events and self._events[0][0] <= limit_us:
+            us, _, fn = heapq.heappop(self._events)
+            self.us = max(self.us, us)
+            fn()
+            return True
+        self.us = max(self.us, limit_us)
+        return False
+
+    def advance(self, ms=0, us=0):
+        target = self.us + ms * 1000 + us
+        while self.step_until(target):
+            pass
+
+    def now_us(self):
+        if self.frozen:
+            return self.us
+        return int((time.perf_counter() - self._start) * 1_000_000)
+
+
+clock = Clock()
+
+
+def ticks_ms():
+    return (clock.now_us() // 1000) % TICKS_PERIOD
+
+
+def ticks_us():
+    return clock.now_us() % TICKS_PERIOD
+
+
+def ticks_diff(a, b):
+    return ((a - b + TICKS_PERIOD // 2) % TICKS_PERIOD) - TICKS_PERIOD // 2
+
+
+def ticks_add(a, delta):
+    return (a + delta) % TICKS_PERIOD
+
+
+def sleep_ms(ms):
+    if clock.frozen:
+        clock.advance(ms=ms)
+    else:
+        time.sleep(ms / 1000)
+
+
+def sleep_us(us):
+    if clock.frozen:
+        clock.advance(us=us)
+    else:
+        time.sleep(us / 1_000_000)
+
+
+for _name in ("ticks_ms", "ticks_us", "ticks_diff", "ticks_add", "sleep_ms", "sleep_us"):
+    setattr(time, _name, globals()[_name])
+
+
+# ------------------- machine stand-ins -------------------
+
+class Pin:
+    IN = 0
+    OUT = 1
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_RISING = 1
+    IRQ_FALLING = 2
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.id = id
+        self.mode = mode
+        self._value = value or 0
+        self.writes = 0
+        self.handler = None
+        self.trigger = 0
+        self.on_write = None
+        self.source = None  # Callable giving the input level (see KeyMatrix)
+
+    def init(self, mode=-1, pull=-1, value=None):
+        self.mode = mode
+        if value is not None:
+            self._value = value
+
+    def value(self, v=None):
+        if v is None:
+            return self.source() if self.source else self._value
+        self._value = 1 if v else 0
+        self.writes += 1
+        if self.on_write:
+            self.on_write(self._value)
+
+    def __call__(self, v=None):
+        return self.value(v)
+
+    def on(self):
+        self.value(1)
+
+    def off(self):
+        self.value(0)
+
+    high = on
+    low = off
+
+    def irq(self, handler=None, trigger=3):
+        self.handler = handler
+        self.trigger = trigger
+
+    def drive(self, v):
+        """Set the input level from outside and fire a matching IRQ."""
+        v = 1 if v else 0
+        if v == self._value:
+            return
+        self._value = v
+        edge = self.IRQ_RISING if v else self.IRQ_FALLING
+        if self.handler and self.trigger & edge:
+            self.handler(self)
+
+
+class PWM:
+    def __init__(self, pin, freq=None, duty_u16=None):
+        self.pin = pin
+        self._freq = freq or 0
+        self._duty = duty_u16 or 0
+        self.writes = 0
+
+    def freq(self, f=None):
+        if f is None:
+            return self._freq
+        self._freq = f
+
+    def duty_u16(self, d=None):
+        if d is None:
+            return self._duty
+        if not 0 <= d <= 65535:
+            raise ValueError("duty out of range")
+        self._duty = d
+        self.writes += 1
+
+    def deinit(self):
+        pass
+
+
+class I2C:
+    """Records every transaction instead of talking to a bus."""
+
+    def __init__(self, id=0, scl=None, sda=None, freq=400000):
+        self.freq = freq
+        self.transactions = 0
+        self.bytes = 0
+        self.log = []
+        self.devices = {}
+
+    def attach(self, addr, device):
+        """Pass every write to `addr` on to device.write(data)."""
+        self.devices[addr] = device
+
+    def writeto(self, addr, buf, stop=True):
+        self.transactions += 1
+        self.bytes += len(buf)
+        data = bytes(buf)
+        self.log.append(data)
+        if addr in self.devices:
+            self.devices[addr].write(data)
+        return 1
+
+    def writevto(self, addr, bufs, stop=True):
+        self.transactions += 1
+        data = b"".join(bytes(b) for b in bufs)
+        self.bytes += len(data)
+        self.log.append(data)
+        if addr in self.devices:
+            self.devices[addr].write(data)
+        return 1
+
+    def scan(self):
+        return [0x27, 0x3C]
+
+
+class SPI:
+    def __init__(self, id=0, baudrate=1000000, polarity=0, phase=0):
+        self.inits = 0
+        self.transactions = 0
+        self.bytes = 0
+
+    def init(self, baudrate=1000000, polarity=0, phase=0):
+        self.inits += 1
+
+    def write(self, buf):
+        self.transactions += 1
+        self.bytes += len(buf)
+
+
+def time_pulse_us(pin, level, timeout_us):
+    """
+    Measure a pulse on `pin`. With a frozen clock, scripted events (see
+    EchoTarget) are replayed; on the real clock it always times out.
+    """
+    if not clock.frozen:
+        sleep_us(timeout_us)
+        return -2
+    start = clock.now_us()
+    while pin.value() != level:
+        if not clock.step_until(start + timeout_us):
+            return -2
+    t0 = clock.now_us()
+    while pin.value() == level:
+        if not clock.step_until(t0 + timeout_us):
+            return -1
+    return clock.now_us() - t0
+
+
+class EchoTarget:
+    """
+    Simulated HC-SR04 target. Each falling edge on `trig` schedules a
+    rising and falling edge on `echo` matching `distance_cm` (None = no
+    echo). Needs a frozen clock.
+    """
+
+    SETUP_US = 200  # trigger to echo start, as on real modules
+
+    def __init__(self, trig, echo, distance_cm=100):
+        self.echo = echo
+        self.distance_cm = distance_cm
+        self.pings = 0
+        self._last = 0
+        trig.on_write = self._trig
+
+    def _trig(self, v):
+        if self._last and not v and self.distance_cm is not None:
+            self.pings += 1
+            rise = clock.now_us() + self.SETUP_US
+            width = int(self.distance_cm * 2 / 0.0343)
+            clock.at(rise, lambda: self.echo.drive(1))
+            clock.at(rise + width, lambda: self.echo.drive(0))
+        self._last = v
+
+
+class KeyMatrix:
+    """
+    Simulated key matrix: a column reads high while its row is driven
+    high and a key at that crossing is held in `pressed`.
+    """
+
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.pressed = set()   # (row, col) pairs
+        for c, pin in enumerate(cols):
+            pin.source = self._reader(c)
+
+    def _reader(self, c):
+        def read():
+            for r, row in enumerate(self.rows):
+                if row._value and (r, c) in self.pressed:
+                    return 1
+            return 0
+        return read
+
+
+class HD44780:
+    """
+    Simulated HD44780 behind a PCF8574 backpack (see I2C.attach()).
+    Decodes the E strobes into commands and data, keeps DDRAM, CGRAM,
+    the address counter and display shift, and counts commands that
+    arrive while a clear/home is still executing (needs a frozen clock).
+    """
+
+    CLEAR_US = 1520
+
+    def __init__(self, lines=2, columns=16):
+        self.lines = lines
+        self.columns = columns
+        self.ddram = bytearray(b' ' * 0x68)
+        self.cgram = bytearray(64)
+        self.addr = 0
+        self.cg = False          # address counter points into CGRAM
+        self.shift = 0           # display shift (columns)
+        self.four_bit = False
+        self.pending = None      # high nibble waiting for its low half
+        self.last = 0
+        self.busy_until = 0
+        self.commands = 0
+        self.data = 0
+        self.violations = 0
+
+    def write(self, data):
+        for b in data:
+            if self.last & 0x04 and not b & 0x04:    # E falling edge
+                self._nibble(b >> 4, b & 0x01)
+            self.last = b
+
+    def _nibble(self, n, rs):
+        if not self.four_bit:
+            if not rs and n == 0x2:
+                self.four_bit = True
+            return
+        if self.pending is None:
+            self.pending = n
+            return
+        value = (self.pending << 4) | n
+        self.pending = None
+        if clock.now_us() < self.busy_until:
+            self.violations += 1
+        if rs:
+            self._data(value)
+        else:
+            self._command(value)
+
+    def _step(self):
+        if self.cg:
+            self.addr = (self.addr + 1) & 0x3f
+            return
+        self.addr += 1
+        if self.addr == 0x28:
+            self.addr = 0x40
+        elif self.addr == 0x68:
+            self.addr = 0
+
+    def _data(self, value):
+        self.data += 1
+        if self.cg:
+            self.cgram[self.addr] = value
+        else:
+            self.ddram[self.addr] = value
+        self._step()
+
+    def _command(self, cmd):
+        self.commands += 1
+        if cmd & 0x80:
+            self.addr = cmd & 0x7f
+            self.cg = False
+        elif cmd & 0x40:
+            self.addr = cmd & 0x3f
+            self.cg = True
+        elif cmd & 0x10:
+            step = 1 if cmd & 0x04 else -1
+            if cmd & 0x08:
+                # Shifting the display left shows later DDRAM columns
+                self.shift = (self.shift - step) % 40
+            else:
+                self.addr = max(0, self.addr + step)
+        elif cmd == 0x01:
+            self.ddram[:] = b' ' * len(self.ddram)
+            self.addr = 0
+            self.cg = False
+            self.shift = 0
+            self.busy_until = clock.now_us() + self.CLEAR_US
+        elif cmd in (0x02, 0x03):
+            self.addr = 0
+            self.cg = False
+            self.shift = 0
+            self.busy_until = clock.now_us() + self.CLEAR_US
+
+    def text(self):
+        """Visible characters, one string per line."""
+        out = []
+        for y in range(self.lines):
+            base = (0x40 if y & 1 else 0) + (self.columns if y & 2 else 0)
+            out.append("".join(
+                chr(self.ddram[(base & 0x40) + ((base & 0x3f) + x + self.shift) % 40])
+                for x in range(self.columns)))
+        return out
+
+
+def disable_irq():
+    return 0
+
+
+def enable_irq(state):
+    pass
+
+
+machine = types.ModuleType("machine")
+for _name in ("Pin", "PWM", "I2C", "SPI", "time_pulse_us", "disable_irq", "enable_irq"):
+    setattr(machine, _name, globals()[_name])
+sys.modules["machine"] = machine
+sys.modules["utime"] = time
+
+# ------------------- framebuf stand-in -------------------
+# Pure-Python MONO_VLSB FrameBuffer: enough of the API for the SSD1306
+# driver and its benchmarks. text() draws a deterministic 8x8 pattern
+# per character rather than a real font.
+
+class FrameBuffer:
+    def __init__(self, buffer, width, height, format, stride=None):
+        self.buf = buffer
+        self.width = width
+        self.height = height
+        self.format = format
+        self.stride = stride or width
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        i = (y >> 3) * self.stride + x
+        bit = 1 << (y & 7)
+        if c is None:
+            return 1 if self.buf[i] & bit else 0
+        if c:
+            self.buf[i] |= bit
+        else:
+            self.buf[i] &= ~bit & 0xFF
+
+    def fill(self, c):
+        v = 0xFF if c else 0
+        for i in range((self.height + 7) // 8 * self.stride):
+            self.buf[i] = v
+
+    def fill_rect(self, x, y, w, h, c):
+        for yy in range(max(0, y), min(self.height, y + h)):
+            for xx in range(max(0, x), min(self.width, x + w)):
+                self.pixel(xx, yy, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            return self.fill_rect(x, y, w, h, c)
+        self.hline(x, y, w, c)
+        self.hline(x, y + h - 1, w, c)
+        self.vline(x, y, h, c)
+        self.vline(x + w - 1, y, h, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def line(self, x0, y0, x1, y1, c):
+        steps = max(abs(x1 - x0), abs(y1 - y0), 1)
+        for i in range(steps + 1):
+            self.pixel(x0 + (x1 - x0) * i // steps, y0 + (y1 - y0) * i // steps, c)
+
+    def text(self, s, x, y, c=1):
+        for n, ch in enumerate(s):
+            code = ord(ch)
+            for col in range(8):
+                bits = ((code * 37 + col * 11) & 0x7E) if ch != " " else 0
+                for row in range(8):
+                    if bits & (1 << row):
+                        self.pixel(x + 8 * n + col, y + row, c)
+
+    def scroll(self, dx, dy):
+        old = [[self.pixel(x, y) for x in range(self.width)] for y in range(self.height)]
+        for y in range(self.height):
+            for x in range(self.width):
+                sx, sy = x - dx, y - dy
+                if 0 <= sx < self.width and 0 <= sy < self.height:
+                    self.pixel(x, y, old[sy][sx])
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        for yy in range(fbuf.height):
+            for xx in range(fbuf.width):
+                c = fbuf.pixel(xx, yy)
+                if c != key:
+                    self.pixel(x + xx, y + yy, c)
+
+
+framebuf = types.ModuleType("framebuf")
+framebuf.FrameBuffer = FrameBuffer
+framebuf.MONO_VLSB = 0
+framebuf.MONO_HLSB = 3
+framebuf.MONO_HMSB = 4
+sys.modules["framebuf"] = framebuf
+
+micropython = types.ModuleType("micropython")
+micropython.const = lambda x: x
+sys.modules["micropython"] = micropython
@@ -0,0 +1,27 @@
+from Libraries.asyncdrivers import AsyncServo, AsyncRGBLED, AsyncUltrasonicSensor
+import asyncio
+
+servo = AsyncServo(15)
+rgb = AsyncRGBLED(18, 19, 20)
+ultsSensor = AsyncUltrasonicSensor(trig=17, echo=16, irq=True)
+
+async def sweepForever():
+    while True:
+        await servo.sweepTo(180, step=2, delay=0.02)
+        await servo.sweepTo(0, step=2, delay=0.02)
+
+async def colourCycle():
+    while True:
+        await rgb.fadeTo(255, 0, 0)
+        await rgb.fadeTo(0, 0, 255)
+
+async def watchDistance():
+    async for d in ultsSensor.readings():
+        print("Distance:", d, "cm")
+
+async def main():
+    asyncio.create_task(sweepForever())
+    asyncio.create_task(colourCycle())
+    await watchDistance()
+
+asyncio.run(main())
@@ -0,0 +1,23 @@
+import time
+from Libraries.pushbutton import ButtonGroup, EVENT_NAMES, LONG_PRESS, DOUBLE_CLICK
+from Libraries.led import LED
+
+buttons = ButtonGroup()
+buttons.add(16)          # Button 0 on GPIO16
+buttons.add(17)          # Button 1 on GPIO17
+led = LED("LED")         # Onboard LED
+
+while True:
+    buttons.update()     # Only needed for long-press detection
+
+    event = buttons.getEvent()
+    while event:
+        kind, button, t = event
+        print("Button", button, EVENT_NAMES[kind], "at", t)
+        if kind == DOUBLE_CLICK:
+            led.on()
+        elif kind == LONG_PRESS:
+            led.off()
+        event = buttons.getEvent()
+
+    time.sleep(0.01)
@@ -0,0 +1,23 @@
+from Libraries.keypad import Keypad, KEY_DOWN, KEY_UP, KEY_REPEAT
+import time
+
+# Same wiring as Baremetal_Code/Keypad.py
+keypad = Keypad(row_pins=(6, 7, 8, 9), col_pins=(5, 4, 3, 2))
+
+print("Ready. Press a key...")
+
+while True:
+    keypad.update()   # Scans one row per call, never sleeps
+
+    event = keypad.getEvent()
+    while event:
+        kind, key, t = event
+        if kind == KEY_DOWN:
+            print("Key pressed:", key)
+        elif kind == KEY_REPEAT:
+            print("Key repeat:", key)
+        elif kind == KEY_UP:
+            print("Key released:", key)
+        event = keypad.getEvent()
+
+    time.sleep_ms(1)
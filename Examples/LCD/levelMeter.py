@@ -0,0 +1,21 @@
+from machine import I2C, Pin, ADC
+from Libraries.LiquidCrystal import LCD
+from Libraries.LCD.lcdglyphs import GlyphManager
+import time
+
+# A vertical level meter with 9 bar heights. Only 8 custom characters
+# fit in the LCD, so the GlyphManager swaps them in as needed.
+i2c = I2C(0, scl=Pin(17), sda=Pin(16), freq=400000)
+lcd = LCD(i2c, 0x27, num_lines=2, num_columns=16)
+glyphs = GlyphManager(lcd)
+mic = ADC(26)
+
+for level in range(9):
+    glyphs.define("bar%d" % level, [0x1f if 8 - row <= level else 0 for row in range(8)])
+
+history = [0] * 16
+while True:
+    history.pop(0)
+    history.append(mic.read_u16() * 8 // 65535)
+    glyphs.render(("Level meter", "".join("{bar%d}" % h for h in history[-8:])))
+    time.sleep_ms(50)
@@ -0,0 +1,18 @@
+from machine import I2C, Pin
+from Libraries.LiquidCrystal import LCD
+from Libraries.LCD.lcdmarquee import Marquee
+from Libraries.led import LED
+
+# A scrolling message while an LED keeps blinking: the marquee steps
+# without blocking, one LCD command byte per step.
+i2c = I2C(0, scl=Pin(17), sda=Pin(16), freq=400000)
+lcd = LCD(i2c, 0x27, num_lines=2, num_columns=16)
+led = LED(21)
+
+news = Marquee(lcd, line=0, step_ms=250)
+news.start("Welcome! Pico dashboard running...")
+led.blink(delay=0.5)
+
+while True:
+    news.update()
+    led.update()
@@ -0,0 +1,25 @@
+from machine import I2C, Pin
+from Libraries.LiquidCrystal import LCD
+from Libraries.servo import Servo
+from Libraries.scheduler import Scheduler
+
+# LCD writes are queued and sent by the scheduler when the controller is
+# ready, so clear() and start-up never hold up the servo.
+i2c = I2C(0, scl=Pin(17), sda=Pin(16), freq=400000)
+lcd = LCD(i2c, 0x27, num_lines=2, num_columns=16, queued=True)
+servo = Servo(15)
+
+scheduler = Scheduler()
+scheduler.register(lcd)
+scheduler.register(servo)
+
+servo.oscillate(min_angle=30, max_angle=150, step=2, delay=0.02)
+
+def status():
+    lcd.render(("Angle %3d" % servo.current_angle,
+                "Queue %d/%d" % (lcd.queue_depth(), lcd.queue_stats()['max_depth'])))
+
+scheduler.every(100, status)
+scheduler.every(5000, lcd.clear)
+
+scheduler.run()
@@ -0,0 +1,14 @@
+from machine import I2C, Pin
+from Libraries.LiquidCrystal import LCD
+import time
+
+# A status screen refreshed every loop. render() compares with what is
+# already shown, so only the seconds digits go over the bus.
+i2c = I2C(0, scl=Pin(17), sda=Pin(16), freq=400000)
+lcd = LCD(i2c, 0x27, num_lines=2, num_columns=16)
+
+start = time.ticks_ms()
+while True:
+    seconds = time.ticks_diff(time.ticks_ms(), start) // 1000
+    lcd.render(("Status: running", "Uptime %6d s" % seconds))
+    time.sleep_ms(100)
@@ -0,0 +1,25 @@
+from machine import Pin, I2C
+from Libraries.OLED.ssd1306 import SSD1306_I2C
+from Libraries.OLED.stripchart import StripChart
+from Libraries.ultrasonic import UltrasonicSensor
+import time
+
+# Distance history on the OLED: 0-200 cm across the panel, newest
+# sample at the bottom, older samples scrolling up.
+i2c = I2C(0, scl=Pin(17), sda=Pin(16), freq=400000)
+display = SSD1306_I2C(128, 64, i2c)
+chart = StripChart(display, low=0, high=200)
+
+ultsSensor = UltrasonicSensor(trig=3, echo=2)
+ultsSensor.setInterval(30)
+
+# distCm() keeps the last good distance when a ping gets no echo, so
+# only plot when the sensor has taken a new good reading
+lastCount = ultsSensor.reading_count
+
+while True:
+    ultsSensor.update()
+    if ultsSensor.reading_count != lastCount:
+        lastCount = ultsSensor.reading_count
+        chart.push(ultsSensor.distCm())
+    time.sleep_ms(30)
@@ -0,0 +1,25 @@
+from machine import Pin, I2C, ADC
+from Libraries.OLED.ssd1306 import SSD1306_I2C
+from Libraries.OLED.fonts import ScaledFont, TextField
+import time
+
+# tempOLED.py with 16 px text: only characters that changed are redrawn,
+# and show() only sends the bytes they touched.
+i2c = I2C(0, scl=Pin(17), sda=Pin(16), freq=400000)
+display = SSD1306_I2C(128, 64, i2c)
+sensor_temp = ADC(4)
+
+big = ScaledFont(2)
+small = ScaledFont(1)
+
+TextField(display, 0, 0, small).set('Pico temperature')
+temp_field = TextField(display, 0, 16, big)
+uptime_field = TextField(display, 0, 40, small)
+
+while True:
+    reading = sensor_temp.read_u16() * 3.3 / 65535
+    temperature = 27 - (reading - 0.706) / 0.001721
+    temp_field.set("%.1f C" % temperature)
+    uptime_field.set("up %d s" % (time.ticks_ms() // 1000))
+    display.show()
+    time.sleep(1)
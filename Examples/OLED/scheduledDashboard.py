@@ -0,0 +1,29 @@
+from machine import Pin, I2C
+from Libraries.OLED.ssd1306 import SSD1306_I2C
+from Libraries.servo import Servo
+from Libraries.scheduler import Scheduler
+
+# OLED dashboard at up to 25 fps while a servo keeps oscillating.
+# The frame is sent one 32-byte chunk per tick, so the servo is never
+# held up by more than about a millisecond of I2C traffic.
+i2c = I2C(0, scl=Pin(17), sda=Pin(16), freq=400000)
+display = SSD1306_I2C(128, 64, i2c)
+display.set_async(chunk=32, max_fps=25)
+servo = Servo(15)
+
+scheduler = Scheduler()
+scheduler.register(display)
+scheduler.register(servo)
+
+servo.oscillate(min_angle=30, max_angle=150, step=2, delay=0.02)
+
+def draw():
+    display.fill(0)
+    display.text('Servo', 0, 0)
+    display.text('%3d deg' % servo.current_angle, 0, 16)
+    display.text('frames %d' % display.frames, 0, 32)
+    display.show_async()
+
+scheduler.every(40, draw)
+
+scheduler.run()
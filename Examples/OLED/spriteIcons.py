@@ -0,0 +1,28 @@
+from machine import Pin, I2C
+from Libraries.OLED.ssd1306 import SSD1306_I2C
+from Libraries.OLED.sprites import SpriteAtlas
+import time
+
+# Copy icons.atlas to the Pico first. Rebuild it on a PC after editing
+# the images in icons/:
+#   python Tools/makeatlas.py Examples/OLED/icons.atlas Examples/OLED/icons/*.pbm
+i2c = I2C(0, scl=Pin(17), sda=Pin(16), freq=400000)
+display = SSD1306_I2C(128, 64, i2c)
+icons = SpriteAtlas('icons.atlas')
+
+# Status bar: page-aligned, opaque -> copied straight into the buffer
+for i, name in enumerate(('wifi', 'battery', 'heart')):
+    icons.blit(display, name, 128 - 16 * (i + 1), 0)
+
+# A heart bouncing over a pattern, drawn with black as transparent
+x, dx = 0, 3
+while True:
+    display.fill_rect(0, 16, 128, 48, 0)
+    for y in range(16, 64, 4):
+        display.hline(0, y, 128, 1)
+    icons.blit(display, 'heart', x, 30, key=0)
+    display.show()
+    x += dx
+    if x <= 0 or x >= 112:
+        dx = -dx
+    time.sleep_ms(30)
@@ -0,0 +1,26 @@
+from Libraries.led import LED
+from Libraries.servo import Servo
+from Libraries.scheduler import Scheduler
+
+# Same devices as Examples/LED/leds_servo.py, woken only when due
+blinkLed = LED(21)
+pwmLed = LED(22)
+servo = Servo(15)
+
+scheduler = Scheduler()
+scheduler.register(servo)
+scheduler.register(blinkLed)
+scheduler.register(pwmLed)
+
+servo.oscillate(min_angle=30, max_angle=150, step=3, delay=0.03)
+blinkLed.blink(delay=0.3)
+pwmLed.fade(minP=20, maxP=80, step=5, delay=0.05)
+
+# Print lateness stats once a second
+def report():
+    for callback, fired, late, max_late in scheduler.stats():
+        print(callback, fired, "late:", late, "max:", max_late)
+
+scheduler.every(1000, report)
+
+scheduler.run()
@@ -6,6 +6,7 @@ import time
 servo = Servo(15)
 led = LED(21)
 ultsSensor = UltrasonicSensor(trig=17, echo=16)
+ultsSensor.setAdaptive(min_ms=20, max_ms=500, threshold=20)  # Range faster as objects approach 20 cm
 
 while True:
     ultsSensor.update()                   # Refresh reading
@@ -0,0 +1,13 @@
+from Libraries.ultrasonic import UltrasonicSensor
+from Libraries.filters import FilterPipeline, OutlierReject, RollingMedian, Kalman1D
+import time
+
+ultsSensor = UltrasonicSensor(trig=17, echo=16, irq=True)
+ultsSensor.setFilter(FilterPipeline((OutlierReject(max_jump=50), RollingMedian(5), Kalman1D())))
+ultsSensor.setInterval(50)
+
+while True:
+    ultsSensor.update()
+    print("Raw:", ultsSensor.distCm(), "Filtered:", ultsSensor.filteredCm(),
+          "Velocity:", ultsSensor.velocity(), "cm/s")
+    time.sleep(0.05)
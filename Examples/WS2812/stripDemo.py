@@ -0,0 +1,17 @@
+from Libraries.ws2812 import WS2812Strip, PIOBackend
+import time
+
+# 60-pixel WS2812 strip, data on GPIO 28
+strip = WS2812Strip(60, PIOBackend(28))
+
+strip.fill(0, 0, 32)
+strip.setNamedColour(0, "red")
+strip.setHex(59, "#00FF00")
+strip.show()
+
+# Fade the middle of the strip to orange without blocking
+strip.fadeRange(20, 40, 255, 165, 0, speed=3)
+
+while True:
+    strip.update()  # Sends a frame only when something changed
+    time.sleep_ms(5)
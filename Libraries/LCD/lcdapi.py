@@ -47,6 +47,10 @@ class LcdApi:
     LCD_RW_WRITE = 0
     LCD_RW_READ = 1
 
+    # True if each hal write takes longer than the controller needs to
+    # execute it (e.g. over an I2C expander), so no extra delay is needed
+    HAL_SELF_TIMED = False
+
     def __init__(self, num_lines, num_columns):
         self.num_lines = num_lines
         if self.num_lines > 4:
@@ -58,12 +62,24 @@ class LcdApi:
         self.cursor_y = 0
         self.implied_newline = False
         self.backlight = True
+        # Shadow of the visible DDRAM cells (one byte per cell, row by row)
+        # and the DDRAM address the controller's cursor is at (None when
+        # unknown), so unchanged cells and redundant moves can be skipped
+        self.shadow = bytearray(b' ' * (self.num_lines * self.num_columns))
+        self.cursor_addr = None
+        self.display_shift = 0     # columns the display is shifted left
+        self.cells_written = 0
+        self.cells_skipped = 0
         self.display_off()
         self.backlight_on()
         self.clear()
-        self.hal_write_command(self.LCD_ENTRY_MODE | self.LCD_ENTRY_INC)
-        self.hide_cursor()
-        self.display_on()
+        self.hal_batch_begin()
+        try:
+            self.hal_write_command(self.LCD_ENTRY_MODE | self.LCD_ENTRY_INC)
+            self.hide_cursor()
+            self.display_on()
+        finally:
+            self.hal_batch_end()
 
     def clear(self):
         """Clears the LCD display and moves the cursor to the top left
@@ -73,6 +89,11 @@ class LcdApi:
         self.hal_write_command(self.LCD_HOME)
         self.cursor_x = 0
         self.cursor_y = 0
+        self.cursor_addr = 0
+        self.display_shift = 0
+        shadow = self.shadow
+        for i in range(len(shadow)):
+            shadow[i] = 0x20
 
     def show_cursor(self):
         """Causes the cursor to be made visible."""
@@ -101,6 +122,50 @@ class LcdApi:
         """Turns off (i.e. blanks) the LCD."""
         self.hal_write_command(self.LCD_ON_CTRL)
 
+    def shift_display(self, right=False):
+        """Shifts every line of the display one column left (or right).
+        DDRAM is unchanged; each line wraps around its 40 columns.
+        """
+        cmd = self.LCD_MOVE | self.LCD_MOVE_DISP
+        if right:
+            cmd |= self.LCD_MOVE_RIGHT
+            self.display_shift = (self.display_shift - 1) % 40
+        else:
+            self.display_shift = (self.display_shift + 1) % 40
+        self.hal_write_command(cmd)
+
+    def reset_shift(self):
+        """Undoes any display shift (and homes the controller's cursor)."""
+        self.hal_write_command(self.LCD_HOME)
+        self.display_shift = 0
+        self.cursor_addr = 0
+
+    def load_line(self, line, text):
+        """Writes text (padded with spaces) into all 40 DDRAM columns of
+        line & 1, including the columns off screen, so it can be scrolled
+        into view with shift_display(). On 4-line displays this also
+        fills line 2 or 3, which share that DDRAM row.
+        """
+        row = line & 1
+        cols = self.num_columns
+        shadow = self.shadow
+        base = 0x40 if row else 0
+        self.hal_batch_begin()
+        try:
+            self._set_addr(base)
+            for x in range(40):
+                code = ord(text[x]) & 0xff if x < len(text) else 0x20
+                self.hal_write_data(code)
+                if x < cols:
+                    shadow[row * cols + x] = code
+                elif x < 2 * cols and row + 2 < self.num_lines:
+                    shadow[(row + 2) * cols + x - cols] = code
+        finally:
+            self.hal_batch_end()
+        # 40 writes wrap the address counter onto the other row
+        self.cursor_addr = 0 if row else 0x40
+        self.cells_written += 40
+
     def backlight_on(self):
         """Turns the backlight on.
 
@@ -125,12 +190,38 @@ class LcdApi:
         """
         self.cursor_x = cursor_x
         self.cursor_y = cursor_y
-        addr = cursor_x & 0x3f
-        if cursor_y & 1:
+        self._set_addr(self.ddram_addr(cursor_x, cursor_y))
+
+    def ddram_addr(self, x, y):
+        """Returns the DDRAM address of column x on line y."""
+        addr = x & 0x3f
+        if y & 1:
             addr += 0x40    # Lines 1 & 3 add 0x40
-        if cursor_y & 2:    # Lines 2 & 3 add number of columns
+        if y & 2:           # Lines 2 & 3 add number of columns
             addr += self.num_columns
-        self.hal_write_command(self.LCD_DDRAM | addr)
+        return addr
+
+    def _set_addr(self, addr):
+        # Move the controller's cursor, unless it is already there
+        if addr != self.cursor_addr:
+            self.hal_write_command(self.LCD_DDRAM | addr)
+            self.cursor_addr = addr
+
+    def _write_cell(self, x, y, code):
+        # Write one character code at (x, y) and track where the
+        # controller's cursor goes next (DDRAM lines are 0x00-0x27 and
+        # 0x40-0x67; the address wraps from one to the other)
+        addr = self.ddram_addr(x, y)
+        self._set_addr(addr)
+        self.hal_write_data(code)
+        self.shadow[y * self.num_columns + x] = code
+        addr += 1
+        if addr == 0x28:
+            addr = 0x40
+        elif addr == 0x68:
+            addr = 0
+        self.cursor_addr = addr
+        self.cells_written += 1
 
     def putchar(self, char):
         """Writes the indicated character to the LCD at the current cursor
@@ -144,7 +235,7 @@ class LcdApi:
             else:
                 self.cursor_x = self.num_columns
         else:
-            self.hal_write_data(ord(char))
+            self._write_cell(self.cursor_x, self.cursor_y, ord(char) & 0xff)
             self.cursor_x += 1
         if self.cursor_x >= self.num_columns:
             self.cursor_x = 0
@@ -157,21 +248,91 @@ class LcdApi:
     def putstr(self, string):
         """Write the indicated string to the LCD at the current cursor
         position and advances the cursor position appropriately.
+
+        The writes are batched, so a HAL that supports it sends the whole
+        string in one bus transaction.
         """
-        for char in string:
-            self.putchar(char)
+        self.hal_batch_begin()
+        try:
+            for char in string:
+                self.putchar(char)
+        finally:
+            self.hal_batch_end()
+
+    def write_at(self, x, y, text):
+        """Writes text starting at column x of line y, sending only the
+        characters that differ from what the display already shows.
+        Text past the end of the line is cut off. The logical cursor
+        (cursor_x, cursor_y) is not moved. Returns the number of
+        characters sent.
+        """
+        if not 0 <= y < self.num_lines:
+            return 0
+        cols = self.num_columns
+        shadow = self.shadow
+        base = y * cols
+        sent = 0
+        self.hal_batch_begin()
+        try:
+            for char in text:
+                if x >= cols:
+                    break
+                if x >= 0:
+                    code = ord(char) & 0xff
+                    if shadow[base + x] != code:
+                        self._write_cell(x, y, code)
+                        sent += 1
+                    else:
+                        self.cells_skipped += 1
+                x += 1
+        finally:
+            self.hal_batch_end()
+        return sent
+
+    def render(self, lines):
+        """Shows lines (one string per display line) on the whole screen.
+        Short lines are padded with spaces. Only characters that changed
+        since the last update are sent. Returns the number of characters
+        sent.
+        """
+        sent = 0
+        cols = self.num_columns
+        self.hal_batch_begin()
+        try:
+            for y in range(self.num_lines):
+                line = lines[y] if y < len(lines) else ''
+                sent += self.write_at(0, y, line)
+                if len(line) < cols:
+                    sent += self.write_at(len(line), y, ' ' * (cols - len(line)))
+        finally:
+            self.hal_batch_end()
+        return sent
 
     def custom_char(self, location, charmap):
         """Write a character to one of the 8 CGRAM locations, available
         as chr(0) through chr(7).
         """
+        self.custom_chars(location, charmap[:8])
+
+    def custom_chars(self, location, data):
+        """Write consecutive CGRAM characters starting at location, 8 bytes
+        of data per character, as one batch.
+        """
         location &= 0x7
-        self.hal_write_command(self.LCD_CGRAM | (location << 3))
-        self.hal_sleep_us(40)
-        for i in range(8):
-            self.hal_write_data(charmap[i])
-            self.hal_sleep_us(40)
-        self.move_to(self.cursor_x, self.cursor_y)
+        self.cursor_addr = None    # the address counter now points into CGRAM
+        wait = not self.HAL_SELF_TIMED
+        self.hal_batch_begin()
+        try:
+            self.hal_write_command(self.LCD_CGRAM | (location << 3))
+            if wait:
+                self.hal_sleep_us(40)
+            for i in range(min(len(data), 64 - 8 * location)):
+                self.hal_write_data(data[i])
+                if wait:
+                    self.hal_sleep_us(40)
+            self.move_to(self.cursor_x, self.cursor_y)
+        finally:
+            self.hal_batch_end()
 
     def hal_backlight_on(self):
         """Allows the hal layer to turn the backlight on.
@@ -187,6 +348,21 @@ class LcdApi:
         """
         pass
 
+    def hal_batch_begin(self):
+        """Start collecting writes to send together.
+
+        Calls may nest; writes go out at the matching hal_batch_end(). If
+        desired, a derived HAL class will implement this function.
+        """
+        pass
+
+    def hal_batch_end(self):
+        """Send the writes collected since hal_batch_begin().
+
+        If desired, a derived HAL class will implement this function.
+        """
+        pass
+
     def hal_write_command(self, cmd):
         """Write a command to the LCD.
 
@@ -0,0 +1,179 @@
+from array import array
+
+class GlyphManager:
+    """
+    Maps any number of named custom glyphs onto the HD44780's 8 CGRAM
+    slots.
+
+    Glyphs are uploaded only when they are not already resident; the
+    least recently used slot is reused, preferring slots that are not on
+    screen. Glyph names in text, written as {name}, are replaced by their
+    slot codes.
+    """
+
+    def __init__(self, lcd, slots=8):
+        """
+        Args:
+            lcd: LcdApi display (e.g. LiquidCrystal.LCD).
+            slots (int): CGRAM slots to manage, 0..slots-1 (up to 8).
+        """
+        self.lcd = lcd
+        self.count = min(slots, 8)
+        self.glyphs = {}                     # name -> 8-byte bitmap
+        self.resident = [None] * self.count  # name held in each slot
+        self.used = array('I', bytes(4 * self.count))  # last-use stamp per slot
+        self.stamp = 0
+        self.resetStats()
+
+    def resetStats(self):
+        self.hits = 0
+        self.uploads = 0
+        self.visible_evictions = 0  # slots reused while shown on screen
+
+    def define(self, name, charmap):
+        """
+        Register a glyph (8 rows of 5 bits). Redefining a resident glyph
+        uploads the new bitmap next time it is used.
+        """
+        self.glyphs[name] = bytes(charmap[:8])
+        if name in self.resident:
+            self.resident[self.resident.index(name)] = None
+
+    def _onScreen(self, slot):
+        for code in self.lcd.shadow:
+            if code == slot:
+                return True
+        return False
+
+    def _victim(self, pinned):
+        """
+        Pick the slot to reuse: empty first, then the least recently used
+        one that is not on screen, then the least recently used one.
+        """
+        best = -1
+        best_hidden = -1
+        for slot in range(self.count):
+            if self.resident[slot] is None:
+                return slot
+            if slot in pinned:
+                continue
+            if best < 0 or self.used[slot] < self.used[best]:
+                best = slot
+            if (best_hidden < 0 or self.used[slot] < self.used[best_hidden]) \
+                    and not self._onScreen(slot):
+                best_hidden = slot
+        if best_hidden >= 0:
+            return best_hidden
+        if best < 0:
+            raise ValueError("More than %d glyphs needed at once" % self.count)
+        self.visible_evictions += 1
+        return best
+
+    def load(self, names):
+        """
+        Make sure all glyphs in `names` are resident at the same time and
+        return their slot codes. Missing glyphs are uploaded together, in
+        one bus batch.
+        """
+        # Pin every glyph that is already resident before choosing any
+        # victim, so a later name in the list is never evicted
+        pinned = []
+        missing = []
+        for name in names:
+            if name in self.resident:
+                slot = self.resident.index(name)
+                if slot not in pinned:
+                    self.hits += 1
+                    pinned.append(slot)
+                self.stamp += 1
+                self.used[slot] = self.stamp
+            elif name not in missing:
+                if name not in self.glyphs:
+                    raise KeyError("Unknown glyph: " + name)
+                missing.append(name)
+
+        upload = []
+        for name in missing:
+            slot = self._victim(pinned)
+            self.resident[slot] = name
+            upload.append(slot)
+            self.uploads += 1
+            self.stamp += 1
+            self.used[slot] = self.stamp
+            pinned.append(slot)
+
+        if upload:
+            upload.sort()
+            lcd = self.lcd
+            lcd.hal_batch_begin()
+            try:
+                # Neighbouring slots go up as one CGRAM write
+                i = 0
+                while i < len(upload):
+                    j = i
+                    while j + 1 < len(upload) and upload[j + 1] == upload[j] + 1:
+                        j += 1
+                    data = bytearray()
+                    for slot in upload[i:j + 1]:
+                        data += self.glyphs[self.resident[slot]]
+                    lcd.custom_chars(upload[i], data)
+                    i = j + 1
+            finally:
+                lcd.hal_batch_end()
+        return [self.resident.index(name) for name in names]
+
+    def code(self, name):
+        """Return the character for one glyph, uploading it if needed."""
+        return chr(self.load((name,))[0])
+
+    def resolve(self, text):
+        """
+        Return `text` with every {name} replaced by that glyph's character.
+        """
+        if '{' not in text:
+            return text
+        parts = text.split('{')
+        names = []
+        for part in parts[1:]:
+            end = part.find('}')
+            if end < 0:
+                raise ValueError("Unclosed glyph name in: " + text)
+            names.append(part[:end])
+        codes = self.load(names)
+        out = [parts[0]]
+        for k, part in enumerate(parts[1:]):
+            out.append(chr(codes[k]))
+            out.append(part[part.find('}') + 1:])
+        return ''.join(out)
+
+    def write_at(self, x, y, text):
+        """lcd.write_at() with glyph names resolved; uploads and text go
+        out in one batch."""
+        lcd = self.lcd
+        lcd.hal_batch_begin()
+        try:
+            return lcd.write_at(x, y, self.resolve(text))
+        finally:
+            lcd.hal_batch_end()
+
+    def render(self, lines):
+        """lcd.render() with glyph names resolved (all lines at once)."""
+        lcd = self.lcd
+        lcd.hal_batch_begin()
+        try:
+            return lcd.render(self.resolve('\n'.join(lines)).split('\n'))
+        finally:
+            lcd.hal_batch_end()
+
+    def hitRate(self):
+        """Fraction of glyph uses that needed no upload."""
+        total = self.hits + self.uploads
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'uploads': self.uploads,
+            'hit_rate': self.hitRate(),
+            'visible_evictions': self.visible_evictions,
+        }
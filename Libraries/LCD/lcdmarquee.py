@@ -0,0 +1,108 @@
+import time
+
+DDRAM_COLUMNS = 40   # DDRAM columns per line on the HD44780
+
+class Marquee:
+    """
+    Scrolls a message across one line of a character LCD without blocking.
+
+    When the message fits in a DDRAM line (40 columns) and the display has
+    at most 2 lines, it is written once and scrolled with the controller's
+    display-shift command: one command byte per step. Display shift moves
+    every line, so other lines scroll along; use windowed=True to keep
+    them still.
+
+    Longer messages (and 4-line displays, whose lines share DDRAM rows)
+    are scrolled by rewriting the visible window each step; LcdApi's
+    shadow keeps that to the cells that change.
+    """
+
+    def __init__(self, lcd, line=0, step_ms=300, gap=4, windowed=False):
+        """
+        Args:
+            lcd: LcdApi display (e.g. LiquidCrystal.LCD).
+            line (int): Display line the message runs on.
+            step_ms (int): Time per one-column step.
+            gap (int): Spaces between the end of the message and its
+                repeat (windowed mode).
+            windowed (bool): Always rewrite the window instead of using
+                display shift.
+        """
+        self.lcd = lcd
+        self.line = line
+        self.step_ms = step_ms
+        self.gap = gap
+        self.windowed = windowed
+        self.text = ''
+        self.hardware = False
+        self.running = False
+        self.pos = 0
+        self.steps = 0
+        self.lastUpdate = time.ticks_ms()
+
+        # Scheduler task (set by Scheduler.register)
+        self.task = None
+
+    def start(self, text):
+        """
+        Show `text` and start scrolling it if it is wider than the line.
+        """
+        lcd = self.lcd
+        cols = lcd.num_columns
+        self.stop()
+        self.text = text
+        self.pos = 0
+        if len(text) <= cols:
+            lcd.write_at(0, self.line, text + ' ' * (cols - len(text)))
+            return
+        self.hardware = (not self.windowed and lcd.num_lines <= 2
+                         and len(text) <= DDRAM_COLUMNS)
+        if self.hardware:
+            lcd.load_line(self.line, text)
+        else:
+            self.loop = text + ' ' * self.gap
+            self._window()
+        self.running = True
+        self.lastUpdate = time.ticks_ms()
+        if self.task:
+            self.task.wake(self.step_ms)
+
+    def stop(self):
+        """Stop scrolling; a hardware-shifted display is put back."""
+        if self.running and self.hardware:
+            self.lcd.reset_shift()
+        self.running = False
+        self.hardware = False
+
+    def _window(self):
+        loop = self.loop
+        cols = self.lcd.num_columns
+        i = self.pos
+        window = loop[i:i + cols]
+        while len(window) < cols:
+            window += loop[:cols - len(window)]
+        self.lcd.write_at(0, self.line, window)
+
+    def update(self):
+        """Call this repeatedly in your main loop."""
+        now = time.ticks_ms()
+        if time.ticks_diff(now, self.lastUpdate) < self.step_ms:
+            return
+        self.lastUpdate = now
+        self.tick()
+
+    def tick(self):
+        """
+        Scroll one column.
+        Returns ms until the next step, or None when not scrolling.
+        """
+        if not self.running:
+            return None
+        if self.hardware:
+            self.lcd.shift_display()
+            self.pos = self.lcd.display_shift
+        else:
+            self.pos = (self.pos + 1) % len(self.loop)
+            self._window()
+        self.steps += 1
+        return self.step_ms
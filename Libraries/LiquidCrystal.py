@@ -1,5 +1,6 @@
 import utime
 import gc
+from array import array
 
 from Libraries.LCD.lcdapi import LcdApi
 from machine import I2C
@@ -12,25 +13,79 @@ MASK_E  = 0x04       # P2
 SHIFT_BACKLIGHT = 3  # P3
 SHIFT_DATA      = 4  # P4-P7
 
+# Each LCD byte is four PCF8574 writes: high nibble with E set, high
+# nibble with E clear, then the same for the low nibble
+FRAMES_PER_BYTE = 4
+BATCH_BYTES = 40     # LCD bytes held before a batch is sent
+
+# Queued mode: entry kinds (low bits) and the backlight flag
+Q_RAW = 0            # one PCF8574 frame as-is
+Q_NIBBLE = 1         # init nibble (8-bit mode)
+Q_CMD = 2
+Q_DATA = 3
+Q_BACKLIGHT = 0x80   # backlight was on when the entry was queued
+
+CLEAR_US = 5000      # clear/home need up to 4.1 ms
+
 class LCD(LcdApi):
     
     #Implements a HD44780 character LCD connected via PCF8574 on I2C
 
-    def __init__(self, i2c, i2c_addr, num_lines, num_columns):
+    # Four PCF8574 frames per byte take longer than any non-clear command
+    HAL_SELF_TIMED = True
+
+    def __init__(self, i2c, i2c_addr, num_lines, num_columns, queued=False, queue_size=128):
+        # queued=True: writes go into a queue drained by tick(), with the
+        # controller's delays kept as ready-times instead of sleeps, so
+        # no call blocks (including this constructor)
         self.i2c = i2c
         self.i2c_addr = i2c_addr
-        self.i2c.writeto(self.i2c_addr, bytes([0]))
-        utime.sleep_ms(20)   # Allow LCD time to powerup
-        # Send reset 3 times
-        self.hal_write_init_nibble(self.LCD_FUNCTION_RESET)
-        utime.sleep_ms(5)    # Need to delay at least 4.1 msec
-        self.hal_write_init_nibble(self.LCD_FUNCTION_RESET)
-        utime.sleep_ms(1)
-        self.hal_write_init_nibble(self.LCD_FUNCTION_RESET)
-        utime.sleep_ms(1)
-        # Put LCD into 4-bit mode
-        self.hal_write_init_nibble(self.LCD_FUNCTION)
-        utime.sleep_ms(1)
+        # Preallocated frame buffers: one for a single byte, one for a
+        # batch of bytes collected between hal_batch_begin/end
+        self.one = bytearray(1)
+        self.frame = bytearray(FRAMES_PER_BYTE)
+        self.batch = bytearray(FRAMES_PER_BYTE * BATCH_BYTES)
+        self.batch_mv = memoryview(self.batch)
+        self.batch_len = 0
+        self.batching = 0
+        self.backlight = True
+
+        self.queued = queued
+        # A direct LCD keeps an always-empty queue, so tick(), flush_queue()
+        # and queue_stats() are safe to call (e.g. from a Scheduler)
+        self.q_count = 0
+        self.reset_queue_stats()
+        if queued:
+            self.q_size = queue_size
+            self.q_kind = array('B', bytes(queue_size))
+            self.q_value = array('B', bytes(queue_size))
+            self.q_wait = array('H', bytes(2 * queue_size))   # us to wait after sending
+            self.q_stamp = array('I', bytes(4 * queue_size))  # ticks_us when queued
+            self.q_head = 0
+            self.ready_at = utime.ticks_us()
+        # Scheduler task (set by Scheduler.register)
+        self.task = None
+
+        if queued:
+            self._push(Q_RAW, 0, 20000)   # Allow LCD time to powerup
+            # Send reset 3 times, then put LCD into 4-bit mode
+            self._push(Q_NIBBLE, self.LCD_FUNCTION_RESET, 5000)
+            self._push(Q_NIBBLE, self.LCD_FUNCTION_RESET, 1000)
+            self._push(Q_NIBBLE, self.LCD_FUNCTION_RESET, 1000)
+            self._push(Q_NIBBLE, self.LCD_FUNCTION, 1000)
+        else:
+            self.i2c.writeto(self.i2c_addr, self.one)
+            utime.sleep_ms(20)   # Allow LCD time to powerup
+            # Send reset 3 times
+            self.hal_write_init_nibble(self.LCD_FUNCTION_RESET)
+            utime.sleep_ms(5)    # Need to delay at least 4.1 msec
+            self.hal_write_init_nibble(self.LCD_FUNCTION_RESET)
+            utime.sleep_ms(1)
+            self.hal_write_init_nibble(self.LCD_FUNCTION_RESET)
+            utime.sleep_ms(1)
+            # Put LCD into 4-bit mode
+            self.hal_write_init_nibble(self.LCD_FUNCTION)
+            utime.sleep_ms(1)
         LcdApi.__init__(self, num_lines, num_columns)
         cmd = self.LCD_FUNCTION
         if num_lines > 1:
@@ -42,45 +97,185 @@ class LCD(LcdApi):
         # Writes an initialization nibble to the LCD.
         # This particular function is only used during initialization.
         byte = ((nibble >> 4) & 0x0f) << SHIFT_DATA
-        self.i2c.writeto(self.i2c_addr, bytes([byte | MASK_E]))
-        self.i2c.writeto(self.i2c_addr, bytes([byte]))
-        gc.collect()
-        
+        frame = self.frame
+        frame[0] = byte | MASK_E
+        frame[1] = byte
+        self.i2c.writeto(self.i2c_addr, memoryview(frame)[:2])
+
     def hal_backlight_on(self):
         # Allows the hal layer to turn the backlight on
-        self.i2c.writeto(self.i2c_addr, bytes([1 << SHIFT_BACKLIGHT]))
-        gc.collect()
-        
+        if self.queued:
+            return self._push(Q_RAW, 1 << SHIFT_BACKLIGHT, 0)
+        self.hal_flush()
+        self.one[0] = 1 << SHIFT_BACKLIGHT
+        self.i2c.writeto(self.i2c_addr, self.one)
+
     def hal_backlight_off(self):
         #Allows the hal layer to turn the backlight off
-        self.i2c.writeto(self.i2c_addr, bytes([0]))
-        gc.collect()
-        
+        if self.queued:
+            return self._push(Q_RAW, 0, 0)
+        self.hal_flush()
+        self.one[0] = 0
+        self.i2c.writeto(self.i2c_addr, self.one)
+
+    def _encode(self, buf, i, value, rs, backlight=None):
+        # Four frames for one byte at buf[i:i + 4]. Data is latched on the
+        # falling edge of E.
+        if backlight is None:
+            backlight = self.backlight
+        base = rs | (backlight << SHIFT_BACKLIGHT)
+        byte = base | (((value >> 4) & 0x0f) << SHIFT_DATA)
+        buf[i] = byte | MASK_E
+        buf[i + 1] = byte
+        byte = base | ((value & 0x0f) << SHIFT_DATA)
+        buf[i + 2] = byte | MASK_E
+        buf[i + 3] = byte
+
+    def _write(self, value, rs):
+        if self.batching:
+            if self.batch_len + FRAMES_PER_BYTE > len(self.batch):
+                self.hal_flush()
+            self._encode(self.batch, self.batch_len, value, rs)
+            self.batch_len += FRAMES_PER_BYTE
+        else:
+            self._encode(self.frame, 0, value, rs)
+            self.i2c.writeto(self.i2c_addr, self.frame)
+
+    def hal_batch_begin(self):
+        # Collect following writes and send them as one I2C transaction
+        self.batching += 1
+
+    def hal_batch_end(self):
+        self.batching -= 1
+        if not self.batching:
+            self.hal_flush()
+
+    def hal_flush(self):
+        # Send any collected writes
+        if self.batch_len:
+            self.i2c.writeto(self.i2c_addr, self.batch_mv[:self.batch_len])
+            self.batch_len = 0
+
     def hal_write_command(self, cmd):
-        # Write a command to the LCD. Data is latched on the falling edge of E.
-        byte = ((self.backlight << SHIFT_BACKLIGHT) |
-                (((cmd >> 4) & 0x0f) << SHIFT_DATA))
-        self.i2c.writeto(self.i2c_addr, bytes([byte | MASK_E]))
-        self.i2c.writeto(self.i2c_addr, bytes([byte]))
-        byte = ((self.backlight << SHIFT_BACKLIGHT) |
-                ((cmd & 0x0f) << SHIFT_DATA))
-        self.i2c.writeto(self.i2c_addr, bytes([byte | MASK_E]))
-        self.i2c.writeto(self.i2c_addr, bytes([byte]))
+        # Write a command to the LCD.
+        if self.queued:
+            return self._push(Q_CMD, cmd, CLEAR_US if cmd <= 3 else 0)
+        self._write(cmd, 0)
         if cmd <= 3:
             # The home and clear commands require a worst case delay of 4.1 msec
+            self.hal_flush()
             utime.sleep_ms(5)
-        gc.collect()
 
     def hal_write_data(self, data):
-        # Write data to the LCD. Data is latched on the falling edge of E.
-        byte = (MASK_RS |
-                (self.backlight << SHIFT_BACKLIGHT) |
-                (((data >> 4) & 0x0f) << SHIFT_DATA))
-        self.i2c.writeto(self.i2c_addr, bytes([byte | MASK_E]))
-        self.i2c.writeto(self.i2c_addr, bytes([byte]))
-        byte = (MASK_RS |
-                (self.backlight << SHIFT_BACKLIGHT) |
-                ((data & 0x0f) << SHIFT_DATA))      
-        self.i2c.writeto(self.i2c_addr, bytes([byte | MASK_E]))
-        self.i2c.writeto(self.i2c_addr, bytes([byte]))
-        gc.collect()
+        # Write data to the LCD.
+        if self.queued:
+            return self._push(Q_DATA, data, 0)
+        self._write(data, MASK_RS)
+
+    # ------------------- Queued mode -------------------
+
+    def _push(self, kind, value, wait_us):
+        # Queue one write; wait_us is the time the controller needs after it
+        if self.q_count == self.q_size:
+            # Full: drain what is due, then wait out delays (counted, so
+            # the queue can be sized to avoid it)
+            self.overflows += 1
+            while self.q_count == self.q_size:
+                delay = self.tick()
+                if delay and self.q_count == self.q_size:
+                    utime.sleep_ms(delay)
+        i = (self.q_head + self.q_count) % self.q_size
+        if self.backlight:
+            kind |= Q_BACKLIGHT
+        self.q_kind[i] = kind
+        self.q_value[i] = value
+        self.q_wait[i] = wait_us
+        self.q_stamp[i] = utime.ticks_us()
+        self.q_count += 1
+        if self.q_count > self.max_depth:
+            self.max_depth = self.q_count
+        if self.q_count == 1 and self.task:
+            self.task.wake(max(0, utime.ticks_diff(self.ready_at, utime.ticks_us())) // 1000)
+
+    def queue_depth(self):
+        return self.q_count
+
+    def update(self):
+        # Call this repeatedly in your main loop (queued mode)
+        if self.queued and self.q_count:
+            self.tick()
+
+    def tick(self):
+        # Send every queued write that is due, as one I2C transaction,
+        # stopping after a write that needs the controller to wait.
+        # Returns ms until the next write is due, or None when the queue
+        # is empty. Never sleeps.
+        if not self.q_count:
+            return None
+        now = utime.ticks_us()
+        wait = utime.ticks_diff(self.ready_at, now)
+        if wait > 0:
+            return (wait + 999) // 1000
+
+        buf = self.batch
+        n = 0
+        wait = 0
+        while self.q_count and n + FRAMES_PER_BYTE <= len(buf):
+            i = self.q_head
+            kind = self.q_kind[i]
+            value = self.q_value[i]
+            bl = 1 if kind & Q_BACKLIGHT else 0
+            kind &= 0x7f
+            if kind == Q_RAW:
+                buf[n] = value
+                n += 1
+            elif kind == Q_NIBBLE:
+                byte = ((value >> 4) & 0x0f) << SHIFT_DATA
+                buf[n] = byte | MASK_E
+                buf[n + 1] = byte
+                n += 2
+            else:
+                self._encode(buf, n, value, MASK_RS if kind == Q_DATA else 0, bl)
+                n += FRAMES_PER_BYTE
+
+            latency = utime.ticks_diff(now, self.q_stamp[i])
+            self.sent += 1
+            self.total_latency_us += latency
+            if latency > self.max_latency_us:
+                self.max_latency_us = latency
+
+            self.q_head = (i + 1) % self.q_size
+            self.q_count -= 1
+            wait = self.q_wait[i]
+            if wait:
+                break
+
+        self.i2c.writeto(self.i2c_addr, self.batch_mv[:n])
+        self.ready_at = utime.ticks_add(utime.ticks_us(), wait)
+        if not self.q_count:
+            return None
+        return (wait + 999) // 1000
+
+    def flush_queue(self):
+        # Send everything queued now, sleeping through the delays
+        while self.q_count:
+            delay = self.tick()
+            if delay:
+                utime.sleep_ms(delay)
+
+    def queue_stats(self):
+        return {
+            'depth': self.q_count,
+            'max_depth': self.max_depth,
+            'sent': self.sent,
+            'avg_latency_us': self.total_latency_us // self.sent if self.sent else 0,
+            'max_latency_us': self.max_latency_us,
+            'overflows': self.overflows,
+        }
+
+    def reset_queue_stats(self):
+        self.max_depth = 0
+        self.sent = 0
+        self.total_latency_us = 0
+        self.max_latency_us = 0
+        self.overflows = 0
@@ -0,0 +1,216 @@
+from array import array
+import framebuf
+
+# ------------------- Fonts -------------------
+# A font hands out glyphs as MONO_VLSB FrameBuffer tiles (ink = 1), so a
+# character is drawn with a single blit. Tiles are built once and kept.
+
+class ScaledFont:
+    """
+    The built-in 8x8 framebuf font scaled by a whole number (8, 16, 24...
+    pixels high). Each glyph is scaled pixel by pixel the first time it
+    is used and cached as a tile after that.
+    """
+
+    def __init__(self, scale=2, max_glyphs=64):
+        """
+        Args:
+            scale (int): Size multiplier (1 = plain 8x8).
+            max_glyphs (int): Most tiles kept; bounds RAM for large scales.
+        """
+        self.scale = scale
+        self.height = 8 * scale
+        self.max_glyphs = max_glyphs
+        self.glyphs = {}
+        self.hits = 0
+        self.misses = 0
+        self._src = bytearray(8)
+        self._srcFb = framebuf.FrameBuffer(self._src, 8, 8, framebuf.MONO_VLSB)
+
+    def width(self, ch):
+        return 8 * self.scale
+
+    def glyph(self, ch):
+        """Return the tile for `ch`."""
+        fb = self.glyphs.get(ch)
+        if fb is not None:
+            self.hits += 1
+            return fb
+        self.misses += 1
+        if len(self.glyphs) >= self.max_glyphs:
+            self.glyphs.pop(next(iter(self.glyphs)))
+
+        s = self.scale
+        size = 8 * s
+        fb = framebuf.FrameBuffer(bytearray(size * s), size, size, framebuf.MONO_VLSB)
+        src = self._srcFb
+        src.fill(0)
+        src.text(ch, 0, 0, 1)
+        for y in range(8):
+            for x in range(8):
+                if src.pixel(x, y):
+                    fb.fill_rect(x * s, y * s, s, s, 1)
+        self.glyphs[ch] = fb
+        return fb
+
+
+class BitmapFont:
+    """
+    Proportional bitmap font loaded from a compact file.
+
+    File layout (all bytes):
+        b'MF1', height, first char code, glyph count,
+        one width per glyph,
+        glyph data: per glyph, ceil(height / 8) pages of `width` bytes in
+        MONO_VLSB order.
+    Glyph data is already in FrameBuffer layout, so each tile is a view
+    into the loaded file without copying.
+    """
+
+    def __init__(self, data):
+        """
+        Args:
+            data (bytearray): Font file contents (see BitmapFont.load()).
+        """
+        if data[:3] != b'MF1':
+            raise ValueError("Not a font file")
+        self.data = data
+        self.height = data[3]
+        self.first = data[4]
+        self.count = data[5]
+        self.widths = data[6:6 + self.count]
+        pages = (self.height + 7) // 8
+        self.offsets = array('H', bytes(2 * self.count))
+        offset = 6 + self.count
+        for i in range(self.count):
+            self.offsets[i] = offset
+            offset += pages * self.widths[i]
+        self.glyphs = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls(bytearray(f.read()))
+
+    def _index(self, ch):
+        i = ord(ch) - self.first
+        if not 0 <= i < self.count:
+            i = ord('?') - self.first
+            if not 0 <= i < self.count:
+                i = 0
+        return i
+
+    def width(self, ch):
+        return self.widths[self._index(ch)]
+
+    def glyph(self, ch):
+        """Return the tile for `ch` ('?' if the font lacks it)."""
+        fb = self.glyphs.get(ch)
+        if fb is not None:
+            self.hits += 1
+            return fb
+        self.misses += 1
+        i = self._index(ch)
+        w = self.widths[i]
+        a = self.offsets[i]
+        n = ((self.height + 7) // 8) * w
+        fb = framebuf.FrameBuffer(memoryview(self.data)[a:a + n], w, self.height,
+                                  framebuf.MONO_VLSB)
+        self.glyphs[ch] = fb
+        return fb
+
+
+def saveFont(font, path, first=32, last=126):
+    """
+    Write any font's glyphs first..last to a BitmapFont file, e.g. to
+    keep a ScaledFont pre-rendered instead of scaling at start-up.
+    """
+    pages = (font.height + 7) // 8
+    widths = bytes(font.width(chr(c)) for c in range(first, last + 1))
+    with open(path, 'wb') as f:
+        f.write(b'MF1')
+        f.write(bytes((font.height, first, last - first + 1)))
+        f.write(widths)
+        for c in range(first, last + 1):
+            fb = font.glyph(chr(c))
+            w = widths[c - first]
+            tile = bytearray(pages * w)
+            out = framebuf.FrameBuffer(tile, w, font.height, framebuf.MONO_VLSB)
+            out.blit(fb, 0, 0)
+            f.write(tile)
+
+# ------------------- Drawing -------------------
+
+def textWidth(font, text):
+    """Width of `text` in pixels."""
+    w = 0
+    for ch in text:
+        w += font.width(ch)
+    return w
+
+def drawText(display, font, text, x, y):
+    """
+    Draw `text` with one blit per glyph. Background pixels are left
+    as they are (glyph pixel 0 is transparent).
+    Returns the x position after the last glyph.
+    """
+    for ch in text:
+        display.blit(font.glyph(ch), x, y, 0)
+        x += font.width(ch)
+    return x
+
+
+class TextField:
+    """
+    A fixed spot on the display showing one line of text.
+    set() redraws only from the first character that changed, so a value
+    that did not change costs nothing and a changing digit costs a
+    glyph or two.
+    """
+
+    def __init__(self, display, x, y, font):
+        """
+        Args:
+            display: SSD1306 (or any FrameBuffer) to draw on.
+            x, y (int): Top-left corner of the field.
+            font: ScaledFont or BitmapFont.
+        """
+        self.display = display
+        self.x = x
+        self.y = y
+        self.font = font
+        self.text = ''
+        self.redraws = 0
+
+    def set(self, text):
+        """
+        Show `text`. Returns True if anything was drawn.
+        """
+        text = str(text)
+        old = self.text
+        if text == old:
+            return False
+        font = self.font
+
+        # First differing character and its x position
+        i = 0
+        x = self.x
+        n = min(len(text), len(old))
+        while i < n and text[i] == old[i]:
+            x += font.width(text[i])
+            i += 1
+
+        # Clear the old tail and draw the new one
+        old_end = x + textWidth(font, old[i:])
+        if old_end > x:
+            self.display.fill_rect(x, self.y, old_end - x, font.height, 0)
+        drawText(self.display, font, text[i:], x, self.y)
+        self.text = text
+        self.redraws += 1
+        return True
+
+    def invalidate(self):
+        """Forget the shown text, e.g. after the display was cleared."""
+        self.text = ''
@@ -0,0 +1,103 @@
+try:
+    import struct
+except ImportError:
+    import ustruct as struct
+import framebuf
+
+class SpriteAtlas:
+    """
+    Named 1-bit sprites from an atlas file built by Tools/makeatlas.py.
+
+    The sprite data is already in MONO_VLSB layout, so each sprite is a
+    FrameBuffer view into the loaded data; nothing is decoded or copied
+    at runtime.
+    """
+
+    def __init__(self, path, lazy=False, max_cached=8):
+        """
+        Args:
+            path (str): Atlas file on the Pico's filesystem.
+            lazy (bool): False reads the whole file once. True keeps only
+                the index in RAM and reads each sprite when first used.
+            max_cached (int): Sprites kept in RAM in lazy mode.
+        """
+        self.path = path
+        self.lazy = lazy
+        self.max_cached = max_cached
+        self.index = {}    # name -> (width, height, offset)
+        self.views = {}    # name -> (FrameBuffer, memoryview of its data)
+        self.data = None
+        self.blits = 0
+        self.fast_blits = 0
+
+        with open(path, 'rb') as f:
+            head = f.read(5)
+            if head[:3] != b'SA1':
+                raise ValueError("Not a sprite atlas: " + path)
+            count = struct.unpack('<H', head[3:5])[0]
+            for _ in range(count):
+                n = f.read(1)[0]
+                name = f.read(n).decode()
+                self.index[name] = struct.unpack('<HHI', f.read(8))
+            if not lazy:
+                f.seek(0)
+                self.data = memoryview(bytearray(f.read()))
+
+    def names(self):
+        return list(self.index)
+
+    def size(self, name):
+        """Return (width, height) of a sprite."""
+        w, h, _ = self.index[name]
+        return w, h
+
+    def _load(self, name):
+        w, h, offset = self.index[name]
+        n = ((h + 7) // 8) * w
+        if self.data is not None:
+            mv = self.data[offset:offset + n]
+        else:
+            if len(self.views) >= self.max_cached:
+                self.views.pop(next(iter(self.views)))
+            mv = memoryview(bytearray(n))
+            with open(self.path, 'rb') as f:
+                f.seek(offset)
+                f.readinto(mv)
+        entry = (framebuf.FrameBuffer(mv, w, h, framebuf.MONO_VLSB), mv)
+        self.views[name] = entry
+        return entry
+
+    def sprite(self, name):
+        """Return the sprite as a FrameBuffer (for blit() or drawing)."""
+        entry = self.views.get(name)
+        if entry is None:
+            entry = self._load(name)
+        return entry[0]
+
+    def blit(self, display, name, x, y, key=-1):
+        """
+        Draw a sprite on an SSD1306 display.
+
+        An opaque sprite (key=-1) whose top edge and height fall on 8-pixel
+        page boundaries and that fits on screen is copied one page row at a
+        time with slice assignment. Anything else goes through the
+        display's blit(), where `key` is the transparent colour (0 or 1).
+        """
+        entry = self.views.get(name)
+        if entry is None:
+            entry = self._load(name)
+        fb, mv = entry
+        w, h, _ = self.index[name]
+        self.blits += 1
+
+        if (key == -1 and not (y & 7) and not (h & 7) and x >= 0 and y >= 0
+                and x + w <= display.width and y + h <= display.height):
+            buf = display.buffer
+            stride = display.width
+            dst = (y >> 3) * stride + x
+            for src in range(0, len(mv), w):
+                buf[dst:dst + w] = mv[src:src + w]
+                dst += stride
+            self.fast_blits += 1
+        else:
+            display.blit(fb, x, y, key)
@@ -0,0 +1,114 @@
+from array import array
+
+class StripChart:
+    """
+    Scrolling strip chart drawn on a whole SSD1306 panel.
+
+    Time runs along the panel rows and values across the columns (mount
+    the display on its side for a chart that scrolls sideways). Each
+    sample redraws one row of display RAM, sends only the bytes of that
+    row's segment, and moves the display start line by one, so the
+    controller does the scrolling instead of a full redraw and transfer.
+    Drawing other content on the same display scrolls along with it.
+    """
+
+    def __init__(self, display, low=0, high=100):
+        """
+        Args:
+            display: SSD1306_I2C or SSD1306_SPI used only by the chart.
+            low (float): Value drawn at column 0.
+            high (float): Value drawn at the last column.
+        """
+        self.display = display
+        self.rows = display.height
+        self.values = array('f', bytes(4 * self.rows))  # Ring buffer, one value per row
+        self.seg_lo = array('B', bytes(self.rows))     # Columns drawn in each row
+        self.seg_hi = array('B', bytes(self.rows))
+        self.setRange(low, high)
+        self.clear()
+
+    def setRange(self, low, high):
+        """
+        Set the values mapped to the first and last column.
+        Affects new samples only.
+        """
+        self.low = low
+        self.high = high
+        self.scale = (self.display.width - 1) / (high - low)
+
+    def clear(self):
+        """Blank the panel and the history."""
+        self.head = 0       # RAM row the next sample goes to
+        self.count = 0
+        self.samples = 0
+        self.tx_bytes = 0
+        self.last_x = 0
+        for i in range(self.rows):
+            self.seg_lo[i] = 0
+            self.seg_hi[i] = 0
+        d = self.display
+        d.fill(0)
+        d.show(full=True)
+        d.start_line(1)
+
+    def push(self, value):
+        """
+        Add a sample: draws the line from the previous sample to this one
+        in the oldest row and scrolls it to the bottom of the panel.
+        """
+        d = self.display
+        row = self.head
+        x = int((value - self.low) * self.scale + 0.5)
+        x = 0 if x < 0 else d.width - 1 if x >= d.width else x
+        prev = self.last_x if self.count else x
+
+        # Erase the oldest row and draw the new segment in its place
+        old_lo = self.seg_lo[row]
+        old_hi = self.seg_hi[row]
+        if self.count >= self.rows:
+            d.hline(old_lo, row, old_hi - old_lo + 1, 0)
+        lo = min(prev, x)
+        hi = max(prev, x)
+        d.hline(lo, row, hi - lo + 1, 1)
+
+        # Send only the touched bytes of that page: one window, or two
+        # if the erased and new segments are apart
+        start = d.tx_bytes
+        page = row >> 3
+        if self.count >= self.rows:
+            if old_hi + 1 < lo or hi + 1 < old_lo:
+                self._send(page, old_lo, old_hi)
+            else:
+                lo = min(lo, old_lo)
+                hi = max(hi, old_hi)
+        self._send(page, lo, hi)
+        d.start_line(row + 1)
+        self.tx_bytes += d.tx_bytes - start
+
+        self.values[row] = value
+        self.seg_lo[row] = min(prev, x)
+        self.seg_hi[row] = max(prev, x)
+        self.last_x = x
+        self.head = (row + 1) % self.rows
+        if self.count < self.rows:
+            self.count += 1
+        self.samples += 1
+
+    def _send(self, page, lo, hi):
+        """
+        Send columns lo..hi of `page` from the display buffer and mark
+        them as shown.
+        """
+        d = self.display
+        a = page * d.width + lo
+        b = a + hi - lo + 1
+        mv = memoryview(d.buffer)
+        d.write_window(lo, hi, page, page, mv[a:b])
+        d.shadow[a:b] = mv[a:b]
+
+    def latest(self, n=1):
+        """
+        Return the last `n` values, newest first.
+        """
+        n = min(n, self.count)
+        return [self.values[(self.head - 1 - i) % self.rows] for i in range(n)]
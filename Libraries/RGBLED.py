@@ -1,7 +1,60 @@
 from machine import Pin, PWM
 import time
 
+from Libraries.duty import byteTable
+
+# Hue wheel: 256 hues at full saturation/value, 3 bytes (r, g, b) each
+_HUE = bytearray(768)
+for _h in range(256):
+    _region = _h * 6 // 256
+    _rem = _h * 6 - _region * 256
+    _HUE[3 * _h:3 * _h + 3] = bytes((
+        (255, 255 - _rem, 0, 0, _rem, 255)[_region],
+        (_rem, 255, 255, 255 - _rem, 0, 0)[_region],
+        (0, 0, _rem, 255, 255, 255 - _rem)[_region],
+    ))
+
+def hsvToRgb(h, s, v):
+    """
+    Integer HSV -> RGB using the hue wheel table.
+    h, s, v are 0-255; returns (r, g, b) 0-255.
+    """
+    i = 3 * (h & 255)
+    return (
+        v * (65025 - s * (255 - _HUE[i])) // 65025,
+        v * (65025 - s * (255 - _HUE[i + 1])) // 65025,
+        v * (65025 - s * (255 - _HUE[i + 2])) // 65025,
+    )
+
+def rgbToHsv(r, g, b):
+    """
+    Integer RGB -> HSV. All values 0-255.
+    """
+    mx = max(r, g, b)
+    mn = min(r, g, b)
+    d = mx - mn
+    if d == 0:
+        return 0, 0, mx
+    if mx == r:
+        h = ((g - b) * 256 // (6 * d)) % 256
+    elif mx == g:
+        h = (2 * d + b - r) * 256 // (6 * d)
+    else:
+        h = (4 * d + r - g) * 256 // (6 * d)
+    return h & 255, d * 255 // mx, mx
+
+def _cachePut(cache, key, value, size):
+    """
+    Store `value`, first dropping an arbitrary entry if `cache` already
+    holds `size`.
+    """
+    if len(cache) >= size:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+
 class RGBLED:
+    FADE_INTERVAL = 20  # ms between fade steps (~50Hz)
+
     NAMED_COLOURS = {
         "red": (255, 0, 0),
         "green": (0, 255, 0),
@@ -16,9 +69,18 @@ class RGBLED:
         "pink": (255, 192, 203)
     }
 
+    # Names and hex codes resolved once: key -> (r, g, b) and
+    # (key, commonAnode) -> (duty_r, duty_g, duty_b). Each holds at most
+    # CACHE_SIZE entries so computed hex codes cannot grow them without
+    # limit.
+    CACHE_SIZE = 32
+    _colourCache = {}
+    _dutyCache = {}
+
     def __init__(self, redPin, greenPin, bluePin, commonAnode=False, pwm=True):
         self.commonAnode = commonAnode
         self.pwmMode = pwm
+        self._duty = byteTable(commonAnode)  # 0-255 -> duty_u16 lookup
 
         if pwm:
             self.red = PWM(Pin(redPin))
@@ -36,56 +98,223 @@ class RGBLED:
         self.fadeSpeed = 0
         self.lastUpdate = time.ticks_ms()
 
-    def _pwmValue(self, value):
-        duty = int((value / 255) * 65535)
-        return 65535 - duty if self.commonAnode else duty
+        # Time-based colour engine state
+        self.effect = None      # None, 'rgb', 'hsv', 'rainbow' or 'palette'
+        self.effectStart = 0
+        self.effectMs = 0
+        self.fromColour = (0, 0, 0)
+        self.deltaColour = (0, 0, 0)
+        self.palette = ()
+        self.effectLoop = True
+        self.saturation = 255
+        self.value = 255
+
+        # Scheduler task (set by Scheduler.register)
+        self.task = None
 
     def _applyColour(self, r, g, b):
         if self.pwmMode:
-            self.red.duty_u16(self._pwmValue(r))
-            self.green.duty_u16(self._pwmValue(g))
-            self.blue.duty_u16(self._pwmValue(b))
+            duty = self._duty
+            self.red.duty_u16(duty[r])
+            self.green.duty_u16(duty[g])
+            self.blue.duty_u16(duty[b])
         else:
             self.red.value(0 if (r == 0) ^ self.commonAnode else 1)
             self.green.value(0 if (g == 0) ^ self.commonAnode else 1)
             self.blue.value(0 if (b == 0) ^ self.commonAnode else 1)
 
+    def _resolve(self, colour):
+        """
+        Turn an (r, g, b) tuple, '#RRGGBB' code or colour name into
+        (r, g, b). Strings are parsed once and cached.
+        """
+        if not isinstance(colour, str):
+            return tuple(colour)
+        rgb = self._colourCache.get(colour)
+        if rgb is None:
+            key = colour.lower()
+            if key in self.NAMED_COLOURS:
+                rgb = self.NAMED_COLOURS[key]
+            elif key.startswith('#') or len(key) == 6:
+                hexCode = key.lstrip('#')
+                try:
+                    rgb = (int(hexCode[0:2], 16), int(hexCode[2:4], 16), int(hexCode[4:6], 16))
+                except ValueError:
+                    raise ValueError(f"Bad hex colour: {colour}")
+            else:
+                raise ValueError(f"Unknown colour name: {colour}")
+            _cachePut(self._colourCache, colour, rgb, self.CACHE_SIZE)
+        return rgb
+
+    def _setCached(self, colour):
+        """
+        Set a colour given as a name or hex code using its cached duty
+        triplet, so repeated calls do no parsing or conversion.
+        """
+        if not self.pwmMode:
+            self.setColour(*self._resolve(colour))
+            return
+        key = (colour, self.commonAnode)
+        duties = self._dutyCache.get(key)
+        rgb = self._resolve(colour)
+        if duties is None:
+            duties = (self._duty[rgb[0]], self._duty[rgb[1]], self._duty[rgb[2]])
+            _cachePut(self._dutyCache, key, duties, self.CACHE_SIZE)
+        self.effect = None
+        self.currentColour = list(rgb)
+        self.targetColour = list(rgb)
+        self.red.duty_u16(duties[0])
+        self.green.duty_u16(duties[1])
+        self.blue.duty_u16(duties[2])
+
     def setColour(self, r, g, b):
         """Immediately set LED colour."""
+        self.effect = None
         self.currentColour = [r, g, b]
         self.targetColour = [r, g, b]
         self._applyColour(r, g, b)
 
     def setHex(self, hexCode):
         """Set LED colour using HEX code (#RRGGBB)."""
-        hexCode = hexCode.lstrip('#')
-        r = int(hexCode[0:2], 16)
-        g = int(hexCode[2:4], 16)
-        b = int(hexCode[4:6], 16)
-        self.setColour(r, g, b)
+        if not hexCode.startswith('#'):
+            hexCode = '#' + hexCode
+        self._setCached(hexCode)
 
     def setNamedColour(self, name):
         """Set LED colour using predefined name."""
-        name = name.lower()
-        if name in self.NAMED_COLOURS:
-            self.setColour(*self.NAMED_COLOURS[name])
-        else:
+        if name.lower() not in self.NAMED_COLOURS:
             raise ValueError(f"Unknown colour name: {name}")
+        self._setCached(name)
 
     def fadeTo(self, r, g, b, speed=5):
         """
         Non-blocking fade to a new colour.
         Speed = how much the value changes per update (1–255).
         """
+        self.effect = None
         self.targetColour = [r, g, b]
         self.fadeSpeed = max(1, min(speed, 255))
+        if self.task:
+            self.task.wake()
+
+    def _startEffect(self, effect, ms):
+        self.effect = effect
+        self.effectStart = time.ticks_ms()
+        self.effectMs = max(1, ms)
+        if self.task:
+            self.task.wake()
+
+    def transition(self, colour, duration=1.0, space='rgb'):
+        """
+        Non-blocking fade that always takes `duration` seconds, with all
+        channels arriving together even if updates arrive late.
+        colour: (r, g, b), '#RRGGBB' or a colour name
+        space: 'rgb' (straight blend) or 'hsv' (around the hue wheel)
+        """
+        target = self._resolve(colour)
+        self.targetColour = list(target)
+        if space == 'hsv':
+            h0, s0, v0 = rgbToHsv(*self.currentColour)
+            h1, s1, v1 = rgbToHsv(*target)
+            dh = h1 - h0
+            if dh > 128:
+                dh -= 256
+            elif dh < -128:
+                dh += 256
+            self.fromColour = (h0, s0, v0)
+            self.deltaColour = (dh, s1 - s0, v1 - v0)
+        elif space == 'rgb':
+            c = self.currentColour
+            self.fromColour = (c[0], c[1], c[2])
+            self.deltaColour = (target[0] - c[0], target[1] - c[1], target[2] - c[2])
+        else:
+            raise ValueError(f"Unknown colour space: {space}")
+        self._startEffect(space, int(duration * 1000))
+
+    def rainbow(self, period=5.0, saturation=255, value=255):
+        """
+        Cycle continuously around the hue wheel once every `period` seconds.
+        """
+        self.saturation = saturation
+        self.value = value
+        self._startEffect('rainbow', int(period * 1000))
+
+    def blendPalette(self, colours, period=5.0, loop=True):
+        """
+        Blend through a list of colours, spending period/len(colours)
+        seconds on each step. Colours are resolved once here.
+        loop: wrap back to the first colour (False = stop on the last)
+        """
+        if not colours:
+            raise ValueError("Palette needs at least one colour")
+        self.palette = tuple(self._resolve(c) for c in colours)
+        self.effectLoop = loop
+        self._startEffect('palette', int(period * 1000))
 
     def update(self):
         """Call this repeatedly in your main loop to handle fades."""
         now = time.ticks_ms()
-        if time.ticks_diff(now, self.lastUpdate) < 20:  # ~50Hz
+        if time.ticks_diff(now, self.lastUpdate) < self.FADE_INTERVAL:
             return
         self.lastUpdate = now
+        self.tick()
+
+    def _effectTick(self):
+        """
+        Compute the colour for the running effect from elapsed time.
+        Integer-only; a late call lands where the effect should be.
+        """
+        elapsed = time.ticks_diff(time.ticks_ms(), self.effectStart)
+        ms = self.effectMs
+        c = self.currentColour
+        effect = self.effect
+
+        if effect == 'rainbow':
+            h = (elapsed % ms) * 256 // ms
+            c[0], c[1], c[2] = hsvToRgb(h, self.saturation, self.value)
+
+        elif effect == 'palette':
+            n = len(self.palette)
+            steps = n if self.effectLoop else n - 1
+            if steps <= 0 or (not self.effectLoop and elapsed >= ms):
+                c[0], c[1], c[2] = self.palette[-1]
+                self.effect = None
+            else:
+                pos = (elapsed % ms) * steps * 256 // ms
+                i = pos >> 8
+                f = pos & 255
+                a = self.palette[i]
+                b = self.palette[(i + 1) % n]
+                for k in range(3):
+                    c[k] = a[k] + ((b[k] - a[k]) * f >> 8)
+
+        else:
+            if elapsed >= ms:
+                t = self.targetColour
+                c[0], c[1], c[2] = t[0], t[1], t[2]
+                self.effect = None
+            else:
+                f = elapsed * 256 // ms
+                s, d = self.fromColour, self.deltaColour
+                if effect == 'hsv':
+                    c[0], c[1], c[2] = hsvToRgb((s[0] + (d[0] * f >> 8)) & 255,
+                                                s[1] + (d[1] * f >> 8),
+                                                s[2] + (d[2] * f >> 8))
+                else:
+                    c[0] = s[0] + (d[0] * f >> 8)
+                    c[1] = s[1] + (d[1] * f >> 8)
+                    c[2] = s[2] + (d[2] * f >> 8)
+
+        self._applyColour(c[0], c[1], c[2])
+        return self.FADE_INTERVAL if self.effect else None
+
+    def tick(self):
+        """
+        Advance the fade by one step. Called by update() or by a Scheduler.
+        Returns ms until the next step, or None once the target is reached.
+        """
+        if self.effect:
+            return self._effectTick()
 
         updated = False
         for i in range(3):
@@ -98,6 +327,9 @@ class RGBLED:
 
         if updated:
             self._applyColour(*self.currentColour)
+        if self.currentColour == self.targetColour:
+            return None
+        return self.FADE_INTERVAL
 
     def off(self):
         self.setColour(0, 0, 0)
\ No newline at end of file
@@ -0,0 +1,260 @@
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+import time
+
+from Libraries.servo import Servo
+from Libraries.led import LED
+from Libraries.RGBLED import RGBLED
+from Libraries.ultrasonic import UltrasonicSensor
+
+# ------------------- Shared Helper -------------------
+
+async def _drive(device, delay, done=None):
+    """
+    Call device.tick() each time it is due until it goes idle.
+    Sleeps on the event loop between steps instead of busy-polling.
+
+    Args:
+        device: Driver with a tick() method returning ms or None.
+        delay (int): ms until the first step (None = already idle).
+        done (function): Optional check that ends the motion early.
+    """
+    device._job = job = getattr(device, "_job", 0) + 1
+    due = time.ticks_ms()
+
+    while delay is not None:
+        due = time.ticks_add(due, delay)
+        wait = time.ticks_diff(due, time.ticks_ms())
+        if wait < 0:
+            # Fell behind: re-anchor instead of bursting to catch up
+            due = time.ticks_ms()
+            wait = 0
+        await asyncio.sleep(wait / 1000)
+
+        # A newer motion on the same device takes over
+        if device._job != job:
+            return
+        delay = device.tick()
+        if done is not None and done():
+            break
+
+
+class AsyncServo(Servo):
+    """
+    Servo whose motions are coroutines, for use with (u)asyncio.
+    Each step yields to the event loop, so no update() polling is needed.
+    """
+
+    async def sweepTo(self, angle, step=1, delay=0.02):
+        """
+        Move from the current angle to `angle` and return on arrival.
+
+        Args:
+            angle (int): Target angle in degrees.
+            step (int): Step size in degrees per update.
+            delay (float): Time between steps (seconds).
+        """
+        self.oscillating = False
+        self.target_angle = angle
+        self.step = step
+        self.delay = int(delay * 1000)
+        await _drive(self, 0)
+
+    async def oscillate(self, min_angle, max_angle, step=1, delay=0.02, cycles=None):
+        """
+        Oscillate between min_angle and max_angle.
+
+        Args:
+            min_angle (int): Lower bound angle.
+            max_angle (int): Upper bound angle.
+            step (int): Step size per update.
+            delay (float): Time between steps (seconds).
+            cycles (int): Number of full back-and-forth cycles
+                (None = until stopOscillation()).
+        """
+        Servo.oscillate(self, min_angle, max_angle, step, delay)
+        turns = [0, self.osc_direction]
+
+        def done():
+            if self.osc_direction != turns[1]:
+                turns[1] = self.osc_direction
+                turns[0] += 1
+            if not self.oscillating:
+                return True
+            if cycles is not None and turns[0] >= 2 * cycles:
+                self.oscillating = False
+                return True
+            return False
+
+        await _drive(self, self.delay, done)
+
+
+class AsyncLED(LED):
+    """
+    LED whose animations are coroutines, for use with (u)asyncio.
+    """
+
+    async def blink(self, delay=0.5, times=1):
+        """
+        Blink the LED and return when finished.
+
+        Args:
+            delay (float): Seconds per ON or OFF.
+            times (int): Number of full blinks (None = until on()/off()).
+        """
+        LED.blink(self, delay, times)
+        await _drive(self, self.blink_delay)
+
+    async def fade(self, minP=20, maxP=80, step=5, delay=0.05, cycles=1):
+        """
+        Fade between two brightness values and return when finished.
+
+        Args:
+            minP, maxP (int): Brightness range (0-100%).
+            step (int): Change per update.
+            delay (float): Time between brightness changes (seconds).
+            cycles (int): Number of up-and-down cycles (None = until on()/off()).
+        """
+        LED.fade(self, minP, maxP, step, delay)
+        turns = [0, self.direction]
+
+        def done():
+            if self.direction != turns[1]:
+                turns[1] = self.direction
+                turns[0] += 1
+            if cycles is not None and turns[0] >= 2 * cycles:
+                self.mode = None
+                return True
+            return False
+
+        await _drive(self, self.fade_delay, done)
+
+
+class AsyncRGBLED(RGBLED):
+    """
+    RGB LED whose fades are coroutines, for use with (u)asyncio.
+    """
+
+    async def fadeTo(self, r, g, b, speed=5):
+        """
+        Fade to a new colour and return once it is reached.
+        Speed = how much the value changes per step (1–255).
+        """
+        RGBLED.fadeTo(self, r, g, b, speed)
+        await _drive(self, 0)
+
+    async def transition(self, colour, duration=1.0, space='rgb'):
+        """
+        Fade to `colour` over exactly `duration` seconds and return when done.
+        """
+        RGBLED.transition(self, colour, duration, space)
+        await _drive(self, 0)
+
+
+class _Readings:
+    """
+    Async iterator returned by AsyncUltrasonicSensor.readings().
+    """
+
+    def __init__(self, sensor, count):
+        self.sensor = sensor
+        self.count = count
+        self.due = time.ticks_ms()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.count is not None:
+            if self.count <= 0:
+                raise StopAsyncIteration
+            self.count -= 1
+
+        wait = time.ticks_diff(self.due, time.ticks_ms())
+        if wait < 0:
+            self.due = time.ticks_ms()
+            wait = 0
+        await asyncio.sleep(wait / 1000)
+
+        self.due = time.ticks_add(self.due, self.sensor.tick())
+        return self.sensor.filteredCm()
+
+
+class AsyncUltrasonicSensor(UltrasonicSensor):
+    """
+    Ultrasonic sensor with awaitable readings, for use with (u)asyncio.
+    Uses interrupt echo capture by default; the blocking time_pulse_us()
+    would stall the event loop for up to the full echo timeout.
+    """
+
+    def __init__(self, trig, echo, max_cm=400, irq=True):
+        UltrasonicSensor.__init__(self, trig, echo, max_cm, irq)
+
+    def readings(self, count=None):
+        """
+        Return an async iterator of distances (cm), one per interval.
+        Distances are filtered if a FilterPipeline is attached.
+
+        Usage:
+            async for d in sensor.readings():
+                ...
+
+        Args:
+            count (int): Number of readings (None = endless).
+        """
+        return _Readings(self, count)
+
+    async def avg(self, count=3, gap=50):
+        """
+        Take multiple readings and return average, yielding between samples.
+        Failed readings are left out; returns -1 if none succeeded.
+
+        Args:
+            count (int): number of samples
+            gap (int): delay in ms between samples
+        """
+        total = 0
+        good = 0
+        for _ in range(count):
+            dist = self._readDistance()
+            if dist >= 0:
+                total += dist
+                good += 1
+            await asyncio.sleep(gap / 1000)
+        return total / good if good else -1
+
+
+async def showAsync(display):
+    """
+    Send an SSD1306 display's buffer one chunk per step, yielding to the
+    event loop in between, and return once the frame is on the panel.
+    Drawing the next frame into the buffer can start as soon as this
+    is called.
+
+    Args:
+        display: SSD1306_I2C or SSD1306_SPI (see set_async()).
+
+    Returns:
+        bool: False if the frame was skipped by the frame-rate cap or a
+        frame still being sent.
+    """
+    if not display.show_async():
+        return False
+    await _drive(display, 0)
+    return True
+
+
+async def runLCD(lcd, idle_ms=10):
+    """
+    Drain a queued LiquidCrystal.LCD (queued=True) forever, sleeping on
+    the event loop until each queued write is due.
+
+    Args:
+        lcd: LCD created with queued=True.
+        idle_ms (int): How often to check an empty queue.
+    """
+    while True:
+        delay = lcd.tick()
+        await asyncio.sleep((idle_ms if delay is None else delay) / 1000)
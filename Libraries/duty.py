@@ -0,0 +1,63 @@
+from array import array
+
+# Tables are shared between drivers with the same calibration
+_cache = {}
+
+def angleTable(min_us=500, max_us=2500, freq=50):
+    """
+    Build (or reuse) an angle -> duty_u16 table for a servo.
+
+    Args:
+        min_us (int): Pulse width (µs) at 0°.
+        max_us (int): Pulse width (µs) at 180°.
+        freq (int): PWM frequency in Hz.
+
+    Returns:
+        array('H'): 181 duty values, indexed by whole degrees.
+    """
+    key = ('angle', min_us, max_us, freq)
+    table = _cache.get(key)
+    if table is None:
+        period = 1_000_000 / freq
+        table = array('H', (int(((min_us + (max_us - min_us) * a / 180) / period) * 65535)
+                            for a in range(181)))
+        _cache[key] = table
+    return table
+
+def percentTable(gamma=1.0):
+    """
+    Build (or reuse) a brightness percent -> duty_u16 table.
+
+    Args:
+        gamma (float): Gamma correction exponent (1.0 = linear,
+            ~2.2 looks perceptually even on LEDs).
+
+    Returns:
+        array('H'): 101 duty values, indexed by percent (0-100).
+    """
+    key = ('percent', gamma)
+    table = _cache.get(key)
+    if table is None:
+        table = array('H', (int(65535 * (p / 100) ** gamma) for p in range(101)))
+        _cache[key] = table
+    return table
+
+def byteTable(invert=False):
+    """
+    Build (or reuse) an 8-bit colour value -> duty_u16 table.
+
+    Args:
+        invert (bool): True for common-anode LEDs (255 = fully off).
+
+    Returns:
+        array('H'): 256 duty values, indexed by colour value (0-255).
+    """
+    key = ('byte', invert)
+    table = _cache.get(key)
+    if table is None:
+        table = array('H', (int((v / 255) * 65535) for v in range(256)))
+        if invert:
+            for v in range(256):
+                table[v] = 65535 - table[v]
+        _cache[key] = table
+    return table
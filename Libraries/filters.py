@@ -0,0 +1,293 @@
+from array import array
+import time
+
+class SampleBuffer:
+    """
+    Preallocated ring buffer of timestamped samples.
+    Pushing never allocates; the oldest sample is overwritten when full.
+    """
+
+    def __init__(self, size=16):
+        """
+        Args:
+            size (int): Number of samples kept.
+        """
+        self.size = size
+        self.values = array('f', bytes(4 * size))
+        self.times = array('i', bytes(4 * size))
+        self.head = 0    # Index of the next write
+        self.count = 0
+
+    def push(self, value, t):
+        """
+        Store `value` taken at ticks_ms() time `t`.
+        """
+        self.values[self.head] = value
+        self.times[self.head] = t
+        self.head = (self.head + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+
+    def newest(self):
+        """
+        Return (t, value) of the most recent sample.
+        """
+        i = (self.head - 1) % self.size
+        return self.times[i], self.values[i]
+
+    def oldest(self):
+        """
+        Return (t, value) of the oldest sample still held.
+        """
+        i = (self.head - self.count) % self.size
+        return self.times[i], self.values[i]
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+
+# ------------------- Filter Stages -------------------
+# Each stage has push(value, t) -> value (or None to drop the sample)
+# and reset(). Stages keep preallocated state only.
+
+class OutlierReject:
+    """
+    Drops readings that jump too far from the last accepted one.
+    After `max_rejects` consecutive rejections the new level is accepted,
+    so a real change in distance is still followed.
+    """
+
+    def __init__(self, max_jump=50, max_rejects=3):
+        """
+        Args:
+            max_jump (float): Largest accepted change between samples (cm).
+            max_rejects (int): Consecutive rejections before re-locking.
+        """
+        self.max_jump = max_jump
+        self.max_rejects = max_rejects
+        self.reset()
+
+    def reset(self):
+        self.last = None
+        self.rejects = 0
+        self.rejected = 0   # Total samples dropped
+
+    def push(self, value, t):
+        if value <= 0:
+            self.rejected += 1
+            return None
+        if self.last is not None and abs(value - self.last) > self.max_jump:
+            self.rejects += 1
+            if self.rejects <= self.max_rejects:
+                self.rejected += 1
+                return None
+        self.rejects = 0
+        self.last = value
+        return value
+
+
+class RollingMedian:
+    """
+    Median of the last `window` samples.
+    Keeps a sorted copy of the window; the position of each insert and
+    removal is found by binary search, then the entries after it are
+    shifted along, so each push is O(n) in the window size. That is
+    cheap for the small windows used on noisy sensors.
+    """
+
+    def __init__(self, window=5):
+        """
+        Args:
+            window (int): Number of samples in the median window.
+        """
+        self.window = window
+        self.ring = array('f', bytes(4 * window))
+        self.sorted = array('f', bytes(4 * window))
+        self.reset()
+
+    def reset(self):
+        self.head = 0
+        self.count = 0
+
+    def _find(self, value, n):
+        """
+        Return the first index in sorted[:n] whose value is >= value.
+        """
+        lo, hi = 0, n
+        s = self.sorted
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            if s[mid] < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def push(self, value, t):
+        s = self.sorted
+        n = self.count
+
+        if n == self.window:
+            # Remove the sample falling out of the window
+            old = self.ring[self.head]
+            i = self._find(old, n)
+            while i < n - 1:
+                s[i] = s[i + 1]
+                i += 1
+            n -= 1
+
+        # Insert the new sample in order
+        i = self._find(value, n)
+        j = n
+        while j > i:
+            s[j] = s[j - 1]
+            j -= 1
+        s[i] = value
+        n += 1
+
+        self.ring[self.head] = value
+        self.head = (self.head + 1) % self.window
+        self.count = n
+
+        if n & 1:
+            return s[n >> 1]
+        return (s[(n >> 1) - 1] + s[n >> 1]) / 2
+
+
+class ExpSmooth:
+    """
+    Exponential smoothing: y += alpha * (x - y).
+    """
+
+    def __init__(self, alpha=0.3):
+        """
+        Args:
+            alpha (float): Weight of each new sample (0-1).
+        """
+        self.alpha = alpha
+        self.reset()
+
+    def reset(self):
+        self.value = None
+
+    def push(self, value, t):
+        if self.value is None:
+            self.value = value
+        else:
+            self.value += self.alpha * (value - self.value)
+        return self.value
+
+
+class Kalman1D:
+    """
+    Constant-velocity Kalman filter for a single distance.
+    Tracks position and velocity; the time step comes from the sample
+    timestamps so irregular reading rates are handled.
+    """
+
+    def __init__(self, q=50.0, r=4.0):
+        """
+        Args:
+            q (float): Process noise (acceleration variance, cm²/s⁴).
+            r (float): Measurement noise variance (cm²).
+        """
+        self.q = q
+        self.r = r
+        self.reset()
+
+    def reset(self):
+        self.x = None       # Position (cm)
+        self.velocity = 0.0  # Velocity (cm/s)
+        self.p00 = 1000.0
+        self.p01 = 0.0
+        self.p11 = 1000.0
+        self.t = 0
+
+    def push(self, value, t):
+        if self.x is None:
+            self.x = value
+            self.t = t
+            return value
+
+        dt = time.ticks_diff(t, self.t) / 1000
+        self.t = t
+
+        # Predict
+        if dt > 0:
+            self.x += self.velocity * dt
+            dt2 = dt * dt
+            q = self.q
+            self.p00 += dt * (2 * self.p01 + dt * self.p11) + q * dt2 * dt2 / 4
+            self.p01 += dt * self.p11 + q * dt2 * dt / 2
+            self.p11 += q * dt2
+
+        # Update
+        y = value - self.x
+        s = self.p00 + self.r
+        k0 = self.p00 / s
+        k1 = self.p01 / s
+        self.x += k0 * y
+        self.velocity += k1 * y
+        self.p11 -= k1 * self.p01
+        self.p01 -= k0 * self.p01
+        self.p00 -= k0 * self.p00
+        return self.x
+
+
+# ------------------- Pipeline -------------------
+
+class FilterPipeline:
+    """
+    Runs raw samples through a chain of filter stages and keeps the
+    filtered results in a SampleBuffer.
+    """
+
+    def __init__(self, stages=(), size=16):
+        """
+        Args:
+            stages (tuple): Filter stages applied in order.
+            size (int): Number of filtered samples kept for velocity.
+        """
+        self.stages = tuple(stages)
+        self.buffer = SampleBuffer(size)
+        self.value = None
+        self.dropped = 0
+
+    def push(self, value, t=None):
+        """
+        Feed one raw sample. Returns the filtered value, or None if a
+        stage dropped it.
+        """
+        if t is None:
+            t = time.ticks_ms()
+        for stage in self.stages:
+            value = stage.push(value, t)
+            if value is None:
+                self.dropped += 1
+                return None
+        self.value = value
+        self.buffer.push(value, t)
+        return value
+
+    def velocity(self):
+        """
+        Return the rate of change of the filtered value per second.
+        Uses a Kalman1D stage's estimate if present, otherwise the slope
+        across the buffered samples.
+        """
+        for stage in self.stages:
+            if isinstance(stage, Kalman1D):
+                return stage.velocity
+        if self.buffer.count < 2:
+            return 0.0
+        t1, v1 = self.buffer.newest()
+        t0, v0 = self.buffer.oldest()
+        dt = time.ticks_diff(t1, t0)
+        return (v1 - v0) * 1000 / dt if dt > 0 else 0.0
+
+    def reset(self):
+        for stage in self.stages:
+            stage.reset()
+        self.buffer.clear()
+        self.value = None
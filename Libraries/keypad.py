@@ -0,0 +1,141 @@
+from machine import Pin
+from array import array
+import time
+
+from Libraries.pushbutton import EventQueue
+
+# Keypad event types
+KEY_DOWN = 1
+KEY_UP = 2
+KEY_REPEAT = 3
+
+KEYS_4X4 = (
+    ('1', '2', '3', 'A'),
+    ('4', '5', '6', 'B'),
+    ('7', '8', '9', 'C'),
+    ('*', '0', '#', 'D'),
+)
+
+class Keypad:
+    """
+    Non-blocking matrix keypad driver for Raspberry Pi Pico.
+    Scans one row per tick, debounces every key independently without
+    sleeping, supports n-key rollover (with diodes) and key repeat, and
+    pushes events into a queue.
+    """
+
+    def __init__(self, row_pins=(6, 7, 8, 9), col_pins=(5, 4, 3, 2), keys=KEYS_4X4,
+                 scan_ms=2, debounce_ms=10, repeat_delay=500, repeat_ms=100, queue_size=16):
+        """
+        Initialize the keypad.
+
+        Args:
+            row_pins (tuple): GPIO pins driving the rows (outputs).
+            col_pins (tuple): GPIO pins reading the columns (pulled down).
+            keys (tuple): Key labels, one tuple per row.
+            scan_ms (int): Time between row scans.
+            debounce_ms (int): Time a key must be stable to register.
+            repeat_delay (int): Hold time before key repeat starts
+                (None = no repeat).
+            repeat_ms (int): Time between repeats while held.
+            queue_size (int): Events buffered before overflow.
+        """
+        self.rows = [Pin(p, Pin.OUT, value=0) for p in row_pins]
+        self.cols = [Pin(p, Pin.IN, Pin.PULL_DOWN) for p in col_pins]
+        self.keys = [k for row in keys for k in row]
+        self.scan_ms = scan_ms
+        self.debounce_ms = debounce_ms
+        self.repeat_delay = repeat_delay
+        self.repeat_ms = repeat_ms
+        self.queue = EventQueue(queue_size)
+
+        # Per-key debounce state, indexed row * columns + column
+        n = len(self.rows) * len(self.cols)
+        self.raw = bytearray(n)           # Last sampled level
+        self.stable = bytearray(n)        # Debounced level
+        self.changed = array('i', bytes(4 * n))      # ticks_ms() of last raw change
+        self.next_repeat = array('i', bytes(4 * n))  # ticks_ms() of next repeat
+
+        self.row = 0
+        self.last_update = time.ticks_ms()
+
+        # Scheduler task (set by Scheduler.register)
+        self.task = None
+
+    def update(self):
+        """
+        Call repeatedly in the main loop; scans one row when due.
+        """
+        now = time.ticks_ms()
+        if time.ticks_diff(now, self.last_update) < self.scan_ms:
+            return
+        self.last_update = now
+        self.tick()
+
+    def tick(self):
+        """
+        Scan the next row and queue any key changes.
+        Called by update() or directly by a Scheduler.
+
+        Returns:
+            int: ms until the next row scan.
+        """
+        r = self.row
+        row = self.rows[r]
+        cols = self.cols
+        ncols = len(cols)
+        raw, stable, changed = self.raw, self.stable, self.changed
+        now = time.ticks_ms()
+
+        row.high()
+        base = r * ncols
+        for c in range(ncols):
+            k = base + c
+            level = cols[c].value()
+            if level != raw[k]:
+                raw[k] = level
+                changed[k] = now
+            elif level != stable[k]:
+                if time.ticks_diff(now, changed[k]) >= self.debounce_ms:
+                    stable[k] = level
+                    if level:
+                        self.queue.push(KEY_DOWN, k, now)
+                        if self.repeat_delay is not None:
+                            self.next_repeat[k] = time.ticks_add(now, self.repeat_delay)
+                    else:
+                        self.queue.push(KEY_UP, k, now)
+            elif level and self.repeat_delay is not None:
+                if time.ticks_diff(now, self.next_repeat[k]) >= 0:
+                    self.next_repeat[k] = time.ticks_add(now, self.repeat_ms)
+                    self.queue.push(KEY_REPEAT, k, now)
+        row.low()
+
+        self.row = (r + 1) % len(self.rows)
+        return self.scan_ms
+
+    def getEvent(self):
+        """
+        Return the oldest event as (type, key_label, ticks_ms), or None.
+        """
+        event = self.queue.getEvent()
+        if event is None:
+            return None
+        return event[0], self.keys[event[1]], event[2]
+
+    def getKey(self):
+        """
+        Return the label of the next pressed or repeated key, or None.
+        Key-up events are skipped.
+        """
+        event = self.queue.getEvent()
+        while event is not None:
+            if event[0] != KEY_UP:
+                return self.keys[event[1]]
+            event = self.queue.getEvent()
+        return None
+
+    def held(self):
+        """
+        Return the labels of all keys currently held down.
+        """
+        return [self.keys[k] for k in range(len(self.stable)) if self.stable[k]]
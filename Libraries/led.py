@@ -1,13 +1,16 @@
 from machine import Pin, PWM
 import time
 
+from Libraries.duty import percentTable
+
 class LED:
-    def __init__(self, pin_id):
+    def __init__(self, pin_id, gamma=1.0):
         # Setup pin (digital output)
         self.pin = Pin(pin_id, Pin.OUT)
         self.pwm = None          # Will hold PWM object when needed
+        self._duty = percentTable(gamma)  # percent -> duty_u16 lookup
 
-        # Mode control (None, 'blink', or 'fade')
+        # Mode control (None, 'blink', 'fade' or 'timeline')
         self.mode = None
 
         # Timing control
@@ -27,6 +30,15 @@ class LED:
         self.brightness = 0      # Current brightness (0-100%)
         self.direction = 1       # 1 = increasing, -1 = decreasing
 
+        # Timeline settings (see Libraries/ledtimeline.py)
+        self.timeline = None
+        self.timeline_loop = True
+        self.timeline_start = 0
+        self._last_duty = -1
+
+        # Scheduler task (set by Scheduler.register)
+        self.task = None
+
     # -----------------------
     # BASIC CONTROL
     # -----------------------
@@ -49,12 +61,22 @@ class LED:
 
     def setBrightness(self, percent):
         """
-        Set LED brightness (0-100%).
+        Set LED brightness (0-100%, values outside are clamped).
         Enables PWM automatically if not already active.
         """
         self.enablePwm()
-        duty = int(65535 * (percent / 100))
-        self.pwm.duty_u16(duty)
+        percent = int(percent)
+        if percent < 0:
+            percent = 0
+        elif percent > 100:
+            percent = 100
+        self.pwm.duty_u16(self._duty[percent])
+
+    def setGamma(self, gamma):
+        """
+        Set the gamma correction used by setBrightness (1.0 = linear).
+        """
+        self._duty = percentTable(gamma)
 
     # -----------------------
     # NON-BLOCKING ANIMATIONS
@@ -71,6 +93,8 @@ class LED:
         self.blink_times = times
         self.blink_count = 0
         self.state = 0  # Start OFF
+        if self.task:
+            self.task.wake(self.blink_delay)
 
     def fade(self, minP=20, maxP=80, step=5, delay=0.05):
         """
@@ -88,6 +112,24 @@ class LED:
         self.direction = 1  # start increasing
         self.enablePwm()
         self.setBrightness(minP)
+        if self.task:
+            self.task.wake(self.fade_delay)
+
+    def play(self, timeline, loop=True):
+        """
+        Start playing a compiled Timeline (breathe, heartbeat, strobe,
+        keyframes) without blocking the main program.
+        timeline: Timeline from Libraries/ledtimeline.py
+        loop: repeat forever (False = stop on the last frame)
+        """
+        self.enablePwm()
+        self.mode = 'timeline'
+        self.timeline = timeline
+        self.timeline_loop = loop
+        self.timeline_start = time.ticks_ms()
+        self._last_duty = -1
+        if self.task:
+            self.task.wake()
 
     def update(self):
         """
@@ -96,35 +138,70 @@ class LED:
         """
         now = time.ticks_ms()
 
+        if self.mode == 'blink':
+            delay = self.blink_delay
+        elif self.mode == 'fade':
+            delay = self.fade_delay
+        elif self.mode == 'timeline':
+            delay = self.timeline.frame_ms
+        else:
+            return
+
+        if time.ticks_diff(now, self.last_update) >= delay:
+            self.last_update = now
+            self.tick()
+
+    def tick(self):
+        """
+        Advance the current animation by one step.
+        Called by update() or directly by a Scheduler when due.
+        Returns ms until the next step, or None when no animation is running.
+        """
         # --- Handle Blinking ---
         if self.mode == 'blink':
-            if time.ticks_diff(now, self.last_update) >= self.blink_delay:
-                self.last_update = now
-                # Toggle LED
-                self.state = not self.state
-                self.pin.value(self.state)
-
-                # Count completed blinks (2 toggles = 1 blink)
-                if self.blink_times is not None:
-                    self.blink_count += 0.5
-                    if self.blink_count >= self.blink_times:
-                        self.mode = None  # stop blinking
+            # Toggle LED
+            self.state = not self.state
+            self.pin.value(self.state)
+
+            # Count completed blinks (2 toggles = 1 blink)
+            if self.blink_times is not None:
+                self.blink_count += 0.5
+                if self.blink_count >= self.blink_times:
+                    self.mode = None  # stop blinking
+                    return None
+            return self.blink_delay
 
         # --- Handle Fading ---
         elif self.mode == 'fade':
-            if time.ticks_diff(now, self.last_update) >= self.fade_delay:
-                self.last_update = now
-
-                # Update brightness value
-                self.brightness += self.fade_step * self.direction
-
-                # Reverse direction at limits
-                if self.brightness >= self.fade_max:
-                    self.brightness = self.fade_max
-                    self.direction = -1
-                elif self.brightness <= self.fade_min:
-                    self.brightness = self.fade_min
-                    self.direction = 1
-
-                # Apply brightness
-                self.setBrightness(self.brightness)
\ No newline at end of file
+            # Update brightness value
+            self.brightness += self.fade_step * self.direction
+
+            # Reverse direction at limits
+            if self.brightness >= self.fade_max:
+                self.brightness = self.fade_max
+                self.direction = -1
+            elif self.brightness <= self.fade_min:
+                self.brightness = self.fade_min
+                self.direction = 1
+
+            # Apply brightness
+            self.setBrightness(self.brightness)
+            return self.fade_delay
+
+        # --- Handle Timeline ---
+        elif self.mode == 'timeline':
+            tl = self.timeline
+            frame = time.ticks_diff(time.ticks_ms(), self.timeline_start) // tl.frame_ms
+            if frame >= tl.frames:
+                if not self.timeline_loop:
+                    self.mode = None
+                    self.pwm.duty_u16(tl.duties[tl.frames - 1])
+                    return None
+                frame %= tl.frames
+            duty = tl.duties[frame]
+            if duty != self._last_duty:
+                self._last_duty = duty
+                self.pwm.duty_u16(duty)
+            return tl.frame_ms
+
+        return None
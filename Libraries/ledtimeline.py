@@ -0,0 +1,158 @@
+from array import array
+import time
+
+# Compiled timelines are shared between LEDs with the same pattern
+_cache = {}
+
+class Timeline:
+    """
+    A pattern compiled into a compact table of duty_u16 values, one per
+    frame. Playback is a table index plus one PWM write.
+    """
+
+    def __init__(self, duties, frame_ms):
+        """
+        Args:
+            duties (array): array('H') of gamma-corrected duty values.
+            frame_ms (int): Time each entry is shown for (ms).
+        """
+        self.duties = duties
+        self.frame_ms = frame_ms
+        self.frames = len(duties)
+        self.length_ms = self.frames * frame_ms
+
+# ------------------- Pattern Compilers -------------------
+
+def _duty(percent, gamma):
+    """
+    Brightness percent -> gamma-corrected duty_u16 (compile time only).
+    """
+    percent = max(0, min(100, percent))
+    return int(65535 * (percent / 100) ** gamma + 0.5)
+
+def keyframes(points, frame_ms=20, gamma=2.2):
+    """
+    Compile (time_ms, percent) keyframes into a Timeline.
+    Brightness is interpolated linearly between keyframes; the timeline
+    ends at the last keyframe's time.
+
+    Args:
+        points (list): (time_ms, percent) pairs in time order, starting at 0.
+        frame_ms (int): Playback resolution (ms per frame).
+        gamma (float): Gamma correction applied to every frame.
+    """
+    points = tuple(points)
+    key = ('keyframes', points, frame_ms, gamma)
+    timeline = _cache.get(key)
+    if timeline is not None:
+        return timeline
+
+    frames = max(1, points[-1][0] // frame_ms)
+    duties = array('H', bytes(2 * frames))
+    k = 0
+    for f in range(frames):
+        t = f * frame_ms
+        while k < len(points) - 2 and points[k + 1][0] <= t:
+            k += 1
+        t0, p0 = points[k]
+        t1, p1 = points[k + 1] if k + 1 < len(points) else points[k]
+        p = p0 if t1 == t0 else p0 + (p1 - p0) * (t - t0) / (t1 - t0)
+        duties[f] = _duty(p, gamma)
+
+    timeline = Timeline(duties, frame_ms)
+    _cache[key] = timeline
+    return timeline
+
+def breathe(period_ms=3000, low=0, high=100, frame_ms=20, gamma=2.2):
+    """
+    Smooth rise and fall between `low` and `high` percent.
+    """
+    half = period_ms // 2
+    return keyframes(((0, low), (half, high), (period_ms, low)), frame_ms, gamma)
+
+def heartbeat(period_ms=1200, level=100, frame_ms=20, gamma=2.2):
+    """
+    Double pulse ("lub-dub") followed by a rest.
+    """
+    return keyframes(((0, 0), (60, level), (160, 0), (240, level * 0.6),
+                      (360, 0), (period_ms, 0)), frame_ms, gamma)
+
+def strobe(on_ms=50, off_ms=450, level=100, frame_ms=10):
+    """
+    Hard on/off flashes.
+    """
+    on = max(frame_ms, on_ms)
+    return keyframes(((0, level), (on - 1, level), (on, 0),
+                      (on + off_ms, 0)), frame_ms, 1.0)
+
+# ------------------- Multi-LED Playback -------------------
+
+class LEDAnimator:
+    """
+    One ticker that plays timelines on many LED objects.
+    Each tick reads the time once, then does one table lookup and (if the
+    value changed) one duty_u16 write per LED.
+    """
+
+    def __init__(self):
+        self.leds = []
+        self.timelines = []
+        self.offsets = []     # Per-LED phase offset (ms)
+        self.last = []        # Last duty written per LED
+        self.frame_ms = 20
+        self.start = time.ticks_ms()
+        self.last_update = self.start
+
+        # Scheduler task (set by Scheduler.register)
+        self.task = None
+
+    def add(self, led, timeline, offset_ms=0):
+        """
+        Play `timeline` on `led`, looping, shifted by `offset_ms`.
+        """
+        led.enablePwm()
+        led.mode = None  # the animator owns this LED now
+        self.leds.append(led)
+        self.timelines.append(timeline)
+        self.offsets.append(offset_ms)
+        self.last.append(-1)
+        self.frame_ms = min(tl.frame_ms for tl in self.timelines)
+        if self.task:
+            self.task.wake()
+
+    def remove(self, led):
+        """
+        Stop animating `led` (it keeps its last brightness).
+        """
+        i = self.leds.index(led)
+        for lst in (self.leds, self.timelines, self.offsets, self.last):
+            lst.pop(i)
+
+    def update(self):
+        """
+        Call repeatedly in the main loop.
+        """
+        now = time.ticks_ms()
+        if time.ticks_diff(now, self.last_update) < self.frame_ms:
+            return
+        self.last_update = now
+        self.tick()
+
+    def tick(self):
+        """
+        Write the current frame of every LED.
+
+        Returns:
+            int or None: ms until the next frame, None with no LEDs.
+        """
+        if not self.leds:
+            return None
+        elapsed = time.ticks_diff(time.ticks_ms(), self.start)
+        leds, timelines, offsets, last = self.leds, self.timelines, self.offsets, self.last
+        for i in range(len(leds)):
+            tl = timelines[i]
+            duty = tl.duties[((elapsed + offsets[i]) // tl.frame_ms) % tl.frames]
+            if duty != last[i]:
+                last[i] = duty
+                leds[i].pwm.duty_u16(duty)
+        return self.frame_ms
@@ -1,6 +1,15 @@
-from machine import Pin
+from machine import Pin, disable_irq, enable_irq
+from array import array
 import time
 
+# Button event types
+PRESS = 1
+RELEASE = 2
+LONG_PRESS = 3
+DOUBLE_CLICK = 4
+
+EVENT_NAMES = ("", "press", "release", "long_press", "double_click")
+
 class Button:
     def __init__(self, pin_number, pull=Pin.PULL_UP, debounce_ms=200):
         self.pin = Pin(pin_number, Pin.IN, pull)
@@ -23,6 +32,220 @@ class Button:
     def getState(self):
         return self.state
     
+class EventQueue:
+    """
+    Preallocated ring buffer of button events.
+    Safe to fill from an interrupt handler: push() never allocates, and
+    head is only written by push() and tail only by getEvent(), so the
+    two sides never update the same value. One slot is kept empty to
+    tell a full queue from an empty one.
+    """
+
+    def __init__(self, size=32):
+        self.size = size
+        n = size + 1
+        self.types = array('B', bytes(n))
+        self.ids = array('B', bytes(n))
+        self.times = array('i', bytes(4 * n))
+        self.head = 0       # Next slot to write
+        self.tail = 0       # Next slot to read
+        self.overflows = 0  # Events dropped because the queue was full
+
+    def push(self, kind, button_id, t):
+        i = self.head
+        nxt = i + 1 if i < self.size else 0
+        if nxt == self.tail:
+            self.overflows += 1
+            return
+        self.types[i] = kind
+        self.ids[i] = button_id
+        self.times[i] = t
+        self.head = nxt
+
+    def getEvent(self):
+        """
+        Return the oldest event as (type, button_id, ticks_ms) or None.
+        """
+        i = self.tail
+        if i == self.head:
+            return None
+        event = (self.types[i], self.ids[i], self.times[i])
+        self.tail = i + 1 if i < self.size else 0
+        return event
+
+    def pending(self):
+        return (self.head - self.tail) % (self.size + 1)
+
+
+class IRQButton:
+    """
+    Interrupt-driven push button.
+    Edges are timestamped in Pin.irq, debounced, and turned into PRESS,
+    RELEASE and DOUBLE_CLICK events in an EventQueue. LONG_PRESS needs
+    tick() (or a ButtonGroup) to notice a button that is being held.
+    """
+
+    def __init__(self, pin_number, queue, button_id=0, pull=Pin.PULL_UP,
+                 debounce_ms=20, long_ms=600, double_ms=300):
+        """
+        Args:
+            pin_number (int): GPIO pin number (button to GND with PULL_UP).
+            queue (EventQueue): Where events are pushed.
+            button_id (int): Id reported with every event (0-255).
+            pull: Pin.PULL_UP (active low) or Pin.PULL_DOWN (active high).
+            debounce_ms (int): Edges closer together than this are bounce.
+            long_ms (int): Hold time that counts as a long press.
+            double_ms (int): Max gap between clicks for a double click.
+        """
+        self.pin = Pin(pin_number, Pin.IN, pull)
+        self.queue = queue
+        self.id = button_id
+        self.activeLow = pull == Pin.PULL_UP
+        self.debounce_ms = debounce_ms
+        self.long_ms = long_ms
+        self.double_ms = double_ms
+
+        # Debounce state machine
+        self.pressed = False
+        self.last_edge = time.ticks_add(time.ticks_ms(), -debounce_ms)
+        self.press_time = 0
+        self.release_time = 0
+        self.long_sent = False
+        self.clicks = 0
+        self.bounces = 0   # Edges ignored inside the debounce window
+        self.recheck = False  # An edge was ignored; re-read the pin in tick()
+        self.missed = 0    # Edges with no level change (lost or bounced pair)
+
+        # Scheduler task (set by Scheduler.register)
+        self.task = None
+
+        self.pin.irq(handler=self._edge, trigger=Pin.IRQ_RISING | Pin.IRQ_FALLING)
+
+    def _edge(self, pin):
+        """
+        Pin interrupt handler. Allocation-free.
+        """
+        now = time.ticks_ms()
+        if time.ticks_diff(now, self.last_edge) < self.debounce_ms:
+            self.bounces += 1
+            self.recheck = True
+            return
+        level = self._level()
+        if level == self.pressed:
+            self.missed += 1
+            return
+        self._change(level, now)
+
+    def _level(self):
+        return (self.pin.value() == 0) if self.activeLow else (self.pin.value() == 1)
+
+    def _change(self, level, now):
+        """
+        Record a debounced level change and queue its events.
+        """
+        self.last_edge = now
+        self.pressed = level
+
+        if level:
+            if self.clicks and time.ticks_diff(now, self.release_time) <= self.double_ms:
+                self.clicks = 0
+                self.queue.push(DOUBLE_CLICK, self.id, now)
+            else:
+                self.clicks = 1
+            self.press_time = now
+            self.long_sent = False
+            self.queue.push(PRESS, self.id, now)
+        else:
+            self.release_time = now
+            if self.long_sent:
+                self.clicks = 0  # a long press does not start a double click
+            self.queue.push(RELEASE, self.id, now)
+
+    def tick(self):
+        """
+        Report a long press once the button has been held long enough, and
+        re-read the pin once the debounce window after an ignored edge has
+        passed, so a bounce that hid the last change cannot latch the
+        wrong state.
+
+        Returns:
+            int or None: ms until tick() next has work, None if idle.
+        """
+        if self.recheck:
+            wait = self.debounce_ms - time.ticks_diff(time.ticks_ms(), self.last_edge)
+            if wait > 0:
+                return wait
+            state = disable_irq()
+            self.recheck = False
+            level = self._level()
+            if level != self.pressed:
+                self._change(level, time.ticks_ms())
+            enable_irq(state)
+
+        if not self.pressed or self.long_sent:
+            return None
+        held = time.ticks_diff(time.ticks_ms(), self.press_time)
+        if held >= self.long_ms:
+            self.long_sent = True
+            # push() also runs in the edge IRQ; keep it out while we write
+            state = disable_irq()
+            self.queue.push(LONG_PRESS, self.id, time.ticks_ms())
+            enable_irq(state)
+            return None
+        return self.long_ms - held
+
+    def getState(self):
+        return self.pressed
+
+
+class ButtonGroup:
+    """
+    Many IRQButtons sharing one EventQueue, with one tick() that checks
+    held buttons for long presses and re-reads buttons after bounces.
+    """
+
+    def __init__(self, size=32, poll_ms=10):
+        """
+        Args:
+            size (int): Event queue length.
+            poll_ms (int): How often tick() wants to run.
+        """
+        self.queue = EventQueue(size)
+        self.buttons = []
+        self.poll_ms = poll_ms
+
+        # Scheduler task (set by Scheduler.register)
+        self.task = None
+
+    def add(self, pin_number, **kwargs):
+        """
+        Create an IRQButton on `pin_number`; its id is its index.
+        """
+        button = IRQButton(pin_number, self.queue, len(self.buttons), **kwargs)
+        self.buttons.append(button)
+        return button
+
+    def tick(self):
+        for button in self.buttons:
+            button.tick()
+        return self.poll_ms
+
+    def update(self):
+        self.tick()
+
+    def getEvent(self):
+        return self.queue.getEvent()
+
+    def stats(self):
+        """
+        Return dict of overflowed, missed and bounced edge counts.
+        """
+        return {
+            'overflows': self.queue.overflows,
+            'missed': sum(b.missed for b in self.buttons),
+            'bounces': sum(b.bounces for b in self.buttons),
+        }
+
 #Basic test function    
 if __name__ == "__main__":
     button = Button(pin_number=16)          # Button on GPIO16
@@ -0,0 +1,190 @@
+import heapq
+import time
+
+class Task:
+    """
+    A single entry in the Scheduler's deadline queue.
+    Holds the callback, its interval and lateness statistics.
+    """
+
+    def __init__(self, scheduler, callback, interval):
+        self.scheduler = scheduler
+        self.callback = callback
+        self.interval = interval
+        self.due = 0
+        self.seq = 0
+        self.queued = False
+        self.cancelled = False
+
+        # Lateness statistics (ms)
+        self.fired = 0
+        self.late_ms = 0
+        self.max_late_ms = 0
+        self.total_late_ms = 0
+
+    def wake(self, delay=0):
+        """
+        Reschedule this task to run after `delay` ms.
+        Used by drivers when a new motion or animation is started.
+        """
+        if not self.cancelled:
+            self.scheduler._push(self, delay)
+
+    def cancel(self):
+        """
+        Remove this task from the scheduler.
+        """
+        self.cancelled = True
+        if self in self.scheduler.tasks:
+            self.scheduler.tasks.remove(self)
+
+    def avgLate(self):
+        """
+        Return the average lateness (ms) over all fired deadlines.
+        """
+        return self.total_late_ms / self.fired if self.fired else 0
+
+
+class Scheduler:
+    """
+    Deadline-driven cooperative scheduler for Raspberry Pi Pico.
+    Keeps one min-heap keyed on next-due time so only devices that are
+    due get woken, instead of polling every driver's update().
+    """
+
+    def __init__(self, clock=time):
+        """
+        Initialize the scheduler.
+
+        Args:
+            clock (module): Object providing ticks_ms(), ticks_diff() and
+                sleep_ms().
+                Defaults to the time module; pass a stand-in to benchmark
+                on a host machine.
+        """
+        self.clock = clock
+        self.tasks = []
+        self._queue = []
+        self._seq = 0
+
+        # Monotonic ms since start, so heap keys never wrap like ticks_ms()
+        self._last_ticks = clock.ticks_ms()
+        self._now = 0
+
+    # ------------------- Private Helpers -------------------
+
+    def _elapsed(self):
+        """
+        Advance and return the wrap-free millisecond counter.
+        """
+        ticks = self.clock.ticks_ms()
+        self._now += self.clock.ticks_diff(ticks, self._last_ticks)
+        self._last_ticks = ticks
+        return self._now
+
+    def _push(self, task, delay):
+        """
+        Queue `task` to run `delay` ms from now.
+        """
+        task.due = self._elapsed() + delay
+        task.queued = True
+        self._seq += 1
+        task.seq = self._seq
+        heapq.heappush(self._queue, (task.due, self._seq, task))
+
+    # ------------------- Public Methods -------------------
+
+    def every(self, interval, callback, delay=0):
+        """
+        Call `callback()` every `interval` ms.
+
+        Args:
+            interval (int): Period in milliseconds.
+            callback (function): Called with no arguments when due.
+            delay (int): Time before the first call (ms).
+
+        Returns:
+            Task: Handle used to cancel or inspect lateness stats.
+        """
+        task = Task(self, callback, interval)
+        self.tasks.append(task)
+        self._push(task, delay)
+        return task
+
+    def register(self, device):
+        """
+        Register a driver (Servo, LED, RGBLED, UltrasonicSensor).
+        The device's tick() is called when due and returns the delay
+        until it next needs servicing, or None while idle. Idle devices
+        are woken again by their own sweep(), blink(), fadeTo() etc.
+
+        Returns:
+            Task: Handle used to cancel or inspect lateness stats.
+        """
+        task = Task(self, device.tick, None)
+        device.task = task
+        self.tasks.append(task)
+        self._push(task, 0)
+        return task
+
+    def runOnce(self):
+        """
+        Run every task whose deadline has passed.
+
+        Returns:
+            int or None: ms until the next deadline, None if queue is empty.
+        """
+        queue = self._queue
+        now = self._elapsed()
+
+        while queue and queue[0][0] <= now:
+            due, seq, task = heapq.heappop(queue)
+
+            # Skip stale entries left behind by wake() or cancel()
+            if task.cancelled or seq != task.seq:
+                continue
+            task.queued = False
+
+            late = now - due
+            task.fired += 1
+            task.late_ms = late
+            task.total_late_ms += late
+            if late > task.max_late_ms:
+                task.max_late_ms = late
+
+            delay = task.callback()
+            if task.interval is not None:
+                delay = task.interval
+
+            if delay is not None and not task.queued:
+                delay = max(delay, 1)  # Never re-run within the same pass
+                # Keep periodic tasks on their original grid when on time
+                task.due = due + delay if late < delay else now + delay
+                task.queued = True
+                self._seq += 1
+                task.seq = self._seq
+                heapq.heappush(queue, (task.due, self._seq, task))
+
+        while queue and (queue[0][2].cancelled or queue[0][1] != queue[0][2].seq):
+            heapq.heappop(queue)
+        if not queue:
+            return None
+        return max(0, queue[0][0] - self._elapsed())
+
+    def run(self, idle=10):
+        """
+        Run forever, sleeping until the next deadline.
+
+        Args:
+            idle (int): Sleep time (ms) when no task is queued.
+        """
+        while True:
+            wait = self.runOnce()
+            self.clock.sleep_ms(idle if wait is None else wait)
+
+    def stats(self):
+        """
+        Return a list of (callback, fired, last_late_ms, max_late_ms)
+        for every registered task.
+        """
+        return [(t.callback, t.fired, t.late_ms, t.max_late_ms) for t in self.tasks]
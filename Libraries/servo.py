@@ -1,10 +1,60 @@
 from machine import Pin, PWM
+from array import array
 import time
 
+from Libraries.duty import angleTable
+
+# Motion profiles are stored as 0..PROFILE_ONE position fractions
+PROFILE_STEPS = 256
+PROFILE_ONE = 4096
+_profiles = {}
+
+def _profileTable(profile, accel):
+    """
+    Build (or reuse) a position-vs-time table for a motion profile.
+
+    Args:
+        profile (str): 'linear', 'trapezoid' or 'scurve'.
+        accel (float): Fraction of the move spent accelerating (and again
+            decelerating) for 'trapezoid', 0 < accel <= 0.5.
+
+    Returns:
+        array('H'): PROFILE_STEPS + 1 fractions scaled to PROFILE_ONE.
+    """
+    key = (profile, accel)
+    table = _profiles.get(key)
+    if table is not None:
+        return table
+
+    if profile == 'linear':
+        shape = lambda u: u
+    elif profile == 'trapezoid':
+        if not 0 < accel <= 0.5:
+            raise ValueError("accel must be in (0, 0.5]")
+        vmax = 1 / (1 - accel)
+
+        def shape(u):
+            if u < accel:
+                return vmax * u * u / (2 * accel)
+            if u <= 1 - accel:
+                return vmax * (u - accel / 2)
+            return 1 - vmax * (1 - u) * (1 - u) / (2 * accel)
+    elif profile == 'scurve':
+        # Minimum-jerk curve: continuous velocity and acceleration
+        shape = lambda u: u * u * u * (10 - 15 * u + 6 * u * u)
+    else:
+        raise ValueError(f"Unknown motion profile: {profile}")
+
+    table = array('H', (int(shape(i / PROFILE_STEPS) * PROFILE_ONE + 0.5)
+                        for i in range(PROFILE_STEPS + 1)))
+    _profiles[key] = table
+    return table
+
 class Servo:
     """
     A non-blocking Servo control class for Raspberry Pi Pico.
-    Supports direct angle control, sweeps, and continuous oscillation.
+    Supports direct angle control, sweeps, continuous oscillation and
+    time-based motion profiles.
     """
 
     def __init__(self, pin, min_us=500, max_us=2500, freq=50):
@@ -21,8 +71,10 @@ class Servo:
         self.pwm.freq(freq)
 
         # Calibration parameters
+        self.freq = freq
         self.min_us = min_us
         self.max_us = max_us
+        self._duty = angleTable(min_us, max_us, freq)
 
         # Internal state for non-blocking movement
         self.current_angle = 0
@@ -38,21 +90,39 @@ class Servo:
         self.osc_speed = 1
         self.osc_direction = 1
 
+        # Motion profile state (move_ms = 0 when no profile is running)
+        self.move_from = 0
+        self.move_start = 0
+        self.move_ms = 0
+        self.move_table = None
+        self._last_duty = -1
+
+        # Scheduler task (set by Scheduler.register)
+        self.task = None
+
     # ------------------- Core Helper -------------------
 
     def _angleToDuty(self, angle):
         """
         Convert angle to duty cycle (16-bit value for Pico).
+        Uses the lookup table built at calibration time.
         """
-        us = self.min_us + (self.max_us - self.min_us) * angle / 180
-        duty_u16 = int((us / 20000) * 65535)  # 20ms period = 50Hz
-        return duty_u16
+        angle = int(angle)
+        if angle < 0:
+            angle = 0
+        elif angle > 180:
+            angle = 180
+        return self._duty[angle]
 
     def _applyAngle(self, angle):
         """
         Apply a given angle immediately to servo.
+        Skips the PWM write if the duty value has not changed.
         """
-        self.pwm.duty_u16(self._angleToDuty(angle))
+        duty = self._angleToDuty(angle)
+        if duty != self._last_duty:
+            self._last_duty = duty
+            self.pwm.duty_u16(duty)
 
     # ------------------- Public Methods -------------------
 
@@ -60,6 +130,7 @@ class Servo:
         """
         Immediately move servo to specific angle.
         """
+        self.move_ms = 0
         self.current_angle = angle
         self._applyAngle(angle)
 
@@ -73,6 +144,7 @@ class Servo:
             step (int): Step size in degrees per update.
             delay (float): Time between steps (seconds).
         """
+        self.move_ms = 0
         self.current_angle = start_angle
         self.target_angle = end_angle
         self.step = step
@@ -80,6 +152,8 @@ class Servo:
         self.last_update = time.ticks_ms()
 
         self._applyAngle(self.current_angle)
+        if self.task:
+            self.task.wake(self.delay)
 
     def oscillate(self, min_angle, max_angle, step=1, delay=0.02):
         """
@@ -91,6 +165,7 @@ class Servo:
             step (int): Step size per update.
             delay (float): Time between steps (seconds).
         """
+        self.move_ms = 0
         self.oscillating = True
         self.osc_min = min_angle
         self.osc_max = max_angle
@@ -99,6 +174,44 @@ class Servo:
         self.current_angle = min_angle
         self.osc_direction = 1
         self._applyAngle(self.current_angle)
+        if self.task:
+            self.task.wake(self.delay)
+
+    def moveTo(self, angle, duration, profile='trapezoid', accel=0.25):
+        """
+        Start a time-based move from the current angle to `angle`.
+        Position is computed from elapsed time, so a late update()
+        jumps straight to where the servo should be.
+
+        Args:
+            angle (int): Target angle in degrees.
+            duration (float): Total move time (seconds).
+            profile (str): 'trapezoid', 'scurve' or 'linear'.
+            accel (float): Fraction of the move spent accelerating and
+                decelerating ('trapezoid' only).
+
+        Returns:
+            int: ticks_ms() value at which the move finishes.
+        """
+        self.oscillating = False
+        self.move_table = _profileTable(profile, accel)
+        self.move_from = self.current_angle
+        self.target_angle = angle
+        self.move_ms = max(1, int(duration * 1000))
+        self.move_start = time.ticks_ms()
+        self.delay = 1000 // self.freq  # one PWM frame per step
+        if self.task:
+            self.task.wake()
+        return time.ticks_add(self.move_start, self.move_ms)
+
+    def timeRemaining(self):
+        """
+        Return ms left in the current moveTo(), 0 when none is running.
+        """
+        if not self.move_ms:
+            return 0
+        elapsed = time.ticks_diff(time.ticks_ms(), self.move_start)
+        return max(0, self.move_ms - elapsed)
 
     def stopOscillation(self):
         """
@@ -114,12 +227,14 @@ class Servo:
             self.min_us = min_us
         if max_us:
             self.max_us = max_us
+        self._duty = angleTable(self.min_us, self.max_us, self.freq)
 
     def release(self):
         """
         Disable PWM signal, allowing servo to relax.
         """
         self.pwm.deinit()
+        self._last_duty = -1
 
     # ------------------- Non-blocking Update -------------------
 
@@ -135,7 +250,16 @@ class Servo:
             return
 
         self.last_update = now
+        self.tick()
+
+    def tick(self):
+        """
+        Advance sweep or oscillation by one step.
+        Called by update() or directly by a Scheduler when due.
 
+        Returns:
+            int or None: ms until the next step, None when the servo is idle.
+        """
         # Handle oscillation
         if self.oscillating:
             self.current_angle += self.osc_speed * self.osc_direction
@@ -149,7 +273,21 @@ class Servo:
                 self.osc_direction = 1
 
             self._applyAngle(self.current_angle)
-            return
+            return self.delay
+
+        # Handle motion profile
+        if self.move_ms:
+            elapsed = time.ticks_diff(time.ticks_ms(), self.move_start)
+            if elapsed >= self.move_ms:
+                self.move_ms = 0
+                self.current_angle = self.target_angle
+                self._applyAngle(self.current_angle)
+                return None
+            frac = self.move_table[elapsed * PROFILE_STEPS // self.move_ms]
+            delta = self.target_angle - self.move_from
+            self.current_angle = self.move_from + (delta * frac) // PROFILE_ONE
+            self._applyAngle(self.current_angle)
+            return self.delay
 
         # Handle single sweep
         if self.current_angle < self.target_angle:
@@ -161,4 +299,218 @@ class Servo:
             if self.current_angle < self.target_angle:
                 self.current_angle = self.target_angle
 
-        self._applyAngle(self.current_angle)
\ No newline at end of file
+        self._applyAngle(self.current_angle)
+        if self.current_angle == self.target_angle:
+            return None
+        return self.delay
+
+
+class ServoGroup:
+    """
+    Drives many Servo objects as one unit.
+    Plans coordinated moves so every joint arrives at the same time and
+    updates all channels in one pass with a single time read.
+    """
+
+    def __init__(self, servos):
+        """
+        Initialize the group.
+
+        Args:
+            servos (list): Servo objects to control together.
+        """
+        self.servos = list(servos)
+        n = len(self.servos)
+        self.pwms = [s.pwm for s in self.servos]
+        self.tables = None
+        self._refreshTables()
+
+        # Array-backed joint state
+        self.angles = array('h', (int(s.current_angle) for s in self.servos))
+        self.start = array('h', self.angles)
+        self.delta = array('h', bytes(2 * n))
+        self.duties = array('H', (max(0, s._last_duty) for s in self.servos))
+
+        # Shared motion profile state
+        self.move_start = 0
+        self.move_ms = 0
+        self.move_table = None
+        self.delay = 1000 // self.servos[0].freq if n else 20
+        self.last_update = time.ticks_ms()
+
+        # Per-tick cost statistics
+        self.resetStats()
+
+        # Scheduler task (set by Scheduler.register)
+        self.task = None
+
+    # ------------------- Private Helpers -------------------
+
+    def _write(self, i, angle):
+        """
+        Write one channel if its duty value changed.
+        """
+        duty = self.tables[i][angle]
+        if duty != self.duties[i]:
+            self.duties[i] = duty
+            self.pwms[i].duty_u16(duty)
+            self.writes += 1
+
+    def _refreshTables(self):
+        """
+        Pick up duty tables replaced by Servo.calibrate().
+        """
+        tables = self.tables
+        for i, s in enumerate(self.servos):
+            if tables is None or tables[i] is not s._duty:
+                self.tables = [s._duty for s in self.servos]
+                return
+
+    def _readServos(self):
+        """
+        Pick up positions and duties of servos moved directly since the
+        group last drove them.
+        """
+        angles, duties = self.angles, self.duties
+        for i, s in enumerate(self.servos):
+            angles[i] = max(0, min(180, int(s.current_angle)))
+            duties[i] = max(0, s._last_duty)
+
+    def _sync(self):
+        """
+        Copy group state back onto the Servo objects.
+        """
+        for i, s in enumerate(self.servos):
+            s.current_angle = self.angles[i]
+            s.target_angle = self.angles[i]
+            s._last_duty = self.duties[i]
+            s.move_ms = 0
+            s.oscillating = False
+
+    # ------------------- Public Methods -------------------
+
+    def setAngles(self, angles):
+        """
+        Immediately move every servo to the given angles.
+        """
+        self.move_ms = 0
+        self._refreshTables()
+        self._readServos()
+        for i, a in enumerate(angles):
+            a = max(0, min(180, int(a)))
+            self.angles[i] = a
+            self._write(i, a)
+        self._sync()
+
+    def moveTo(self, angles, duration=None, speed=60, profile='trapezoid', accel=0.25):
+        """
+        Start a coordinated move so all servos arrive together.
+
+        Args:
+            angles (list): Target angle for each servo, in group order
+                (one per servo).
+            duration (float): Move time in seconds. If None, it is derived
+                from `speed` and the joint with the furthest to travel.
+            speed (float): Average speed (degrees per second) of the joint
+                with the furthest to travel, used when duration is None.
+                Must be positive.
+            profile (str): 'trapezoid', 'scurve' or 'linear'.
+            accel (float): Fraction of the move spent accelerating and
+                decelerating ('trapezoid' only).
+
+        Returns:
+            int: ticks_ms() value at which the move finishes.
+        """
+        if len(angles) != len(self.servos):
+            raise ValueError("Expected %d angles, got %d" % (len(self.servos), len(angles)))
+        if duration is None and speed <= 0:
+            raise ValueError("speed must be positive")
+        self._refreshTables()
+        self._readServos()
+
+        furthest = 0
+        for i, a in enumerate(angles):
+            a = max(0, min(180, int(a)))
+            self.start[i] = self.angles[i]
+            self.delta[i] = a - self.angles[i]
+            furthest = max(furthest, abs(self.delta[i]))
+
+        if duration is None:
+            duration = furthest / speed
+        self.move_table = _profileTable(profile, accel)
+        self.move_ms = max(1, int(duration * 1000))
+        self.move_start = time.ticks_ms()
+        if self.task:
+            self.task.wake()
+        return time.ticks_add(self.move_start, self.move_ms)
+
+    def update(self):
+        """
+        Must be called in a loop while a group move is running.
+        """
+        now = time.ticks_ms()
+        if time.ticks_diff(now, self.last_update) < self.delay:
+            return
+        self.last_update = now
+        self.tick()
+
+    def tick(self):
+        """
+        Advance every channel along the shared profile in one pass.
+
+        Returns:
+            int or None: ms until the next step, None when the group is idle.
+        """
+        if not self.move_ms:
+            return None
+        t0 = time.ticks_us()
+
+        elapsed = time.ticks_diff(time.ticks_ms(), self.move_start)
+        if elapsed >= self.move_ms:
+            frac = PROFILE_ONE
+        else:
+            frac = self.move_table[elapsed * PROFILE_STEPS // self.move_ms]
+
+        angles, start, delta = self.angles, self.start, self.delta
+        duties, tables, pwms = self.duties, self.tables, self.pwms
+        for i in range(len(angles)):
+            a = start[i] + (delta[i] * frac) // PROFILE_ONE
+            angles[i] = a
+            duty = tables[i][a]
+            if duty != duties[i]:
+                duties[i] = duty
+                pwms[i].duty_u16(duty)
+                self.writes += 1
+
+        cost = time.ticks_diff(time.ticks_us(), t0)
+        self.ticks += 1
+        self.total_us += cost
+        if cost > self.max_us:
+            self.max_us = cost
+
+        if elapsed >= self.move_ms:
+            self.move_ms = 0
+            self._sync()
+            return None
+        return self.delay
+
+    def stats(self):
+        """
+        Return per-tick cost statistics as a dict
+        (ticks, avg_us, max_us, writes).
+        """
+        return {
+            'ticks': self.ticks,
+            'avg_us': self.total_us / self.ticks if self.ticks else 0,
+            'max_us': self.max_us,
+            'writes': self.writes,
+        }
+
+    def resetStats(self):
+        """
+        Clear the per-tick cost statistics.
+        """
+        self.ticks = 0
+        self.total_us = 0
+        self.max_us = 0
+        self.writes = 0
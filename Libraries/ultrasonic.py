@@ -7,7 +7,9 @@ class UltrasonicSensor:
     Designed for short method calls and continuous updates.
     """
 
-    def __init__(self, trig, echo, max_cm=400):
+    ECHO_SETUP_US = 1000  # Allowance between trigger and echo start (µs)
+
+    def __init__(self, trig, echo, max_cm=400, irq=False):
         """
         Initialize ultrasonic sensor pins.
         
@@ -15,22 +17,61 @@ class UltrasonicSensor:
             trig (int): GPIO pin number for Trigger.
             echo (int): GPIO pin number for Echo.
             max_cm (int): Max measurable distance (default 400 cm).
+            irq (bool): Time the echo with pin interrupts instead of the
+                blocking time_pulse_us(), so update() never waits.
         """
         self.trig = Pin(trig, Pin.OUT)
         self.echo = Pin(echo, Pin.IN)
-        self.max_time = int((max_cm / 340) * 2 * 1_000_000)  # Max echo timeout (µs)
+        self.max_time = int(max_cm * 2 / 0.0343)  # Max echo timeout (µs), round trip
 
         # Internal state for non-blocking update
         self._distance = 0
         self._last_read = time.ticks_ms()
         self._interval = 100  # default 100ms between updates
 
+        # Interrupt-driven echo capture state
+        self.irqMode = irq
+        self._pending = False   # Trigger sent, waiting for the echo
+        self._ready = False     # Falling edge captured by the IRQ
+        self._fired = 0         # ticks_us() when the trigger was sent
+        self._rise = 0          # ticks_us() of the echo rising edge
+        self._fall = 0          # ticks_us() of the echo falling edge
+        self.echo_timeout = self.max_time  # Echo window (µs), may be narrowed
+        self.timeouts = 0       # Pings without a usable echo
+        self.reading_count = 0  # Good readings taken
+
+        # Optional streaming filter (see Libraries/filters.py)
+        self.filter = None
+
+        # Adaptive ranging rate state
+        self.adaptive = False
+        self.min_interval = 20
+        self.max_interval = 500
+        self.threshold = None   # cm, as used by near()
+        self.step_cm = 2        # movement allowed between readings
+        self.still_cms = 1      # speeds below this count as a stable scene
+        self.pings = 0          # Trigger pulses sent
+        self._prev_dist = 0
+        self._prev_t = 0
+        self._raw_velocity = 0
+        self._stats_t = time.ticks_ms()
+        self._stats_pings = 0
+        self._stats_reading_count = 0
+
+        if irq:
+            self.echo.irq(handler=self._echoIrq,
+                          trigger=Pin.IRQ_RISING | Pin.IRQ_FALLING)
+
+        # Scheduler task (set by Scheduler.register)
+        self.task = None
+
     # ------------------- Private Helpers -------------------
 
     def _pulse(self):
         """
         Send a 10µs trigger pulse.
         """
+        self.pings += 1
         self.trig.low()
         time.sleep_us(2)
         self.trig.high()
@@ -53,6 +94,89 @@ class UltrasonicSensor:
         else:
             return -1  # Indicate no echo
 
+    def _store(self, dist):
+        """
+        Cache a good reading and feed it to the filter, if any.
+        """
+        now = time.ticks_ms()
+        if self.reading_count:
+            dt = time.ticks_diff(now, self._prev_t)
+            if dt > 0:
+                self._raw_velocity = (dist - self._prev_dist) * 1000 / dt
+        self._prev_dist = dist
+        self._prev_t = now
+
+        self._distance = dist  # Update cached distance
+        self.reading_count += 1
+        if self.filter:
+            self.filter.push(dist, now)
+
+    def _adaptInterval(self):
+        """
+        Pick the next ranging interval from target speed and proximity to
+        the threshold. Speeds up at once, backs off gradually.
+        """
+        target = self.max_interval
+        speed = abs(self.velocity())
+        if speed > self.still_cms:
+            target = min(target, int(self.step_cm * 1000 / speed))
+
+        if self.threshold is not None and self._distance > 0:
+            gap = self._distance - self.threshold
+            if gap <= 0:
+                target = self.min_interval
+            elif self.velocity() < -self.still_cms:
+                # Aim for several readings before the threshold is crossed
+                target = min(target, int(gap * 1000 / -self.velocity() / 4))
+
+        target = max(self.min_interval, target)
+        if target > self._interval:
+            target = min(target, self._interval * 3 // 2 + 1)
+        self._interval = target
+
+    def _echoIrq(self, pin):
+        """
+        Echo pin interrupt handler: timestamp the rising and falling edges.
+        Kept allocation-free so it is safe to run in IRQ context.
+        """
+        now = time.ticks_us()
+        if not self._pending:
+            return
+        if pin.value():
+            self._rise = now
+        else:
+            self._fall = now
+            self._ready = True
+
+    def _startPing(self):
+        """
+        Send a trigger pulse and arm the echo interrupt (IRQ mode).
+        """
+        self._ready = False
+        self._rise = 0
+        self._pending = True
+        self._fired = time.ticks_us()
+        self._pulse()
+
+    def _harvest(self):
+        """
+        Collect a finished IRQ measurement, or give up after the echo
+        timeout. Constant-time; never waits on the pin.
+        """
+        if not self._pending:
+            return
+        if self._ready:
+            self._pending = False
+            if self._rise:
+                duration = time.ticks_diff(self._fall, self._rise)
+                if 0 < duration <= self.max_time:
+                    self._store((duration * 0.0343) / 2)
+                    return
+            self.timeouts += 1
+        elif time.ticks_diff(time.ticks_us(), self._fired) > self.echo_timeout + self.ECHO_SETUP_US:
+            self._pending = False
+            self.timeouts += 1
+
     # ------------------- Public Methods -------------------
 
     def update(self):
@@ -60,12 +184,36 @@ class UltrasonicSensor:
         Non-blocking periodic distance measurement.
         Call this in your main loop to refresh `_distance`.
         """
+        if self.irqMode:
+            self._harvest()
         now = time.ticks_ms()
         if time.ticks_diff(now, self._last_read) >= self._interval:
             self._last_read = now
-            dist = self._readDistance()
-            if dist >= 0:
-                self._distance = dist  # Update cached distance
+            self.tick()
+
+    def tick(self):
+        """
+        Take one reading and refresh the cached distance.
+        Called by update() or directly by a Scheduler when due.
+        In IRQ mode this harvests the previous echo and sends a new ping.
+
+        Returns:
+            int: ms until the next reading is due.
+        """
+        if self.irqMode:
+            self._harvest()
+            if self.adaptive:
+                self._adaptInterval()
+            if not self._pending:
+                self._startPing()
+            return self._interval
+
+        dist = self._readDistance()
+        if dist >= 0:
+            self._store(dist)
+        if self.adaptive:
+            self._adaptInterval()
+        return self._interval
 
     def distCm(self):
         """
@@ -82,16 +230,46 @@ class UltrasonicSensor:
     def avg(self, count=3, gap=50):
         """
         Take multiple readings and return average (blocking, for calibration).
+        Failed readings are left out; returns -1 if none succeeded.
         
         Args:
             count (int): number of samples
             gap (int): delay in ms between samples
         """
-        readings = []
+        total = 0
+        good = 0
         for _ in range(count):
-            readings.append(self._readDistance())
+            dist = self._readDistance()
+            if dist >= 0:
+                total += dist
+                good += 1
             time.sleep_ms(gap)
-        return sum(readings) / len(readings)
+        return total / good if good else -1
+
+    def setFilter(self, pipeline):
+        """
+        Attach a FilterPipeline (or None to remove it).
+        Every good reading is pushed through it without blocking.
+        """
+        self.filter = pipeline
+
+    def filteredCm(self):
+        """
+        Return the filtered distance in cm (raw distance if no filter).
+        """
+        if self.filter and self.filter.value is not None:
+            return self.filter.value
+        return self._distance
+
+    def velocity(self):
+        """
+        Return the rate of change of distance in cm/s (negative =
+        approaching). Filtered if a filter is attached, otherwise taken
+        from the last two readings.
+        """
+        if self.filter:
+            return self.filter.velocity()
+        return self._raw_velocity
 
     def near(self, threshold):
         """
@@ -102,5 +280,198 @@ class UltrasonicSensor:
     def setInterval(self, ms):
         """
         Set refresh interval for non-blocking updates.
+        Turns adaptive ranging off.
+        """
+        self.adaptive = False
+        self._interval = ms
+
+    def setAdaptive(self, min_ms=20, max_ms=500, threshold=None, step_cm=2, still_cms=1):
+        """
+        Let the refresh interval follow the scene: faster while the target
+        moves or approaches `threshold`, slower while it is stable.
+
+        Args:
+            min_ms (int): Shortest interval between readings.
+            max_ms (int): Longest interval for a static scene.
+            threshold (float): Distance (cm) watched with near(), or None.
+            step_cm (float): Target movement allowed between readings.
+            still_cms (float): Speeds below this (cm/s) count as stable.
+        """
+        self.adaptive = True
+        self.min_interval = min_ms
+        self.max_interval = max_ms
+        self.threshold = threshold
+        self.step_cm = step_cm
+        self.still_cms = still_cms
+        self._interval = max(min_ms, min(self._interval, max_ms))
+        self.resetStats()
+
+    def rateStats(self):
+        """
+        Return achieved ranging statistics since resetStats() as a dict
+        (interval, pings, readings, rate) with rate in readings per second.
+        """
+        elapsed = time.ticks_diff(time.ticks_ms(), self._stats_t)
+        readings = self.reading_count - self._stats_reading_count
+        return {
+            'interval': self._interval,
+            'pings': self.pings - self._stats_pings,
+            'readings': readings,
+            'rate': readings * 1000 / elapsed if elapsed > 0 else 0,
+        }
+
+    def resetStats(self):
+        """
+        Restart the rateStats() counters.
+        """
+        self._stats_t = time.ticks_ms()
+        self._stats_pings = self.pings
+        self._stats_reading_count = self.reading_count
+
+class UltrasonicArray:
+    """
+    Ranges several IRQ-mode UltrasonicSensors from one Pico.
+    Sensors are planned into trigger slots: sensors facing away from each
+    other fire together, neighbours are staggered into different slots to
+    avoid crosstalk. Each sensor's echo window adapts to its recent range.
+    """
+
+    def __init__(self, sensors, headings=None, spread=60, guard_ms=2, margin=1.5):
+        """
+        Initialize the array.
+
+        Args:
+            sensors (list): UltrasonicSensor objects created with irq=True.
+            headings (list): Facing direction of each sensor in degrees.
+                None = assume every sensor can hear every other one.
+            spread (int): Sensors closer than this many degrees apart
+                never fire in the same slot.
+            guard_ms (int): Quiet time after each slot for stray echoes.
+            margin (float): Echo window as a multiple of the last range
+                (None = always wait the full max_cm window).
+        """
+        for s in sensors:
+            if not s.irqMode:
+                raise ValueError("UltrasonicArray needs sensors created with irq=True")
+        self.sensors = list(sensors)
+        self.guard_ms = guard_ms
+        self.margin = margin
+        self.slots = self._plan(headings, spread)
+
+        # Slot sequencing state
+        self._slot = 0
+        self._active = False
+        self._next = time.ticks_ms()
+
+        self.resetStats()
+
+        # Scheduler task (set by Scheduler.register)
+        self.task = None
+
+    # ------------------- Private Helpers -------------------
+
+    def _plan(self, headings, spread):
+        """
+        Greedily pack sensors into slots with no two neighbours together.
+        """
+        n = len(self.sensors)
+        if headings is None:
+            return [[i] for i in range(n)]
+
+        slots = []
+        for i in range(n):
+            for slot in slots:
+                clash = False
+                for j in slot:
+                    gap = abs(headings[i] - headings[j]) % 360
+                    if min(gap, 360 - gap) < spread:
+                        clash = True
+                        break
+                if not clash:
+                    slot.append(i)
+                    break
+            else:
+                slots.append([i])
+        return slots
+
+    def _adapt(self, s, ok):
+        """
+        Narrow a sensor's echo window around its last range, or reopen
+        it fully after a miss.
+        """
+        if self.margin is None or not ok:
+            s.echo_timeout = s.max_time
+        else:
+            s.echo_timeout = min(s.max_time, int(s._distance * self.margin * 2 / 0.0343))
+
+    def _fire(self):
+        """
+        Trigger every sensor in the current slot.
+        """
+        for i in self.slots[self._slot]:
+            s = self.sensors[i]
+            self._before[i] = s.reading_count
+            s._startPing()
+        self._active = True
+
+    # ------------------- Public Methods -------------------
+
+    def update(self):
+        """
+        Call repeatedly in the main loop. Constant-time: harvests finished
+        echoes and fires the next slot once the current one is done.
+        """
+        self.tick()
+
+    def tick(self):
+        """
+        Advance the slot sequence. Called by update() or by a Scheduler.
+
+        Returns:
+            int: ms until the array next needs servicing.
+        """
+        if self._active:
+            busy = False
+            for i in self.slots[self._slot]:
+                s = self.sensors[i]
+                s._harvest()
+                busy = busy or s._pending
+            if busy:
+                return 1
+            for i in self.slots[self._slot]:
+                s = self.sensors[i]
+                self._adapt(s, s.reading_count != self._before[i])
+            self._active = False
+            self._slot = (self._slot + 1) % len(self.slots)
+            self._next = time.ticks_add(time.ticks_ms(), self.guard_ms)
+
+        wait = time.ticks_diff(self._next, time.ticks_ms())
+        if wait > 0:
+            return wait
+        self._fire()
+        return 1
+
+    def distances(self):
+        """
+        Return the last distance (cm) of every sensor, in order.
+        """
+        return [s.filteredCm() for s in self.sensors]
+
+    def rates(self):
+        """
+        Return (per_sensor, total) readings per second since resetStats().
+        """
+        elapsed = time.ticks_diff(time.ticks_ms(), self._since)
+        if elapsed <= 0:
+            return [0] * len(self.sensors), 0
+        per = [(s.reading_count - self._start[i]) * 1000 / elapsed
+               for i, s in enumerate(self.sensors)]
+        return per, sum(per)
+
+    def resetStats(self):
+        """
+        Restart the readings-per-second counters.
         """
-        self._interval = ms
\ No newline at end of file
+        self._since = time.ticks_ms()
+        self._start = [s.reading_count for s in self.sensors]
+        self._before = [0] * len(self.sensors)
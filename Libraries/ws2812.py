@@ -0,0 +1,247 @@
+import time
+
+from Libraries.RGBLED import RGBLED
+
+class PIOBackend:
+    """
+    Sends a GRB frame buffer to a WS2812 strip with an RP2040 PIO state
+    machine. Each byte is pushed as one word; the PIO shifts out 8 bits
+    per pull, so the buffer is sent as-is without conversion.
+    """
+
+    def __init__(self, pin, sm_id=0, freq=8_000_000):
+        import rp2
+        from machine import Pin
+
+        @rp2.asm_pio(sideset_init=rp2.PIO.OUT_LOW, out_shiftdir=rp2.PIO.SHIFT_LEFT,
+                     autopull=True, pull_thresh=8)
+        def ws2812():
+            T1 = 2
+            T2 = 5
+            T3 = 3
+            wrap_target()
+            label("bitloop")
+            out(x, 1)               .side(0)    [T3 - 1]
+            jmp(not_x, "do_zero")   .side(1)    [T1 - 1]
+            jmp("bitloop")          .side(1)    [T2 - 1]
+            label("do_zero")
+            nop()                   .side(0)    [T2 - 1]
+            wrap()
+
+        self.sm = rp2.StateMachine(sm_id, ws2812, freq=freq, sideset_base=Pin(pin))
+        self.sm.active(1)
+
+    def write(self, buf):
+        self.sm.put(buf, 24)  # byte -> top of the 32-bit word
+
+
+class RecordingBackend:
+    """
+    Stand-in backend that records what would be sent, for tests and
+    benchmarks on a host.
+    """
+
+    def __init__(self):
+        self.frames = 0
+        self.bytes = 0
+        self.last = bytearray()
+
+    def write(self, buf):
+        self.frames += 1
+        self.bytes += len(buf)
+        if len(self.last) != len(buf):
+            self.last = bytearray(len(buf))
+        self.last[:] = buf
+
+
+class WS2812Strip:
+    """
+    Addressable LED strip (WS2812 / NeoPixel) with the RGBLED colour API
+    per pixel, on top of a packed GRB frame buffer.
+    Changes are collected in the buffer and sent by show() only when
+    something changed.
+    """
+
+    FADE_INTERVAL = RGBLED.FADE_INTERVAL
+
+    # Share colour names and the parsed-colour cache with RGBLED
+    NAMED_COLOURS = RGBLED.NAMED_COLOURS
+    CACHE_SIZE = RGBLED.CACHE_SIZE
+    _colourCache = RGBLED._colourCache
+    _resolve = RGBLED._resolve
+
+    def __init__(self, count, backend):
+        """
+        Initialize the strip.
+
+        Args:
+            count (int): Number of pixels.
+            backend: Object with write(buf), e.g. PIOBackend(pin) on the
+                Pico or RecordingBackend() on a host.
+        """
+        self.count = count
+        self.backend = backend
+        self.buf = bytearray(3 * count)      # G, R, B per pixel
+        self.target = bytearray(3 * count)   # Fade targets, same layout
+        self.dirty = True
+
+        # Fade state: pixels lo..hi (exclusive) may still be fading, each
+        # at its own speed
+        self.speeds = bytearray(count)
+        self._fadeLo = 0
+        self._fadeHi = 0
+        self.lastUpdate = time.ticks_ms()
+
+        # Scheduler task (set by Scheduler.register)
+        self.task = None
+
+    # ------------------- Pixel Access -------------------
+
+    def setColour(self, i, r, g, b):
+        """Set pixel `i` immediately."""
+        j = 3 * i
+        buf = self.buf
+        buf[j] = g
+        buf[j + 1] = r
+        buf[j + 2] = b
+        t = self.target
+        t[j] = g
+        t[j + 1] = r
+        t[j + 2] = b
+        self.dirty = True
+
+    def getColour(self, i):
+        """Return (r, g, b) of pixel `i`."""
+        j = 3 * i
+        return self.buf[j + 1], self.buf[j], self.buf[j + 2]
+
+    def setHex(self, i, hexCode):
+        """Set pixel `i` using HEX code (#RRGGBB)."""
+        if not hexCode.startswith('#'):
+            hexCode = '#' + hexCode
+        self.setColour(i, *self._resolve(hexCode))
+
+    def setNamedColour(self, i, name):
+        """Set pixel `i` using predefined name."""
+        if name.lower() not in self.NAMED_COLOURS:
+            raise ValueError(f"Unknown colour name: {name}")
+        self.setColour(i, *self._resolve(name))
+
+    # ------------------- Bulk Operations -------------------
+
+    def setRange(self, start, end, r, g, b):
+        """
+        Set pixels start..end-1 to one colour. The first pixel is written
+        and then copied by doubling, so cost grows with log(n) slices.
+        """
+        start = max(0, start)
+        end = min(self.count, end)
+        if end <= start:
+            return
+        for buf in (self.buf, self.target):
+            mv = memoryview(buf)
+            j = 3 * start
+            stop = 3 * end
+            buf[j] = g
+            buf[j + 1] = r
+            buf[j + 2] = b
+            done = 3
+            while j + done < stop:
+                n = min(done, stop - j - done)
+                mv[j + done:j + done + n] = mv[j:j + n]
+                done += n
+        self.dirty = True
+
+    def fill(self, r, g, b):
+        """Set every pixel to one colour."""
+        self.setRange(0, self.count, r, g, b)
+
+    def off(self):
+        self.fill(0, 0, 0)
+
+    # ------------------- Fading -------------------
+
+    def fadeTo(self, i, r, g, b, speed=5):
+        """
+        Non-blocking fade of pixel `i` to a new colour.
+        Speed = how much the value changes per update (1–255).
+        """
+        self.fadeRange(i, i + 1, r, g, b, speed)
+
+    def fadeRange(self, start, end, r, g, b, speed=5):
+        """
+        Non-blocking fade of pixels start..end-1 to one colour.
+        """
+        start = max(0, start)
+        end = min(self.count, end)
+        if end <= start:
+            return
+        t = self.target
+        for j in range(3 * start, 3 * end, 3):
+            t[j] = g
+            t[j + 1] = r
+            t[j + 2] = b
+        speed = max(1, min(speed, 255))
+        speeds = self.speeds
+        for i in range(start, end):
+            speeds[i] = speed
+        if self._fadeHi <= self._fadeLo:
+            self._fadeLo, self._fadeHi = start, end
+        else:
+            self._fadeLo = min(self._fadeLo, start)
+            self._fadeHi = max(self._fadeHi, end)
+        if self.task:
+            self.task.wake()
+
+    # ------------------- Output -------------------
+
+    def show(self):
+        """
+        Send the frame buffer if it changed since the last show().
+        Returns True if a frame was sent.
+        """
+        if not self.dirty:
+            return False
+        self.backend.write(self.buf)
+        self.dirty = False
+        return True
+
+    def update(self):
+        """Call this repeatedly in your main loop to handle fades."""
+        now = time.ticks_ms()
+        if time.ticks_diff(now, self.lastUpdate) < self.FADE_INTERVAL:
+            return
+        self.lastUpdate = now
+        self.tick()
+
+    def tick(self):
+        """
+        Advance running fades by one step and send the frame if needed.
+        Returns ms until the next step, or None once all fades are done.
+        """
+        lo, hi = self._fadeLo, self._fadeHi
+        if hi > lo:
+            buf, t, speeds = self.buf, self.target, self.speeds
+            busy = False
+            i = lo
+            left = 0   # channels left at the current pixel's speed
+            for j in range(3 * lo, 3 * hi):
+                if not left:
+                    step = speeds[i]
+                    i += 1
+                    left = 3
+                left -= 1
+                c = buf[j]
+                d = t[j]
+                if c < d:
+                    buf[j] = d if c + step > d else c + step
+                    busy = True
+                elif c > d:
+                    buf[j] = d if c - step < d else c - step
+                    busy = True
+            if busy:
+                self.dirty = True
+            else:
+                self._fadeLo = self._fadeHi = 0
+        self.show()
+        return self.FADE_INTERVAL if self._fadeHi > self._fadeLo else None
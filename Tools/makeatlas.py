@@ -0,0 +1,134 @@
+# Host-side sprite atlas builder for Libraries/OLED/sprites.py.
+# Packs PBM (P1/P4) images, and PNG/other images if Pillow is installed,
+# into one MONO_VLSB atlas file that the Pico loads without decoding.
+#
+# Usage (from the repository root, on a PC):
+#   python Tools/makeatlas.py icons.atlas Examples/OLED/icons/*.pbm
+#   python Tools/makeatlas.py --threshold 100 --invert logo.atlas logo.png
+#
+# Sprite names are the file names without extension.
+#
+# Atlas layout (little-endian):
+#   b'SA1', sprite count (uint16)
+#   per sprite: name length (uint8), name (ASCII), width (uint16),
+#               height (uint16), data offset from file start (uint32)
+#   sprite data: per sprite, ceil(height / 8) pages of `width` bytes,
+#               bit 0 of each byte = top pixel (framebuf.MONO_VLSB)
+
+import argparse
+import os
+import struct
+
+
+def readPbm(path):
+    """
+    Read a P1 (ASCII) or P4 (binary) PBM.
+    Returns (width, height, rows) with rows[y][x] = 1 for black (ink).
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    # Header tokens, skipping comments
+    tokens = []
+    pos = 0
+    while len(tokens) < 3:
+        while data[pos:pos + 1].isspace():
+            pos += 1
+        if data[pos:pos + 1] == b'#':
+            while data[pos:pos + 1] not in (b'\n', b''):
+                pos += 1
+            continue
+        start = pos
+        while not data[pos:pos + 1].isspace():
+            pos += 1
+        tokens.append(data[start:pos])
+    magic, width, height = tokens[0], int(tokens[1]), int(tokens[2])
+
+    if magic == b'P4':
+        pos += 1  # single whitespace before the raster
+        stride = (width + 7) // 8
+        rows = []
+        for y in range(height):
+            line = data[pos + y * stride:pos + (y + 1) * stride]
+            rows.append([(line[x >> 3] >> (7 - (x & 7))) & 1 for x in range(width)])
+        return width, height, rows
+    if magic == b'P1':
+        bits = [int(c) for c in data[pos:].decode('ascii') if c in '01']
+        return width, height, [bits[y * width:(y + 1) * width] for y in range(height)]
+    raise ValueError("%s: not a PBM (P1/P4) file" % path)
+
+
+def readImage(path, threshold=128):
+    """
+    Read any image Pillow can open; pixels darker than `threshold` are ink.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        raise SystemExit("%s: install Pillow to convert non-PBM images" % path)
+    img = Image.open(path).convert('L')
+    width, height = img.size
+    px = img.load()
+    rows = [[1 if px[x, y] < threshold else 0 for x in range(width)] for y in range(height)]
+    return width, height, rows
+
+
+def toVlsb(width, height, rows):
+    """
+    Convert rows[y][x] bits to MONO_VLSB bytes (stride = width).
+    """
+    out = bytearray(((height + 7) // 8) * width)
+    for y in range(height):
+        base = (y >> 3) * width
+        bit = 1 << (y & 7)
+        for x in range(width):
+            if rows[y][x]:
+                out[base + x] |= bit
+    return out
+
+
+def pack(sprites):
+    """
+    Build the atlas file contents from (name, width, height, rows).
+    """
+    index = bytearray(b'SA1' + struct.pack('<H', len(sprites)))
+    header_size = len(index) + sum(1 + len(s[0].encode('ascii')) + 8 for s in sprites)
+    data = bytearray()
+    for name, width, height, rows in sprites:
+        raw = name.encode('ascii')
+        if len(raw) > 255:
+            raise ValueError("sprite name too long: %s" % name)
+        index += struct.pack('<B', len(raw)) + raw
+        index += struct.pack('<HHI', width, height, header_size + len(data))
+        data += toVlsb(width, height, rows)
+    return bytes(index + data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack images into a MONO_VLSB sprite atlas.")
+    parser.add_argument('output', help="atlas file to write")
+    parser.add_argument('images', nargs='+', help="PBM files, or PNG etc. with Pillow")
+    parser.add_argument('--threshold', type=int, default=128,
+                        help="grey level below which a pixel is ink (non-PBM)")
+    parser.add_argument('--invert', action='store_true', help="swap ink and background")
+    args = parser.parse_args()
+
+    sprites = []
+    for path in args.images:
+        name = os.path.splitext(os.path.basename(path))[0]
+        if path.lower().endswith('.pbm'):
+            width, height, rows = readPbm(path)
+        else:
+            width, height, rows = readImage(path, args.threshold)
+        if args.invert:
+            rows = [[1 - b for b in row] for row in rows]
+        sprites.append((name, width, height, rows))
+
+    blob = pack(sprites)
+    with open(args.output, 'wb') as f:
+        f.write(blob)
+    print("%d sprites, %d bytes -> %s" % (len(sprites), len(blob), args.output))
+
+
+if __name__ == '__main__':
+    main()
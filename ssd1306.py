@@ -2,6 +2,7 @@
 
 from micropython import const
 import framebuf
+import time
 
 
 # register definitions
@@ -33,11 +34,40 @@ class SSD1306(framebuf.FrameBuffer):
         self.external_vcc = external_vcc
         self.pages = self.height // 8
         self.buffer = bytearray(self.pages * self.width)
+        # Copy of what the panel currently shows; show() sends only the
+        # page segments where buffer and shadow differ
+        self.shadow = bytearray(len(self.buffer))
+        self.full_refresh = True
+        # Preallocated command streams for contrast/rotate and show() windows
+        self.cmd2 = bytearray(2)
+        self.win = bytearray((SET_COL_ADDR, 0, 0, SET_PAGE_ADDR, 0, 0))
+        # Bytes and bus transactions (I2C transfers / SPI CS assertions),
+        # total and for the last show()
+        self.tx_bytes = 0
+        self.last_tx_bytes = 0
+        self.transactions = 0
+        self.last_transactions = 0
+        # Incremental refresh (show_async): snapshot being sent, position
+        # within it, bytes per tick and frame-rate cap
+        self.front = None
+        self.sending = False
+        self.chunk = 128
+        self.frame_ms = 0
+        self.frame_start = time.ticks_ms()
+        self.frames = 0
+        self.skipped = 0
+        self._page = 0
+        self._col = 0
+        self._force = False
+        self._start_bytes = 0
+        self._start_tr = 0
+        # Scheduler task (set by Scheduler.register)
+        self.task = None
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
         self.init_display()
 
     def init_display(self):
-        for cmd in (
+        self.write_cmds(bytes((
             SET_DISP,  # display off
             # address setting
             SET_MEM_ADDR,
@@ -70,10 +100,9 @@ class SSD1306(framebuf.FrameBuffer):
             SET_CHARGE_PUMP,
             0x10 if self.external_vcc else 0x14,
             SET_DISP | 0x01,  # display on
-        ):  # on
-            self.write_cmd(cmd)
+        )))
         self.fill(0)
-        self.show()
+        self.show(full=True)
 
     def poweroff(self):
         self.write_cmd(SET_DISP)
@@ -82,31 +111,158 @@ class SSD1306(framebuf.FrameBuffer):
         self.write_cmd(SET_DISP | 0x01)
 
     def contrast(self, contrast):
-        self.write_cmd(SET_CONTRAST)
-        self.write_cmd(contrast)
+        self.cmd2[0] = SET_CONTRAST
+        self.cmd2[1] = contrast
+        self.write_cmds(self.cmd2)
 
     def invert(self, invert):
         self.write_cmd(SET_NORM_INV | (invert & 1))
 
+    def start_line(self, line):
+        # RAM row shown at the top of the panel (vertical rotation)
+        self.write_cmd(SET_DISP_START_LINE | (line % self.height))
+
     def rotate(self, rotate):
-        self.write_cmd(SET_COM_OUT_DIR | ((rotate & 1) << 3))
-        self.write_cmd(SET_SEG_REMAP | (rotate & 1))
+        self.cmd2[0] = SET_COM_OUT_DIR | ((rotate & 1) << 3)
+        self.cmd2[1] = SET_SEG_REMAP | (rotate & 1)
+        self.write_cmds(self.cmd2)
+        # segment remap only applies to data written afterwards
+        self.full_refresh = True
 
-    def show(self):
-        x0 = 0
-        x1 = self.width - 1
+    def write_window(self, x0, x1, p0, p1, buf):
+        # send buf to columns x0..x1 of pages p0..p1
         if self.width != 128:
             # narrow displays use centred columns
             col_offset = (128 - self.width) // 2
             x0 += col_offset
             x1 += col_offset
-        self.write_cmd(SET_COL_ADDR)
-        self.write_cmd(x0)
-        self.write_cmd(x1)
-        self.write_cmd(SET_PAGE_ADDR)
-        self.write_cmd(0)
-        self.write_cmd(self.pages - 1)
-        self.write_data(self.buffer)
+        win = self.win
+        win[1] = x0
+        win[2] = x1
+        win[4] = p0
+        win[5] = p1
+        self.write_block(win, buf)
+
+    def write_block(self, cmds, buf):
+        # command stream followed by data
+        self.write_cmds(cmds)
+        self.write_data(buf)
+
+    def show(self, full=False):
+        # Send what changed since the last show(), page by page, each with
+        # a column window trimmed to the changed span. full=True (or a
+        # pending full_refresh) resends the whole buffer.
+        # Returns the number of bytes put on the bus.
+        start = self.tx_bytes
+        start_tr = self.transactions
+        buf = self.buffer
+        shadow = self.shadow
+        if full or self.full_refresh:
+            self.write_window(0, self.width - 1, 0, self.pages - 1, buf)
+            shadow[:] = buf
+            self.full_refresh = False
+        else:
+            w = self.width
+            mv = memoryview(buf)
+            for page in range(self.pages):
+                a = page * w
+                b = a + w
+                # scan in place; slicing would copy both rows every frame
+                lo = a
+                while lo < b and buf[lo] == shadow[lo]:
+                    lo += 1
+                if lo == b:
+                    continue
+                hi = b - 1
+                while buf[hi] == shadow[hi]:
+                    hi -= 1
+                self.write_window(lo - a, hi - a, page, page, mv[lo:hi + 1])
+                shadow[lo:hi + 1] = mv[lo:hi + 1]
+        self.last_tx_bytes = self.tx_bytes - start
+        self.last_transactions = self.transactions - start_tr
+        # the panel now matches buffer; drop any frame still being sent
+        self.sending = False
+        return self.last_tx_bytes
+
+    # ------------------- Incremental refresh -------------------
+
+    def set_async(self, chunk=128, max_fps=None):
+        # chunk: most bytes sent per tick(); max_fps: cap on show_async()
+        self.chunk = max(1, chunk)
+        self.frame_ms = 1000 // max_fps if max_fps else 0
+
+    def show_async(self):
+        # Snapshot buffer and send it over the following tick() calls, so
+        # drawing the next frame can start at once. Returns False (and
+        # sends nothing) while the previous frame is still going out or
+        # the frame-rate cap has not elapsed.
+        now = time.ticks_ms()
+        if self.sending or time.ticks_diff(now, self.frame_start) < self.frame_ms:
+            self.skipped += 1
+            return False
+        if self.front is None:
+            self.front = bytearray(len(self.buffer))
+        self.front[:] = self.buffer
+        self.frame_start = now
+        self._page = 0
+        self._col = 0
+        self._force = self.full_refresh
+        self.full_refresh = False
+        self._start_bytes = self.tx_bytes
+        self._start_tr = self.transactions
+        self.sending = True
+        if self.task:
+            self.task.wake()
+        return True
+
+    def done(self):
+        return not self.sending
+
+    def update(self):
+        # Call repeatedly in the main loop; sends one chunk per call
+        if self.sending:
+            self.tick()
+
+    def tick(self):
+        # Send the next changed segment of the snapshot, at most `chunk`
+        # bytes. Returns ms until the next step, or None when the frame
+        # is complete.
+        if not self.sending:
+            return None
+        front = self.front
+        shadow = self.shadow
+        w = self.width
+        while self._page < self.pages:
+            page = self._page
+            a = page * w
+            b = a + w
+            lo = a + self._col
+            hi = b - 1
+            if not self._force:
+                while lo < b and front[lo] == shadow[lo]:
+                    lo += 1
+                if lo < b:
+                    while front[hi] == shadow[hi]:
+                        hi -= 1
+            if lo >= b:
+                self._page += 1
+                self._col = 0
+                continue
+            end = min(hi + 1, lo + self.chunk)
+            mv = memoryview(front)
+            self.write_window(lo - a, end - 1 - a, page, page, mv[lo:end])
+            shadow[lo:end] = mv[lo:end]
+            if end > hi:
+                self._page += 1
+                self._col = 0
+            else:
+                self._col = end - a
+            return 1
+        self.sending = False
+        self.frames += 1
+        self.last_tx_bytes = self.tx_bytes - self._start_bytes
+        self.last_transactions = self.transactions - self._start_tr
+        return None
 
 
 class SSD1306_I2C(SSD1306):
@@ -115,20 +271,35 @@ class SSD1306_I2C(SSD1306):
         self.addr = addr
         self.temp = bytearray(2)
         self.write_list = [b"\x40", None]  # Co=0, D/C#=1
+        self.cmd_list = [b"\x00", None]  # Co=0, D/C#=0
         super().__init__(width, height, external_vcc)
 
     def write_cmd(self, cmd):
         self.temp[0] = 0x80  # Co=1, D/C#=0
         self.temp[1] = cmd
         self.i2c.writeto(self.addr, self.temp)
+        self.tx_bytes += 2
+        self.transactions += 1
+
+    def write_cmds(self, cmds):
+        # all command bytes in one transaction after a single control byte
+        self.cmd_list[1] = cmds
+        self.i2c.writevto(self.addr, self.cmd_list)
+        self.tx_bytes += len(cmds) + 1
+        self.transactions += 1
 
     def write_data(self, buf):
         self.write_list[1] = buf
         self.i2c.writevto(self.addr, self.write_list)
+        self.tx_bytes += len(buf) + 1
+        self.transactions += 1
 
 
 class SSD1306_SPI(SSD1306):
-    def __init__(self, width, height, spi, dc, res, cs, external_vcc=False):
+    # The bus is configured once here. Pass shared_bus=True if other
+    # devices on the same SPI bus change its settings; it is then
+    # reconfigured once per transaction.
+    def __init__(self, width, height, spi, dc, res, cs, external_vcc=False, shared_bus=False):
         self.rate = 10 * 1024 * 1024
         dc.init(dc.OUT, value=0)
         res.init(res.OUT, value=0)
@@ -137,6 +308,9 @@ class SSD1306_SPI(SSD1306):
         self.dc = dc
         self.res = res
         self.cs = cs
+        self.shared_bus = shared_bus
+        self.temp = bytearray(1)
+        spi.init(baudrate=self.rate, polarity=0, phase=0)
         import time
 
         self.res(1)
@@ -147,17 +321,41 @@ class SSD1306_SPI(SSD1306):
         super().__init__(width, height, external_vcc)
 
     def write_cmd(self, cmd):
-        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+        self.temp[0] = cmd
+        self.write_cmds(self.temp)
+
+    def write_cmds(self, cmds):
+        if self.shared_bus:
+            self.spi.init(baudrate=self.rate, polarity=0, phase=0)
         self.cs(1)
         self.dc(0)
         self.cs(0)
-        self.spi.write(bytearray([cmd]))
+        self.spi.write(cmds)
         self.cs(1)
+        self.tx_bytes += len(cmds)
+        self.transactions += 1
 
     def write_data(self, buf):
-        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+        if self.shared_bus:
+            self.spi.init(baudrate=self.rate, polarity=0, phase=0)
         self.cs(1)
         self.dc(1)
         self.cs(0)
         self.spi.write(buf)
-        self.cs(1)
\ No newline at end of file
+        self.cs(1)
+        self.tx_bytes += len(buf)
+        self.transactions += 1
+
+    def write_block(self, cmds, buf):
+        # commands and data under one CS assertion
+        if self.shared_bus:
+            self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+        self.cs(1)
+        self.dc(0)
+        self.cs(0)
+        self.spi.write(cmds)
+        self.dc(1)
+        self.spi.write(buf)
+        self.cs(1)
+        self.tx_bytes += len(cmds) + len(buf)
+        self.transactions += 1
\ No newline at end of file